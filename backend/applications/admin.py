@@ -1,5 +1,5 @@
 from django.contrib import admin
-from .models import Application, ApplicationScore, ResultNotificationSettings
+from .models import Application, ApplicationScore, ApplicationScoreSummary, ResultNotificationSettings
 
 
 @admin.register(Application)
@@ -14,10 +14,34 @@ class ApplicationScoreAdmin(admin.ModelAdmin):
     list_display = ["id", "application", "reviewer", "kind", "total", "created_at"]
     list_filter = ["kind"]
 
+    # ✅ 관리자 화면에서 점수를 고쳐도 집계(ApplicationScoreSummary)가 맞도록 갱신
+    def save_model(self, request, obj, form, change):
+        super().save_model(request, obj, form, change)
+        ApplicationScoreSummary.refresh(obj.application_id)
+
+    def delete_model(self, request, obj):
+        app_id = obj.application_id
+        super().delete_model(request, obj)
+        ApplicationScoreSummary.refresh(app_id)
+
+    def delete_queryset(self, request, queryset):
+        app_ids = set(queryset.values_list("application_id", flat=True))
+        super().delete_queryset(request, queryset)
+        for app_id in app_ids:
+            ApplicationScoreSummary.refresh(app_id)
+
+
+@admin.register(ApplicationScoreSummary)
+class ApplicationScoreSummaryAdmin(admin.ModelAdmin):
+    list_display = ["application", "doc_avg", "interview_avg", "total_avg", "doc_count", "interview_count", "updated_at"]
+    readonly_fields = ApplicationScoreSummary.AGGREGATE_FIELDS + ["updated_at"]
+
 
 @admin.register(ResultNotificationSettings)
 class ResultNotificationSettingsAdmin(admin.ModelAdmin):
-    list_display = ["id", "interview_location", "interview_date", "ot_datetime", "updated_at", "updated_by"]
+    list_display = ["id", "interview_location", "interview_date", "ot_datetime", "version", "updated_at", "updated_by"]
+    # 저장 시 model.save()에서 version이 증가 → 각 워커의 캐시가 갱신됨
+    readonly_fields = ["version"]
     
     def has_add_permission(self, request):
         # 싱글톤이므로 추가 불가
@@ -0,0 +1,133 @@
+"""
+지원자 목록 엑셀(xlsx) 내보내기
+
+- openpyxl write-only 모드로 행을 하나씩 흘려 쓰므로 워크북 전체를 메모리에 올리지 않음
+- queryset은 .iterator(chunk_size=...)로 나눠 읽음
+- 결과는 임시 파일에 저장 → FileResponse가 블록 단위로 전송 (BytesIO 복사 없음)
+"""
+import tempfile
+
+import openpyxl
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.styles import Font, PatternFill, Alignment
+
+XLSX_CONTENT_TYPE = "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+
+EXPORT_CHUNK_SIZE = 200
+
+TRACK_LABEL = {
+    "PLANNING_DESIGN": "기획/디자인",
+    "FRONTEND": "프론트엔드",
+    "BACKEND": "백엔드",
+    "AI_SERVER": "AI",
+}
+STATUS_LABEL = {
+    "DRAFT": "작성중",
+    "SUBMITTED": "제출완료",
+    "ACCEPTED": "합격",
+    "REJECTED": "불합격",
+}
+DECISION_LABEL = {
+    "PENDING": "미확정",
+    "ACCEPTED": "확정 합격",
+    "REJECTED": "확정 불합격",
+}
+
+HEADERS = [
+    "순번", "이름", "학번", "학과", "연락처", "이메일",
+    "지원 트랙", "상태", "제출일시",
+    "서류 결과", "최종 결과",
+    "서류 평균", "면접 평균", "총점 평균",
+    "서류 채점수", "면접 채점수",
+    "포트폴리오 URL",
+    "자기소개 및 지원동기", "열정/성장 경험", "활동 계획 및 각오", "팀 협업 경험",
+    "기획/디자인 경험", "사회 문제 해결 아이디어",
+    "프로그래밍 학습 경험", "AI 서비스 인상",
+    "웹 동작 원리", "코드 품질 기준",
+    "UI/UX 개선 아이디어", "디자인 구현 우선순위",
+]
+
+# 지원서 답변 컬럼 (HEADERS의 "포트폴리오 URL" 이후 순서와 동일)
+ANSWER_FIELDS = [
+    "portfolio_url",
+    "motivation", "common_growth_experience", "common_time_management", "common_teamwork",
+    "planning_experience", "planning_idea",
+    "ai_programming_level", "ai_service_impression",
+    "backend_web_process", "backend_code_quality",
+    "frontend_ui_experience", "frontend_design_implementation",
+]
+
+HEADER_FILL = PatternFill(fill_type="solid", fgColor="17538D")
+HEADER_FONT = Font(bold=True, color="FFFFFF")
+HEADER_ALIGN = Alignment(horizontal="center", vertical="center")
+DATA_ALIGN = Alignment(vertical="top", wrap_text=True)
+
+
+def _fmt(v):
+    if v is None:
+        return ""
+    return round(float(v), 1)
+
+
+def applicant_row(seq, app):
+    """지원서 1건 → 엑셀 한 행 (값 리스트)"""
+    u = app.user
+    submitted = app.submitted_at.strftime("%Y-%m-%d %H:%M") if app.submitted_at else ""
+
+    row = [
+        seq,
+        u.name,
+        u.student_id,
+        u.department,
+        u.phone,
+        u.email,
+        TRACK_LABEL.get(app.track, app.track),
+        STATUS_LABEL.get(app.status, app.status),
+        submitted,
+        DECISION_LABEL.get(getattr(app, "doc_decision", None) or "PENDING", "미확정"),
+        DECISION_LABEL.get(getattr(app, "final_decision", None) or "PENDING", "미확정"),
+        _fmt(app.doc_avg),
+        _fmt(app.interview_avg),
+        _fmt(app.total_avg),
+        app.doc_count or 0,
+        app.interview_count or 0,
+    ]
+    row.extend(getattr(app, f) or "" for f in ANSWER_FIELDS)
+    return row
+
+
+def write_applicants_xlsx(qs, fileobj, chunk_size=EXPORT_CHUNK_SIZE):
+    """
+    qs(with_score_summary 적용된 Application queryset)를 fileobj에 xlsx로 기록
+    - 메모리 사용량은 지원자 수와 무관하게 거의 일정
+    """
+    wb = openpyxl.Workbook(write_only=True)
+    ws = wb.create_sheet(title="지원자 목록")
+    ws.row_dimensions[1].height = 20
+
+    header = []
+    for h in HEADERS:
+        cell = WriteOnlyCell(ws, value=h)
+        cell.fill = HEADER_FILL
+        cell.font = HEADER_FONT
+        cell.alignment = HEADER_ALIGN
+        header.append(cell)
+    ws.append(header)
+
+    for seq, app in enumerate(qs.iterator(chunk_size=chunk_size), start=1):
+        cells = []
+        for val in applicant_row(seq, app):
+            cell = WriteOnlyCell(ws, value=val)
+            cell.alignment = DATA_ALIGN
+            cells.append(cell)
+        ws.append(cells)
+
+    wb.save(fileobj)
+
+
+def export_applicants_to_tempfile(qs, chunk_size=EXPORT_CHUNK_SIZE):
+    """xlsx를 임시 파일에 기록하고 처음 위치로 되감아 반환 (close 시 자동 삭제)"""
+    tmp = tempfile.TemporaryFile(suffix=".xlsx")
+    write_applicants_xlsx(qs, tmp, chunk_size=chunk_size)
+    tmp.seek(0)
+    return tmp
@@ -0,0 +1,62 @@
+import math
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+
+from applications.models import Application, ApplicationScoreSummary
+
+BATCH_SIZE = 500
+
+
+def _same(a, b):
+    if a is None or b is None:
+        return a is None and b is None
+    return math.isclose(a, b, rel_tol=1e-9, abs_tol=1e-9)
+
+
+class Command(BaseCommand):
+    help = "ApplicationScoreSummary(지원서별 점수 집계)를 ApplicationScore 기준으로 재계산하고 검증합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--check",
+            action="store_true",
+            help="재계산 없이 저장된 집계만 검증 (불일치가 있으면 exit code 1)",
+        )
+
+    def handle(self, *args, **options):
+        check_only = options["check"]
+        app_ids = list(Application.objects.order_by("id").values_list("id", flat=True))
+
+        batches = [app_ids[i:i + BATCH_SIZE] for i in range(0, len(app_ids), BATCH_SIZE)]
+
+        if not check_only:
+            with transaction.atomic():
+                for batch in batches:
+                    ApplicationScoreSummary.refresh_many(batch)
+            self.stdout.write(f"rebuilt {len(app_ids)} summaries")
+
+        stored = {s.application_id: s for s in ApplicationScoreSummary.objects.all()}
+        expected_by_app = {}
+        for batch in batches:
+            expected_by_app.update(ApplicationScoreSummary.compute_many(batch))
+
+        mismatches = []
+        for app_id in app_ids:
+            expected = expected_by_app[app_id]
+            summary = stored.get(app_id)
+            if summary is None:
+                # 채점 기록이 없으면 summary 행이 없어도 정상
+                if expected["doc_count"] or expected["interview_count"]:
+                    mismatches.append((app_id, "missing"))
+                continue
+            for field in ApplicationScoreSummary.AGGREGATE_FIELDS:
+                if not _same(getattr(summary, field), expected[field]):
+                    mismatches.append((app_id, f"{field}: stored={getattr(summary, field)} expected={expected[field]}"))
+
+        for app_id, detail in mismatches:
+            self.stderr.write(f"application {app_id}: {detail}")
+
+        if mismatches:
+            raise CommandError(f"{len(mismatches)} mismatched summaries (run without --check to rebuild)")
+        self.stdout.write(self.style.SUCCESS(f"verified {len(app_ids)} applications"))
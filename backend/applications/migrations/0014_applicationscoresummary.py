@@ -0,0 +1,65 @@
+# Generated by Django 4.2.27 on 2026-10-17 17:41
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+def backfill_summaries(apps, schema_editor):
+    ApplicationScore = apps.get_model("applications", "ApplicationScore")
+    ApplicationScoreSummary = apps.get_model("applications", "ApplicationScoreSummary")
+
+    aggregates = {}
+    for kind, prefix in (("DOC", "doc"), ("INTERVIEW", "interview")):
+        f = models.Q(kind=kind)
+        aggregates[f"{prefix}_s1"] = models.Avg("score1", filter=f)
+        aggregates[f"{prefix}_s2"] = models.Avg("score2", filter=f)
+        aggregates[f"{prefix}_s3"] = models.Avg("score3", filter=f)
+        aggregates[f"{prefix}_count"] = models.Count("id", filter=f)
+
+    rows = (
+        ApplicationScore.objects
+        .values("application_id")
+        .annotate(**aggregates)
+        .order_by()
+    )
+
+    summaries = []
+    for row in rows:
+        values = {}
+        for prefix in ("doc", "interview"):
+            count = row[f"{prefix}_count"]
+            values[f"{prefix}_count"] = count
+            values[f"{prefix}_avg"] = (
+                float(row[f"{prefix}_s1"] + row[f"{prefix}_s2"] + row[f"{prefix}_s3"]) if count else None
+            )
+        if values["doc_avg"] is not None and values["interview_avg"] is not None:
+            values["total_avg"] = (values["doc_avg"] + values["interview_avg"]) / 2.0
+        summaries.append(ApplicationScoreSummary(application_id=row["application_id"], **values))
+
+    ApplicationScoreSummary.objects.bulk_create(summaries, batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('applications', '0013_resultnotificationsettings_track_ai_server_open_and_more'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ApplicationScoreSummary',
+            fields=[
+                ('application', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='score_summary', serialize=False, to='applications.application')),
+                ('doc_avg', models.FloatField(blank=True, null=True)),
+                ('interview_avg', models.FloatField(blank=True, null=True)),
+                ('total_avg', models.FloatField(blank=True, null=True)),
+                ('doc_count', models.PositiveIntegerField(default=0)),
+                ('interview_count', models.PositiveIntegerField(default=0)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'indexes': [models.Index(fields=['total_avg'], name='application_total_a_6297d2_idx')],
+            },
+        ),
+        migrations.RunPython(backfill_summaries, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,70 @@
+from django.db import migrations
+
+# applications/search.py의 SEARCH_COLUMNS와 같은 순서
+USER_COLUMNS = ["email", "name", "student_id"]
+ANSWER_COLUMNS = [
+    "one_liner",
+    "motivation", "common_growth_experience", "common_time_management", "common_teamwork",
+    "planning_experience", "planning_idea",
+    "ai_programming_level", "ai_service_impression",
+    "backend_web_process", "backend_code_quality",
+    "frontend_ui_experience", "frontend_design_implementation",
+    "experience",
+]
+
+COLUMNS = ", ".join(USER_COLUMNS + ANSWER_COLUMNS)
+USER_SELECT = ", ".join(f"u.{c}" for c in USER_COLUMNS)
+
+
+def _insert_row(prefix):
+    answers = ", ".join(f"{prefix}.{c}" for c in ANSWER_COLUMNS)
+    return (
+        f"INSERT INTO applications_search(rowid, {COLUMNS}) "
+        f"SELECT {prefix}.id, {USER_SELECT}, {answers} FROM users_user u WHERE u.id = {prefix}.user_id;"
+    )
+
+
+FORWARD_SQL = [
+    f"CREATE VIRTUAL TABLE applications_search USING fts5({COLUMNS}, tokenize='trigram');",
+
+    # 기존 데이터 색인
+    f"INSERT INTO applications_search(rowid, {COLUMNS}) "
+    f"SELECT a.id, {USER_SELECT}, {', '.join(f'a.{c}' for c in ANSWER_COLUMNS)} "
+    f"FROM applications_application a JOIN users_user u ON u.id = a.user_id;",
+
+    f"CREATE TRIGGER applications_search_ai AFTER INSERT ON applications_application BEGIN "
+    f"{_insert_row('NEW')} END;",
+
+    # 답변/지원자 변경 시에만 재색인 (status, updated_at 등만 바뀌는 UPDATE는 무시)
+    f"CREATE TRIGGER applications_search_au AFTER UPDATE OF user_id, {', '.join(ANSWER_COLUMNS)} "
+    f"ON applications_application BEGIN "
+    f"DELETE FROM applications_search WHERE rowid = OLD.id; "
+    f"{_insert_row('NEW')} END;",
+
+    "CREATE TRIGGER applications_search_ad AFTER DELETE ON applications_application BEGIN "
+    "DELETE FROM applications_search WHERE rowid = OLD.id; END;",
+
+    "CREATE TRIGGER applications_search_user_au AFTER UPDATE OF email, name, student_id ON users_user BEGIN "
+    "UPDATE applications_search SET email = NEW.email, name = NEW.name, student_id = NEW.student_id "
+    "WHERE rowid IN (SELECT id FROM applications_application WHERE user_id = NEW.id); END;",
+]
+
+REVERSE_SQL = [
+    "DROP TRIGGER IF EXISTS applications_search_user_au;",
+    "DROP TRIGGER IF EXISTS applications_search_ad;",
+    "DROP TRIGGER IF EXISTS applications_search_au;",
+    "DROP TRIGGER IF EXISTS applications_search_ai;",
+    "DROP TABLE IF EXISTS applications_search;",
+]
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("users", "0008_migrate_to_fullstack"),
+        ("applications", "0014_applicationscoresummary"),
+    ]
+
+    operations = [
+        migrations.RunSQL(FORWARD_SQL, REVERSE_SQL),
+    ]
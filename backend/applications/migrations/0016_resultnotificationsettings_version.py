@@ -0,0 +1,18 @@
+# Generated by Django 4.2.27 on 2026-10-17 17:55
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('applications', '0015_application_search'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='resultnotificationsettings',
+            name='version',
+            field=models.PositiveIntegerField(default=0, editable=False, verbose_name='버전'),
+        ),
+    ]
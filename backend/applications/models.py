@@ -1,7 +1,11 @@
+import time
+
 from django.db import models
 from django.conf import settings
 from django.utils import timezone
 
+from config.versioning import bump_version
+
 
 class Application(models.Model):
     STATUS_CHOICES = [
@@ -25,6 +29,9 @@ class Application(models.Model):
         ("REJECTED", "불합격 확정"),
     ]
 
+    # ✅ 지원 트랙 → 교육 트랙 (FRONTEND/BACKEND 지원 트랙은 FULLSTACK 교육 트랙으로 통합)
+    EDUCATION_TRACK_MAP = {"FRONTEND": "FULLSTACK", "BACKEND": "FULLSTACK"}
+
     user = models.ForeignKey(
         settings.AUTH_USER_MODEL,
         on_delete=models.CASCADE,
@@ -112,6 +119,9 @@ class Application(models.Model):
         self.finalized_at = timezone.now()
         return True
 
+    def to_education_track(self):
+        return self.EDUCATION_TRACK_MAP.get(self.track, self.track)
+
     def __str__(self):
         return f"{self.user.email} - {self.status}"
 
@@ -149,6 +159,105 @@ class ApplicationScore(models.Model):
         return f"{self.application_id} {self.kind} by {self.reviewer_id}"
 
 
+class ApplicationScoreSummary(models.Model):
+    """
+    지원서별 점수 집계(비정규화)
+    - 관리자 목록/정렬/엑셀에서 ApplicationScore 전체를 매번 GROUP BY 하지 않도록 저장해 둠
+    - ApplicationScore 저장/삭제 시 refresh()로 같은 트랜잭션 안에서 갱신
+    """
+    AGGREGATE_FIELDS = ["doc_avg", "interview_avg", "total_avg", "doc_count", "interview_count"]
+
+    application = models.OneToOneField(
+        Application,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name="score_summary",
+    )
+
+    doc_avg = models.FloatField(null=True, blank=True)
+    interview_avg = models.FloatField(null=True, blank=True)
+    # (doc_avg + interview_avg) / 2 — 둘 다 있을 때만
+    total_avg = models.FloatField(null=True, blank=True)
+
+    doc_count = models.PositiveIntegerField(default=0)
+    interview_count = models.PositiveIntegerField(default=0)
+
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["total_avg"]),
+        ]
+
+    @staticmethod
+    def compute_many(application_ids):
+        """ApplicationScore에서 집계값을 직접 계산 ({application_id: dict}, GROUP BY 한 번)"""
+        aggregates = {}
+        for kind, prefix in (("DOC", "doc"), ("INTERVIEW", "interview")):
+            f = models.Q(kind=kind)
+            aggregates[f"{prefix}_s1"] = models.Avg("score1", filter=f)
+            aggregates[f"{prefix}_s2"] = models.Avg("score2", filter=f)
+            aggregates[f"{prefix}_s3"] = models.Avg("score3", filter=f)
+            aggregates[f"{prefix}_count"] = models.Count("id", filter=f)
+
+        rows = (
+            ApplicationScore.objects
+            .filter(application_id__in=application_ids)
+            .values("application_id")
+            .annotate(**aggregates)
+            .order_by()
+        )
+        by_app = {row["application_id"]: row for row in rows}
+
+        result = {}
+        for app_id in application_ids:
+            row = by_app.get(app_id, {})
+            values = {}
+            for prefix in ("doc", "interview"):
+                count = row.get(f"{prefix}_count", 0)
+                values[f"{prefix}_count"] = count
+                values[f"{prefix}_avg"] = (
+                    float(row[f"{prefix}_s1"] + row[f"{prefix}_s2"] + row[f"{prefix}_s3"]) if count else None
+                )
+
+            if values["doc_avg"] is not None and values["interview_avg"] is not None:
+                values["total_avg"] = (values["doc_avg"] + values["interview_avg"]) / 2.0
+            else:
+                values["total_avg"] = None
+            result[app_id] = values
+        return result
+
+    @classmethod
+    def compute(cls, application_id):
+        """ApplicationScore에서 집계값을 직접 계산 (dict 반환)"""
+        return cls.compute_many([application_id])[application_id]
+
+    @classmethod
+    def refresh(cls, application_id):
+        """해당 지원서의 집계를 다시 계산해 저장"""
+        obj, _ = cls.objects.update_or_create(
+            application_id=application_id,
+            defaults=cls.compute(application_id),
+        )
+        return obj
+
+    @classmethod
+    def refresh_many(cls, application_ids):
+        """여러 지원서의 집계를 한 번에 재계산해 upsert (집계 1쿼리 + upsert)"""
+        application_ids = list(set(application_ids))
+        computed = cls.compute_many(application_ids)
+        cls.objects.bulk_create(
+            [cls(application_id=app_id, **values) for app_id, values in computed.items()],
+            update_conflicts=True,
+            unique_fields=["application"],
+            update_fields=cls.AGGREGATE_FIELDS + ["updated_at"],
+            batch_size=500,
+        )
+
+    def __str__(self):
+        return f"{self.application_id} summary (total={self.total_avg})"
+
+
 class ResultNotificationSettings(models.Model):
     """
     합격/불합격 알림에 표시되는 면접 및 OT 정보를 관리하는 싱글톤 모델
@@ -187,6 +296,9 @@ class ResultNotificationSettings(models.Model):
     track_backend_open = models.BooleanField(default=True, verbose_name="백엔드 트랙 지원 활성화")
     track_ai_server_open = models.BooleanField(default=True, verbose_name="AI 트랙 지원 활성화")
 
+    # 저장할 때마다 1씩 증가 → 워커별 캐시(cached())가 변경 여부를 판단하는 기준
+    version = models.PositiveIntegerField(default=0, editable=False, verbose_name="버전")
+
     updated_at = models.DateTimeField(auto_now=True)
     updated_by = models.ForeignKey(
         settings.AUTH_USER_MODEL,
@@ -197,6 +309,12 @@ class ResultNotificationSettings(models.Model):
         verbose_name="수정자"
     )
 
+    # 같은 워커 안에서 버전 확인 쿼리를 생략하는 간격(초)
+    VERSION_CHECK_INTERVAL = 1.0
+
+    # ✅ 프로세스(gunicorn 워커)별 캐시: {"obj": 설정 인스턴스, "checked_at": 마지막 버전 확인 시각}
+    _cache = {}
+
     class Meta:
         verbose_name = "합격 알림 설정"
         verbose_name_plural = "합격 알림 설정"
@@ -205,6 +323,10 @@ class ResultNotificationSettings(models.Model):
         # 싱글톤 패턴: 항상 ID=1인 레코드만 사용
         self.pk = 1
         super().save(*args, **kwargs)
+        # 관리자 화면/API 어느 쪽에서 저장해도 버전 증가
+        bump_version(type(self).objects.filter(pk=1))
+        self.refresh_from_db(fields=["version"])
+        type(self)._cache.clear()
 
     @classmethod
     def get_settings(cls):
@@ -212,5 +334,25 @@ class ResultNotificationSettings(models.Model):
         obj, created = cls.objects.get_or_create(pk=1)
         return obj
 
+    @classmethod
+    def cached(cls):
+        """
+        ✅ 읽기 전용 경로용 설정 (워커별 캐시)
+        - VERSION_CHECK_INTERVAL 안에서는 쿼리 없음, 이후에는 version 컬럼만 조회
+        - 다른 워커에서 저장해 version이 바뀌었을 때만 행 전체를 다시 읽음
+        - 반환된 인스턴스는 워커 안에서 공유되므로 수정/저장하지 말 것 (수정은 get_settings())
+        """
+        entry = cls._cache
+        now = time.monotonic()
+        obj = entry.get("obj")
+        if obj is not None and now - entry["checked_at"] < cls.VERSION_CHECK_INTERVAL:
+            return obj
+
+        version = cls.objects.filter(pk=1).values_list("version", flat=True).first()
+        if obj is None or version != obj.version:
+            obj = cls.get_settings()
+        cls._cache.update(obj=obj, checked_at=now)
+        return obj
+
     def __str__(self):
         return "합격 알림 설정"
\ No newline at end of file
@@ -0,0 +1,155 @@
+import base64
+import json
+from datetime import datetime
+
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.db.models import F, Q
+from rest_framework.exceptions import NotFound
+from rest_framework.response import Response
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+
+class KeysetPagination:
+    """
+    ✅ 키셋(커서) 페이지네이션
+    - OFFSET 없이 "마지막으로 본 행의 정렬 키" 다음부터 가져오므로 깊은 페이지도 일정한 속도
+    - keys: [(field, descending, nullable), ...]  마지막 키는 반드시 유일해야 함(보통 id)
+    - 커서는 정렬 키 값 + 방향을 base64로 감싼 불투명 문자열
+    - 전체 개수(COUNT)는 ?with_count=true 일 때만 계산 (캐시하지 않음: 워커마다 다른 값이 보이지 않도록)
+    """
+    page_size = 20
+    page_size_query_param = "page_size"
+    max_page_size = 100
+    cursor_query_param = "cursor"
+    count_query_param = "with_count"
+    invalid_cursor_message = "Invalid cursor"
+
+    def __init__(self, keys):
+        self.keys = keys
+
+    # ── 커서 인코딩 ─────────────────────────
+    def encode_cursor(self, values, reverse=False):
+        raw = [v.isoformat() if isinstance(v, datetime) else v for v in values]
+        payload = json.dumps({"k": raw, "r": int(reverse)}, separators=(",", ":"))
+        return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+    def decode_cursor(self, cursor):
+        try:
+            padded = cursor + "=" * (-len(cursor) % 4)
+            data = json.loads(base64.urlsafe_b64decode(padded.encode()).decode())
+            values, reverse = data["k"], bool(data["r"])
+        except (TypeError, ValueError, KeyError):
+            raise NotFound(self.invalid_cursor_message)
+        if not isinstance(values, list) or len(values) != len(self.keys):
+            raise NotFound(self.invalid_cursor_message)
+        # 정렬 키 값은 스칼라(또는 NULL)만 — 변조된 커서의 객체/배열 값은 거부
+        if not all(v is None or isinstance(v, (str, int, float)) for v in values):
+            raise NotFound(self.invalid_cursor_message)
+        return values, reverse
+
+    # ── 정렬/조건 ──────────────────────────
+    def _keys(self, reverse):
+        """(field, descending, nulls_last) 목록 — NULL은 정방향에서 항상 맨 뒤"""
+        return [
+            (field, desc != reverse, (not reverse) if nullable else None)
+            for field, desc, nullable in self.keys
+        ]
+
+    def _ordering(self, reverse):
+        ordering = []
+        for field, desc, nulls_last in self._keys(reverse):
+            expr = F(field).desc if desc else F(field).asc
+            if nulls_last is None:
+                ordering.append(expr())
+            else:
+                ordering.append(expr(nulls_last=True) if nulls_last else expr(nulls_first=True))
+        return ordering
+
+    def _after(self, keys, values):
+        """정렬 순서상 values 바로 뒤에 오는 행들의 조건"""
+        (field, desc, nulls_last), rest = keys[0], keys[1:]
+        value = values[0]
+        tail = self._after(rest, values[1:]) if rest else None
+
+        if value is None:
+            same = Q(**{f"{field}__isnull": True})
+            if nulls_last:
+                # NULL 그룹이 맨 뒤: 같은 NULL 그룹 안에서 다음 키로만 진행
+                return same & tail if tail is not None else Q(pk__in=[])
+            # NULL 그룹이 맨 앞: 값이 있는 행은 모두 뒤에 옴
+            later = Q(**{f"{field}__isnull": False})
+            return later | (same & tail) if tail is not None else later
+
+        later = Q(**{f"{field}__{'lt' if desc else 'gt'}": value})
+        if nulls_last:
+            later |= Q(**{f"{field}__isnull": True})
+        if tail is None:
+            return later
+        return later | (Q(**{field: value}) & tail)
+
+    # ── 페이지 처리 ─────────────────────────
+    def get_page_size(self, request):
+        try:
+            size = int(request.query_params.get(self.page_size_query_param, self.page_size))
+        except (TypeError, ValueError):
+            return self.page_size
+        return max(1, min(size, self.max_page_size))
+
+    def _key_values(self, obj):
+        return [getattr(obj, field) for field, _, _ in self.keys]
+
+    def paginate_queryset(self, queryset, request):
+        self.request = request
+        size = self.get_page_size(request)
+
+        cursor = request.query_params.get(self.cursor_query_param)
+        reverse = False
+        qs = queryset
+        if cursor:
+            values, reverse = self.decode_cursor(cursor)
+            try:
+                # 필드 형식에 맞지 않는 값(날짜가 아닌 문자열 등)은 조건을 만들 때 오류
+                qs = qs.filter(self._after(self._keys(reverse), values))
+            except (TypeError, ValueError, DjangoValidationError):
+                raise NotFound(self.invalid_cursor_message)
+        has_cursor = bool(cursor)
+
+        rows = list(qs.order_by(*self._ordering(reverse))[: size + 1])
+        has_more = len(rows) > size
+        rows = rows[:size]
+        if reverse:
+            rows.reverse()
+
+        # 정방향: has_more → 다음 페이지 존재 / 역방향: has_more → 이전 페이지 존재
+        has_next = has_more if not reverse else has_cursor
+        has_previous = has_cursor if not reverse else has_more
+
+        self.next_cursor = self.encode_cursor(self._key_values(rows[-1])) if rows and has_next else None
+        self.previous_cursor = (
+            self.encode_cursor(self._key_values(rows[0]), reverse=True) if rows and has_previous else None
+        )
+
+        self.count = None
+        if request.query_params.get(self.count_query_param) == "true":
+            self.count = self.get_count(queryset)
+        return rows
+
+    def get_count(self, queryset):
+        return queryset.order_by().count()
+
+    def _link(self, cursor):
+        if cursor is None:
+            return None
+        url = self.request.build_absolute_uri()
+        url = remove_query_param(url, "page")
+        return replace_query_param(url, self.cursor_query_param, cursor)
+
+    def get_paginated_response(self, data):
+        body = {
+            "next": self._link(self.next_cursor),
+            "previous": self._link(self.previous_cursor),
+        }
+        if self.count is not None:
+            body["count"] = self.count
+        body["results"] = data
+        return Response(body)
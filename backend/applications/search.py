@@ -0,0 +1,114 @@
+"""
+지원자 전문 검색 (SQLite FTS5, trigram 토크나이저)
+
+- applications_search 가상 테이블: rowid = Application.id
+  사용자 식별 정보(이메일/이름/학번) + 지원서 답변 텍스트를 색인
+- 색인은 DB 트리거로 유지 (migrations/0015_application_search.py)
+  → Application에 답변 필드를 추가하면 SEARCH_COLUMNS와 트리거도 함께 갱신해야 함
+- trigram은 한국어처럼 띄어쓰기 단위가 짧은 텍스트도 부분 일치 검색 가능
+  단, 3글자 미만 단어는 앞뒤 단어와 묶어 구로 검색하고, 검색어 전체가 3글자 미만이면 instr() 부분 일치로 대체
+"""
+import html
+
+from django.db import connection
+from django.db.models.expressions import RawSQL
+
+SEARCH_TABLE = "applications_search"
+
+USER_COLUMNS = ["email", "name", "student_id"]
+ANSWER_COLUMNS = [
+    "one_liner",
+    "motivation", "common_growth_experience", "common_time_management", "common_teamwork",
+    "planning_experience", "planning_idea",
+    "ai_programming_level", "ai_service_impression",
+    "backend_web_process", "backend_code_quality",
+    "frontend_ui_experience", "frontend_design_implementation",
+    "experience",
+]
+SEARCH_COLUMNS = USER_COLUMNS + ANSWER_COLUMNS
+
+MIN_TRIGRAM_LENGTH = 3
+SNIPPET_TOKENS = 16
+# 발췌문은 HTML 이스케이프 후 <mark>로 바꾸기 위해 본문에 없을 제어문자로 먼저 표시
+_MARK_OPEN, _MARK_CLOSE = "\x02", "\x03"
+
+
+class SearchQuery:
+    """검색어 문자열 → FTS5 MATCH 식 + 짧은 검색어 목록"""
+
+    def __init__(self, q):
+        # 3글자 미만 단어(예: "동작 원리")는 인접 단어와 묶어 구(phrase)로 검색
+        phrases, buf = [], []
+        for term in (q or "").split():
+            buf.append(term)
+            if len(" ".join(buf)) >= MIN_TRIGRAM_LENGTH:
+                phrases.append(" ".join(buf))
+                buf = []
+        if buf and phrases:
+            phrases[-1] += " " + " ".join(buf)
+            buf = []
+
+        self.short_terms = [" ".join(buf)] if buf else []
+        # 구를 큰따옴표로 감싸 FTS 문법 문자(*, :, - 등)를 그대로 검색
+        self.match = " AND ".join('"' + p.replace('"', '""') + '"' for p in phrases) or None
+
+    def __bool__(self):
+        return bool(self.match or self.short_terms)
+
+    def where_sql(self):
+        """검색 테이블에서 일치하는 rowid를 고르는 WHERE 절 + 파라미터"""
+        clauses, params = [], []
+        if self.match:
+            clauses.append(f"{SEARCH_TABLE} MATCH %s")
+            params.append(self.match)
+        for term in self.short_terms:
+            clauses.append(
+                "(" + " OR ".join(f"instr(lower({c}), lower(%s)) > 0" for c in SEARCH_COLUMNS) + ")"
+            )
+            params.extend([term] * len(SEARCH_COLUMNS))
+        return " AND ".join(clauses), params
+
+
+def apply_search(qs, q, with_rank=False):
+    """
+    Application queryset을 검색어로 필터링
+    - with_rank=True: search_rank(bm25, 작을수록 관련도 높음) annotate
+    """
+    sq = SearchQuery(q)
+    if not sq:
+        return qs
+
+    where, params = sq.where_sql()
+    qs = qs.filter(id__in=RawSQL(f"SELECT rowid FROM {SEARCH_TABLE} WHERE {where}", params))
+
+    if with_rank and sq.match:
+        qs = qs.annotate(search_rank=RawSQL(
+            f"SELECT rank FROM {SEARCH_TABLE} "
+            f"WHERE {SEARCH_TABLE} MATCH %s AND rowid = applications_application.id",
+            [sq.match],
+        ))
+    return qs
+
+
+def search_snippets(app_ids, q):
+    """
+    {application_id: 하이라이트된 발췌문} — 가장 잘 맞는 컬럼에서 <mark>로 표시 (본문은 HTML 이스케이프)
+    (3글자 미만 검색어만 있으면 FTS 일치 정보가 없으므로 빈 dict)
+    """
+    sq = SearchQuery(q)
+    if not sq.match or not app_ids:
+        return {}
+
+    placeholders = ", ".join(["%s"] * len(app_ids))
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"SELECT rowid, snippet({SEARCH_TABLE}, -1, %s, %s, '…', {SNIPPET_TOKENS}) "
+            f"FROM {SEARCH_TABLE} WHERE {SEARCH_TABLE} MATCH %s AND rowid IN ({placeholders})",
+            [_MARK_OPEN, _MARK_CLOSE, sq.match, *app_ids],
+        )
+        rows = cursor.fetchall()
+
+    return {
+        app_id: html.escape(text).replace(_MARK_OPEN, "<mark>").replace(_MARK_CLOSE, "</mark>")
+        for app_id, text in rows
+    }
@@ -67,7 +67,39 @@ class ApplicationScoreSerializer(serializers.ModelSerializer):
         }
 
 
-class AdminApplicationSerializer(serializers.ModelSerializer):
+class DynamicFieldsModelSerializer(serializers.ModelSerializer):
+    """
+    fields=[...] 인자로 출력 필드를 제한하는 ModelSerializer
+    - USER_FIELDS: get_user()가 읽는 User 컬럼 (.only() 계산용)
+    """
+    USER_FIELDS = ["id"]
+
+    def __init__(self, *args, **kwargs):
+        fields = kwargs.pop("fields", None)
+        super().__init__(*args, **kwargs)
+        if fields is not None:
+            for name in set(self.fields) - set(fields):
+                self.fields.pop(name)
+
+    @classmethod
+    def only_fields(cls, fields):
+        """
+        출력 필드 목록 → queryset.only()에 넘길 컬럼 목록
+        (요청하지 않은 긴 답변 텍스트는 SQLite에서 읽지도 않도록)
+        """
+        model_fields = {f.name for f in cls.Meta.model._meta.concrete_fields}
+        only = {"id", "updated_at", "user", "user__id"} | (set(fields) & model_fields)
+        if "user" in fields:
+            only |= {f"user__{f}" for f in cls.USER_FIELDS}
+        return sorted(only)
+
+
+class AdminApplicationSerializer(DynamicFieldsModelSerializer):
+    USER_FIELDS = [
+        "id", "email", "name", "student_id", "department", "phone",
+        "role", "email_verified", "education_track",
+    ]
+
     user = serializers.SerializerMethodField()
 
     # ✅ ListView annotate 값들
@@ -78,6 +110,9 @@ class AdminApplicationSerializer(serializers.ModelSerializer):
     doc_count = serializers.IntegerField(required=False, allow_null=True)
     interview_count = serializers.IntegerField(required=False, allow_null=True)
 
+    # ✅ 검색 시 하이라이트 발췌문 (ListView에서 q가 있을 때만)
+    search_snippet = serializers.CharField(required=False, read_only=True)
+
     # ✅ 점수 목록
     doc_scores = serializers.SerializerMethodField()
     interview_scores = serializers.SerializerMethodField()
@@ -113,6 +148,7 @@ class AdminApplicationSerializer(serializers.ModelSerializer):
             "doc_count", "interview_count",
 
             "doc_scores", "interview_scores",
+            "search_snippet",
             "user",
         ]
 
@@ -145,6 +181,46 @@ class AdminApplicationSerializer(serializers.ModelSerializer):
         return ApplicationScoreSerializer(iv, many=True).data
 
 
+class AdminApplicationSummarySerializer(DynamicFieldsModelSerializer):
+    """
+    ✅ 목록용 경량 표현 (view=summary)
+    - 식별 정보/트랙/상태/평균만 — 답변 텍스트와 채점 상세는 AdminApplicationDetailView에서
+    """
+    USER_FIELDS = ["id", "email", "name", "student_id"]
+
+    user = serializers.SerializerMethodField()
+
+    doc_avg = serializers.FloatField(required=False, allow_null=True)
+    interview_avg = serializers.FloatField(required=False, allow_null=True)
+    total_avg = serializers.FloatField(required=False, allow_null=True)
+
+    doc_count = serializers.IntegerField(required=False, allow_null=True)
+    interview_count = serializers.IntegerField(required=False, allow_null=True)
+
+    search_snippet = serializers.CharField(required=False, read_only=True)
+
+    class Meta:
+        model = Application
+        fields = [
+            "id", "status", "submitted_at", "track",
+            "doc_decision", "final_decision",
+            "doc_avg", "interview_avg", "total_avg",
+            "doc_count", "interview_count",
+            "created_at", "updated_at",
+            "search_snippet",
+            "user",
+        ]
+
+    def get_user(self, obj):
+        u = obj.user
+        return {
+            "id": u.id,
+            "email": u.email,
+            "name": u.name,
+            "student_id": u.student_id,
+        }
+
+
 class AdminApplicationStatusUpdateSerializer(serializers.ModelSerializer):
     class Meta:
         model = Application
@@ -176,11 +252,63 @@ class ApplicationScoreUpsertSerializer(serializers.Serializer):
         return attrs
 
 
+# ✅ 점수 일괄 저장용 (항목별 규칙은 ApplicationScoreUpsertSerializer와 동일)
+class ApplicationScoreBulkItemSerializer(ApplicationScoreUpsertSerializer):
+    app_id = serializers.IntegerField(min_value=1)
+
+
+class ApplicationScoreBulkUpsertSerializer(serializers.Serializer):
+    MAX_ITEMS = 500
+
+    items = serializers.ListField(
+        child=serializers.DictField(),
+        allow_empty=False,
+        max_length=MAX_ITEMS,
+    )
+
+
 # ✅ 서류/최종 확정 요청용
 class AdminDecisionFinalizeSerializer(serializers.Serializer):
     decision = serializers.ChoiceField(choices=["ACCEPTED", "REJECTED"])
 
 
+# ✅ 서류/최종 일괄 확정 요청용
+class AdminBulkFinalizeSerializer(serializers.Serializer):
+    """
+    두 가지 방식 중 하나:
+    - 직접 지정: app_ids + decision
+    - 규칙: top_n({트랙: N}) → 트랙별 rank_by 상위 N명 합격, 나머지는 rest
+    """
+    stage = serializers.ChoiceField(choices=["DOC", "FINAL"])
+    dry_run = serializers.BooleanField(required=False, default=False)
+
+    app_ids = serializers.ListField(child=serializers.IntegerField(min_value=1), required=False, allow_empty=False)
+    decision = serializers.ChoiceField(choices=["ACCEPTED", "REJECTED"], required=False)
+
+    top_n = serializers.DictField(child=serializers.IntegerField(min_value=0), required=False, allow_empty=False)
+    rank_by = serializers.ChoiceField(choices=["doc_avg", "interview_avg", "total_avg"], required=False)
+    rest = serializers.ChoiceField(choices=["REJECTED", "PENDING"], required=False, default="REJECTED")
+
+    def validate_top_n(self, value):
+        tracks = {k for k, _ in Application.TRACK_CHOICES}
+        unknown = set(value) - tracks
+        if unknown:
+            raise serializers.ValidationError(f"unknown tracks: {sorted(unknown)}")
+        return value
+
+    def validate(self, attrs):
+        explicit = "app_ids" in attrs
+        rule = "top_n" in attrs
+        if explicit == rule:
+            raise serializers.ValidationError("provide either app_ids+decision or top_n")
+        if explicit and "decision" not in attrs:
+            raise serializers.ValidationError({"decision": ["This field is required with app_ids."]})
+        if rule and "rank_by" not in attrs:
+            # 서류 단계에는 면접 점수가 없으므로 서류 평균, 최종 단계는 총점 평균
+            attrs["rank_by"] = "doc_avg" if attrs["stage"] == "DOC" else "total_avg"
+        return attrs
+
+
 # ✅ 개별 면접 일정 설정 Serializer
 class PersonalInterviewScheduleSerializer(serializers.Serializer):
     personal_interview_datetime = serializers.CharField(required=False, allow_blank=True, default="")
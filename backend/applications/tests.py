@@ -1,3 +1,55 @@
+import base64
+import json
+
+from django.contrib.auth import get_user_model
 from django.test import TestCase
+from rest_framework.exceptions import NotFound
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+
+from .pagination import KeysetPagination
+
+User = get_user_model()
+
+
+def raw_cursor(values, reverse=0):
+    payload = json.dumps({"k": values, "r": reverse}).encode()
+    return base64.urlsafe_b64encode(payload).decode().rstrip("=")
+
+
+class KeysetPaginationCursorTest(TestCase):
+    """변조된 커서는 500이 아니라 404(Invalid cursor)"""
+
+    KEYS = [("date_joined", True, False), ("id", True, False)]
+
+    @classmethod
+    def setUpTestData(cls):
+        for i in range(3):
+            User.objects.create_user(
+                email=f"u{i}@test.com", password="pw", name=f"u{i}",
+                student_id="20240000", department="컴퓨터공학과",
+            )
+
+    def paginate(self, cursor):
+        request = Request(APIRequestFactory().get("/", {"cursor": cursor, "page_size": 2}))
+        return KeysetPagination(self.KEYS).paginate_queryset(User.objects.all(), request)
+
+    def test_valid_cursor_round_trip(self):
+        paginator = KeysetPagination(self.KEYS)
+        request = Request(APIRequestFactory().get("/", {"page_size": 2}))
+        first = paginator.paginate_queryset(User.objects.all(), request)
+        rest = self.paginate(paginator.next_cursor)
+        self.assertEqual(len(first) + len(rest), 3)
+        self.assertFalse({u.id for u in first} & {u.id for u in rest})
 
-# Create your tests here.
+    def test_tampered_cursors_are_not_found(self):
+        for cursor in (
+            "not-base64!",
+            raw_cursor([{"a": 1}, 1]),
+            raw_cursor([[1], 1]),
+            raw_cursor(["not-a-date", 1]),
+            raw_cursor(["2024-01-01T00:00:00Z", "abc"]),
+            raw_cursor(["2024-01-01T00:00:00Z"]),
+        ):
+            with self.subTest(cursor=cursor), self.assertRaises(NotFound):
+                self.paginate(cursor)
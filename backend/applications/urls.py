@@ -5,8 +5,10 @@ from .views_admin import (
     AdminApplicationDetailView,
     AdminApplicationStatusUpdateView,
     AdminApplicationScoresView,
+    AdminApplicationScoresBulkView,
     AdminApplicationDocFinalizeView,
     AdminApplicationFinalizeView,
+    AdminApplicationBulkFinalizeView,
     AdminResultNotificationSettingsView,
     AdminPersonalInterviewScheduleView,
     AdminApplicationExportView,
@@ -26,10 +28,12 @@ urlpatterns = [
 
     # ✅ 점수 API
     path("admin/<int:app_id>/scores", AdminApplicationScoresView.as_view()),
+    path("admin/scores/bulk", AdminApplicationScoresBulkView.as_view()),
 
     # ✅ 확정 API (서류/최종 분리)
     path("admin/<int:app_id>/doc-finalize", AdminApplicationDocFinalizeView.as_view()),
     path("admin/<int:app_id>/finalize", AdminApplicationFinalizeView.as_view()),
+    path("admin/bulk-finalize", AdminApplicationBulkFinalizeView.as_view()),
 
     # ✅ 개별 면접 일정
     path("admin/<int:app_id>/interview-schedule", AdminPersonalInterviewScheduleView.as_view()),
@@ -39,7 +39,7 @@ class MyResultView(APIView):
         final_decision = _decision_or_pending(app, "final_decision")
 
         # ✅ 데이터베이스에서 설정 가져오기
-        settings = ResultNotificationSettings.get_settings()
+        settings = ResultNotificationSettings.cached()
 
         # ✅ 공개 플래그 미설정 시 PENDING 반환
         effective_doc = doc_decision if settings.doc_result_open else "PENDING"
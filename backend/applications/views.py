@@ -65,7 +65,7 @@ def submit_application(request):
 
     # 트랙 활성화 여부 확인
     track = request.data.get("track")
-    track_settings = ResultNotificationSettings.get_settings()
+    track_settings = ResultNotificationSettings.cached()
     track_field_map = {
         "PLANNING_DESIGN": "track_planning_design_open",
         "FRONTEND": "track_frontend_open",
@@ -5,28 +5,38 @@ from rest_framework.response import Response
 from rest_framework import status as http_status
 from rest_framework.pagination import PageNumberPagination
 
-from django.db.models import Q, Avg, Count, FloatField, F, Case, When, Value
+from django.db.models import F
 from django.db.models.functions import Coalesce
 from django.db import transaction
+from django.utils import timezone
 from django.shortcuts import get_object_or_404
-from django.http import HttpResponse
+from django.http import FileResponse
+from django.contrib.auth import get_user_model
 
-import io
-import openpyxl
-from openpyxl.styles import Font, PatternFill, Alignment
+from config.http_cache import conditional_response
+from sessionsapp.models import AttendanceRecord
 
-from .models import Application, ApplicationScore, ResultNotificationSettings
+from .exports import XLSX_CONTENT_TYPE, export_applicants_to_tempfile
+from .models import Application, ApplicationScore, ApplicationScoreSummary, ResultNotificationSettings
+from .pagination import KeysetPagination
 from .permissions import IsInstructorOrStaff
+from .search import apply_search, search_snippets
 from .serializers import (
     AdminApplicationSerializer,
+    AdminApplicationSummarySerializer,
     AdminApplicationStatusUpdateSerializer,
     ApplicationScoreSerializer,
     ApplicationScoreUpsertSerializer,
+    ApplicationScoreBulkItemSerializer,
+    ApplicationScoreBulkUpsertSerializer,
     AdminDecisionFinalizeSerializer,
+    AdminBulkFinalizeSerializer,
     ResultNotificationSettingsSerializer,
     PersonalInterviewScheduleSerializer,
 )
 
+User = get_user_model()
+
 
 class AdminPagination(PageNumberPagination):
     page_size = 20
@@ -34,78 +44,133 @@ class AdminPagination(PageNumberPagination):
     max_page_size = 100
 
 
+def filter_applications(qs, params, with_rank=False):
+    """✅ 목록/엑셀 공통 필터: status, track, q(전문 검색 — 이메일/이름/학번 + 지원서 답변)"""
+    st = params.get("status")
+    tr = params.get("track")
+    q = params.get("q")
+
+    if st:
+        qs = qs.filter(status=st)
+    if tr:
+        qs = qs.filter(track=tr)
+    if q:
+        qs = apply_search(qs, q, with_rank=with_rank)
+    return qs
+
+
+def with_score_summary(qs):
+    """
+    ✅ 평균/카운트를 ApplicationScoreSummary(저장된 집계)에서 읽어 annotate
+    - 채점 기록이 없는 지원서는 summary 행이 없으므로 평균 None / 카운트 0
+    """
+    return qs.annotate(
+        doc_avg=F("score_summary__doc_avg"),
+        interview_avg=F("score_summary__interview_avg"),
+        total_avg=F("score_summary__total_avg"),
+        doc_count=Coalesce(F("score_summary__doc_count"), 0),
+        interview_count=Coalesce(F("score_summary__interview_count"), 0),
+    )
+
+
+# ✅ 목록 출력 형태 (?view=)
+LIST_VIEW_SERIALIZERS = {
+    "summary": AdminApplicationSummarySerializer,
+    "full": AdminApplicationSerializer,
+}
+
+
+# ✅ 키셋 페이지네이션 정렬 키 (sort 파라미터별)
+KEYSET_KEYS = {
+    "TOTAL_DESC": [("total_avg", True, True), ("id", True, False)],
+    "TOTAL_ASC": [("total_avg", False, True), ("id", False, False)],
+    None: [("updated_at", True, False), ("id", True, False)],
+}
+
+
+def order_by_sort(qs, sort):
+    """✅ 정렬: TOTAL_DESC / TOTAL_ASC (총점 평균, 인덱스 컬럼) / 기본 최신 수정순"""
+    if sort == "TOTAL_DESC":
+        return qs.order_by(F("score_summary__total_avg").desc(nulls_last=True), "-updated_at")
+    if sort == "TOTAL_ASC":
+        return qs.order_by(F("score_summary__total_avg").asc(nulls_last=True), "-updated_at")
+    return qs.order_by("-updated_at")
+
+
 class AdminApplicationListView(APIView):
+    """
+    ✅ 지원자 목록
+    GET /api/applications/admin?status=&track=&q=&sort=TOTAL_DESC|TOTAL_ASC
+    - q: 지원서 답변까지 전문 검색, sort 미지정 시 관련도순 + search_snippet(하이라이트 발췌문)
+    - 커서 방식(기본): ?cursor=<next/previous 링크의 값>&page_size=, 전체 개수는 ?with_count=true
+    - 페이지 번호 방식(호환): ?page=N
+    - view=summary: 목록용 경량 표현(답변/채점 상세 제외), fields=id,track,...: 필요한 필드만
+      (전체 지원서는 AdminApplicationDetailView)
+    """
     permission_classes = [IsInstructorOrStaff]
 
     def get(self, request):
+        # ✅ 출력 형태: view=summary|full(기본) + fields=a,b,c 로 필드 선택
+        view = request.query_params.get("view", "full")
+        serializer_class = LIST_VIEW_SERIALIZERS.get(view)
+        if serializer_class is None:
+            return Response(
+                {"ok": False, "errors": {"view": [f"view must be one of {sorted(LIST_VIEW_SERIALIZERS)}"]}},
+                status=http_status.HTTP_400_BAD_REQUEST,
+            )
+        fields = [f for f in request.query_params.get("fields", "").split(",") if f] or None
+        unknown = set(fields or []) - set(serializer_class.Meta.fields)
+        if unknown:
+            return Response(
+                {"ok": False, "errors": {"fields": [f"unknown fields: {sorted(unknown)}"]}},
+                status=http_status.HTTP_400_BAD_REQUEST,
+            )
+        out_fields = fields or serializer_class.Meta.fields
+        with_scores = bool({"doc_scores", "interview_scores"} & set(out_fields))
+
+        # 출력하지 않는 답변 텍스트는 .only()로 아예 읽지 않음
         qs = (
             Application.objects
             .select_related("user")
-            .prefetch_related("scores__reviewer")
+            .only(*serializer_class.only_fields(out_fields))
             .order_by("-updated_at")
         )
+        if with_scores:
+            qs = qs.prefetch_related("scores__reviewer")
 
-        st = request.query_params.get("status")
-        tr = request.query_params.get("track")
         q = request.query_params.get("q")
-
-        if st:
-            qs = qs.filter(status=st)
-        if tr:
-            qs = qs.filter(track=tr)
-        if q:
-            qs = qs.filter(
-                Q(user__email__icontains=q) |
-                Q(user__name__icontains=q) |
-                Q(user__student_id__icontains=q)
-            )
-
-        # ✅ 평균/카운트 annotate (서류/면접 각각)
-        qs = qs.annotate(
-            doc_avg=Coalesce(
-                Avg("scores__score1", filter=Q(scores__kind="DOC"), output_field=FloatField()) +
-                Avg("scores__score2", filter=Q(scores__kind="DOC"), output_field=FloatField()) +
-                Avg("scores__score3", filter=Q(scores__kind="DOC"), output_field=FloatField()),
-                None
-            ),
-            interview_avg=Coalesce(
-                Avg("scores__score1", filter=Q(scores__kind="INTERVIEW"), output_field=FloatField()) +
-                Avg("scores__score2", filter=Q(scores__kind="INTERVIEW"), output_field=FloatField()) +
-                Avg("scores__score3", filter=Q(scores__kind="INTERVIEW"), output_field=FloatField()),
-                None
-            ),
-            doc_count=Count("scores", filter=Q(scores__kind="DOC"), distinct=True),
-            interview_count=Count("scores", filter=Q(scores__kind="INTERVIEW"), distinct=True),
-        ).annotate(
-            # ✅ 총점 평균: (doc_avg + interview_avg) / 2  (둘 다 있을 때만)
-            total_avg=Case(
-                When(
-                    doc_avg__isnull=False,
-                    interview_avg__isnull=False,
-                    then=(F("doc_avg") + F("interview_avg")) / Value(2.0),
-                ),
-                default=None,
-                output_field=FloatField(),
-            )
-        )
-
-        # ✅ 정렬
         sort = request.query_params.get("sort")
-        if sort == "TOTAL_DESC":
-            qs = qs.order_by(F("total_avg").desc(nulls_last=True), "-updated_at")
-        elif sort == "TOTAL_ASC":
-            qs = qs.order_by(F("total_avg").asc(nulls_last=True), "-updated_at")
+        # ✅ 검색어가 있고 정렬 지정이 없으면 관련도순
+        by_relevance = bool(q) and sort not in ("TOTAL_DESC", "TOTAL_ASC")
+        qs = filter_applications(qs, request.query_params, with_rank=by_relevance)
+
+        qs = with_score_summary(qs)
+        if by_relevance and "search_rank" not in qs.query.annotations:
+            # 3글자 미만 검색어만 있으면 관련도 점수가 없으므로 기본 정렬
+            by_relevance = False
+
+        # ✅ ?page= 를 보내면 기존 페이지 번호 방식, 아니면 커서(키셋) 방식
+        if "page" in request.query_params:
+            paginator = AdminPagination()
+            qs = qs.order_by("search_rank", "-updated_at") if by_relevance else order_by_sort(qs, sort)
         else:
-            qs = qs.order_by("-updated_at")
-
-        paginator = AdminPagination()
+            if by_relevance:
+                keys = [("search_rank", False, True), ("id", True, False)]
+            else:
+                keys = KEYSET_KEYS.get(sort, KEYSET_KEYS[None])
+            paginator = KeysetPagination(keys)
         page = paginator.paginate_queryset(qs, request)
 
-        # SerializerMethodField에서 prefetch된 scores를 빠르게 쓰기 위해 붙여줌
+        snippets = search_snippets([obj.id for obj in page], q) if q else {}
+
         for obj in page:
-            obj._prefetched_scores = list(obj.scores.all())
+            # SerializerMethodField에서 prefetch된 scores를 빠르게 쓰기 위해 붙여줌
+            if with_scores:
+                obj._prefetched_scores = list(obj.scores.all())
+            if q:
+                obj.search_snippet = snippets.get(obj.id)
 
-        ser = AdminApplicationSerializer(page, many=True)
+        ser = serializer_class(page, many=True, fields=fields)
         return paginator.get_paginated_response({
             "ok": True,
             "results": ser.data,
@@ -116,7 +181,7 @@ class AdminApplicationDetailView(APIView):
     permission_classes = [IsInstructorOrStaff]
 
     def get(self, request, app_id: int):
-        app = get_object_or_404(Application.objects.select_related("user"), id=app_id)
+        app = get_object_or_404(with_score_summary(Application.objects.select_related("user")), id=app_id)
         ser = AdminApplicationSerializer(app)
         return Response({"ok": True, "application": ser.data}, status=200)
 
@@ -173,17 +238,20 @@ class AdminApplicationScoresView(APIView):
         data = ser.validated_data
         kind = data["kind"]
 
-        score_obj, created = ApplicationScore.objects.update_or_create(
-            application=app,
-            reviewer=request.user,
-            kind=kind,
-            defaults={
-                "score1": data.get("score1", 0),
-                "score2": data.get("score2", 0),
-                "score3": data.get("score3", 0),
-                "comment": data.get("comment", ""),
-            },
-        )
+        with transaction.atomic():
+            score_obj, created = ApplicationScore.objects.update_or_create(
+                application=app,
+                reviewer=request.user,
+                kind=kind,
+                defaults={
+                    "score1": data.get("score1", 0),
+                    "score2": data.get("score2", 0),
+                    "score3": data.get("score3", 0),
+                    "comment": data.get("comment", ""),
+                },
+            )
+            # ✅ 집계 테이블도 같은 트랜잭션에서 갱신
+            ApplicationScoreSummary.refresh(app.id)
 
         return Response({
             "ok": True,
@@ -192,6 +260,91 @@ class AdminApplicationScoresView(APIView):
         }, status=200)
 
 
+class AdminApplicationScoresBulkView(APIView):
+    """
+    ✅ 점수 일괄 저장 (채점자 본인 점수 Upsert)
+    POST /api/applications/admin/scores/bulk
+    body: { items: [{ app_id, kind, score1, score2, score3, comment }, ...] }  (최대 500건)
+
+    - 모든 항목을 먼저 검증하고, 하나라도 틀리면 아무것도 저장하지 않고 400 + 항목별 오류
+    - 통과하면 한 트랜잭션에서 (application, reviewer, kind) 기준 bulk upsert + 집계 갱신
+    - 응답 results는 요청 items 순서와 동일
+    """
+    permission_classes = [IsInstructorOrStaff]
+
+    def post(self, request):
+        ser = ApplicationScoreBulkUpsertSerializer(data=request.data)
+        if not ser.is_valid():
+            return Response({"ok": False, "errors": ser.errors}, status=http_status.HTTP_400_BAD_REQUEST)
+
+        results = []
+        valid = []
+        for idx, raw in enumerate(ser.validated_data["items"]):
+            item_ser = ApplicationScoreBulkItemSerializer(data=raw)
+            if item_ser.is_valid():
+                valid.append((idx, item_ser.validated_data))
+                results.append({"index": idx, "ok": True})
+            else:
+                results.append({"index": idx, "ok": False, "errors": item_ser.errors})
+
+        app_ids = {data["app_id"] for _, data in valid}
+        existing_apps = set(Application.objects.filter(id__in=app_ids).values_list("id", flat=True))
+        seen = set()
+        for idx, data in valid:
+            key = (data["app_id"], data["kind"])
+            if data["app_id"] not in existing_apps:
+                results[idx] = {"index": idx, "ok": False, "errors": {"app_id": ["application not found"]}}
+            elif key in seen:
+                results[idx] = {"index": idx, "ok": False, "errors": {"non_field_errors": ["duplicate app_id/kind in request"]}}
+            seen.add(key)
+
+        if not all(r["ok"] for r in results):
+            return Response({"ok": False, "results": results}, status=http_status.HTTP_400_BAD_REQUEST)
+
+        with transaction.atomic():
+            existing_keys = set(
+                ApplicationScore.objects
+                .filter(reviewer=request.user, application_id__in=app_ids)
+                .values_list("application_id", "kind")
+            )
+            ApplicationScore.objects.bulk_create(
+                [
+                    ApplicationScore(
+                        application_id=data["app_id"],
+                        reviewer=request.user,
+                        kind=data["kind"],
+                        score1=data.get("score1", 0),
+                        score2=data.get("score2", 0),
+                        score3=data.get("score3", 0),
+                        comment=data.get("comment", ""),
+                    )
+                    for _, data in valid
+                ],
+                update_conflicts=True,
+                unique_fields=["application", "reviewer", "kind"],
+                update_fields=["score1", "score2", "score3", "comment", "updated_at"],
+            )
+            # ✅ 집계 테이블도 같은 트랜잭션에서 갱신
+            ApplicationScoreSummary.refresh_many(app_ids)
+
+        scores = {
+            (s.application_id, s.kind): s
+            for s in ApplicationScore.objects.select_related("reviewer").filter(
+                reviewer=request.user, application_id__in=app_ids
+            )
+        }
+        for idx, data in valid:
+            key = (data["app_id"], data["kind"])
+            results[idx].update({
+                "app_id": data["app_id"],
+                "kind": data["kind"],
+                "created": key not in existing_keys,
+                "score": ApplicationScoreSerializer(scores[key]).data,
+            })
+
+        return Response({"ok": True, "results": results}, status=200)
+
+
 class AdminApplicationDocFinalizeView(APIView):
     """
     ✅ 서류 결과 확정
@@ -254,9 +407,9 @@ class AdminApplicationFinalizeView(APIView):
         if decision == "ACCEPTED":
             u.role = "STUDENT"
             # FRONTEND/BACKEND 지원 트랙은 FULLSTACK 교육 트랙으로 통합
-            track_map = {"FRONTEND": "FULLSTACK", "BACKEND": "FULLSTACK"}
-            u.education_track = track_map.get(app.track, app.track)
+            u.education_track = app.to_education_track()
             u.save(update_fields=["role", "education_track"])
+            AttendanceRecord.enroll_students([u.id])
         else:
             # 불합격이면 role/track은 유지(원하면 APPLICANT로 강제도 가능)
             pass
@@ -265,6 +418,148 @@ class AdminApplicationFinalizeView(APIView):
         return Response({"ok": True, "final_decision": app.final_decision}, status=200)
 
 
+# ✅ 일괄 확정 단계별 (결정 필드, 확정 시각 필드)
+FINALIZE_STAGE_FIELDS = {
+    "DOC": ("doc_decision", "doc_finalized_at"),
+    "FINAL": ("final_decision", "finalized_at"),
+}
+
+
+class AdminApplicationBulkFinalizeView(APIView):
+    """
+    ✅ 서류/최종 결과 일괄 확정
+    POST /api/applications/admin/bulk-finalize
+
+    body (직접 지정):
+      { stage: "DOC" | "FINAL", app_ids: [1, 2, ...], decision: "ACCEPTED" | "REJECTED", dry_run?: bool }
+    body (규칙):
+      { stage, top_n: { "BACKEND": 10, ... }, rank_by?: "doc_avg" | "interview_avg" | "total_avg",
+        rest?: "REJECTED" | "PENDING", dry_run?: bool }
+      - top_n에 적은 트랙만 대상, 트랙별 rank_by 내림차순 상위 N명 합격 (점수 없음은 맨 뒤, 동점은 먼저 지원한 순)
+      - rank_by 기본값: DOC → doc_avg, FINAL → total_avg
+
+    규칙:
+    - 단건 확정과 동일하게 PENDING 상태인 지원서만 확정, FINAL은 서류 합격 확정(ACCEPTED)이 전제
+    - 작성중(DRAFT) 지원서는 제외
+    - dry_run=true면 저장 없이 결과 미리보기만 반환
+    - 적용 시 결정별 UPDATE 1회 + (최종 합격자) 사용자 bulk_update 1회, 하나의 트랜잭션
+    """
+    permission_classes = [IsInstructorOrStaff]
+
+    def post(self, request):
+        ser = AdminBulkFinalizeSerializer(data=request.data)
+        if not ser.is_valid():
+            return Response({"ok": False, "errors": ser.errors}, status=http_status.HTTP_400_BAD_REQUEST)
+        data = ser.validated_data
+        stage = data["stage"]
+        decision_field, finalized_field = FINALIZE_STAGE_FIELDS[stage]
+
+        qs = Application.objects.all()
+        if "app_ids" in data:
+            qs = qs.filter(id__in=data["app_ids"])
+        else:
+            qs = qs.filter(track__in=list(data["top_n"]))
+
+        rank_by = data.get("rank_by")
+        fields = ["id", "track", "status", "doc_decision", "final_decision"]
+        if rank_by:
+            qs = with_score_summary(qs)
+            fields.append(rank_by)
+        rows = list(qs.order_by("id").values(*fields))
+
+        skipped = []
+        eligible = []
+        for row in rows:
+            reason = None
+            if row["status"] == "DRAFT":
+                reason = "not submitted"
+            elif row[decision_field] != "PENDING":
+                reason = f"{decision_field} already finalized"
+            elif stage == "FINAL" and row["doc_decision"] != "ACCEPTED":
+                reason = "finalize requires doc_decision=ACCEPTED"
+            if reason:
+                skipped.append({"app_id": row["id"], "reason": reason})
+            else:
+                eligible.append(row)
+
+        body = {"ok": True, "dry_run": data["dry_run"], "stage": stage}
+
+        if "app_ids" in data:
+            found = {row["id"] for row in rows}
+            skipped.extend({"app_id": i, "reason": "not found"} for i in data["app_ids"] if i not in found)
+            ids = [row["id"] for row in eligible]
+            accepted = ids if data["decision"] == "ACCEPTED" else []
+            rejected = ids if data["decision"] == "REJECTED" else []
+        else:
+            accepted, rejected, tracks = self._rank(eligible, data["top_n"], rank_by, data["rest"])
+            body["rank_by"] = rank_by
+            body["tracks"] = tracks
+
+        body.update({"accepted": accepted, "rejected": rejected, "skipped": skipped})
+
+        if data["dry_run"]:
+            return Response(body, status=200)
+
+        with transaction.atomic():
+            now = timezone.now()
+            updated = 0
+            for decision, ids in (("ACCEPTED", accepted), ("REJECTED", rejected)):
+                if not ids:
+                    continue
+                # PENDING 조건을 UPDATE에 다시 걸어 동시 확정과 겹쳐도 덮어쓰지 않음
+                updated += Application.objects.filter(id__in=ids, **{decision_field: "PENDING"}).update(
+                    **{decision_field: decision, finalized_field: now, "updated_at": now}
+                )
+
+            if stage == "FINAL" and accepted:
+                # ✅ 최종 합격자: user.role = STUDENT, education_track = 교육 트랙
+                # 위 UPDATE로 이번에 실제 합격 처리된 행만 (동시에 다른 관리자가 확정한 지원서 제외)
+                apps = Application.objects.filter(
+                    id__in=accepted, **{decision_field: "ACCEPTED", finalized_field: now}
+                ).select_related("user").only(
+                    "id", "track", "user__id", "user__role", "user__education_track"
+                )
+                users = []
+                for app in apps:
+                    app.user.role = "STUDENT"
+                    app.user.education_track = app.to_education_track()
+                    users.append(app.user)
+                User.objects.bulk_update(users, ["role", "education_track"], batch_size=500)
+                # 이미 만들어진 출석 세션 명단에 추가
+                AttendanceRecord.enroll_students([u.id for u in users])
+
+        body["updated"] = updated
+        return Response(body, status=200)
+
+    @staticmethod
+    def _rank(rows, top_n, rank_by, rest):
+        """트랙별 상위 N명 → (합격 id, 불합격 id, 트랙별 요약)"""
+        by_track = {track: [] for track in top_n}
+        for row in rows:
+            by_track[row["track"]].append(row)
+
+        accepted, rejected, tracks = [], [], {}
+        for track, items in by_track.items():
+            # 점수 내림차순, 점수 없음은 맨 뒤, 동점은 id(먼저 지원) 순
+            items.sort(key=lambda r: (r[rank_by] is None, -(r[rank_by] or 0), r["id"]))
+            n = top_n[track]
+            top, others = items[:n], items[n:]
+            accepted.extend(r["id"] for r in top)
+            if rest == "REJECTED":
+                rejected.extend(r["id"] for r in others)
+
+            cutoff = top[-1][rank_by] if top else None
+            tracks[track] = {
+                "candidates": len(items),
+                "accepted": len(top),
+                "rejected": len(others) if rest == "REJECTED" else 0,
+                "cutoff_score": cutoff,
+                # 커트라인 점수가 합격/불합격에 걸쳐 있으면 수동 확인 필요
+                "tie_at_cutoff": cutoff is not None and bool(others) and others[0][rank_by] == cutoff,
+            }
+        return accepted, rejected, tracks
+
+
 class AdminPersonalInterviewScheduleView(APIView):
     """
     ✅ 개별 면접 일정 설정
@@ -284,11 +579,17 @@ class AdminPersonalInterviewScheduleView(APIView):
         return Response({"ok": True}, status=200)
 
 
+def _track_settings_validators(request):
+    s = ResultNotificationSettings.cached()
+    return f"track-settings-{s.version}", s.updated_at
+
+
+@conditional_response(_track_settings_validators)
 @api_view(["GET"])
 @permission_classes([AllowAny])
 def track_application_settings(request):
-    """공개용: 트랙별 지원 활성화 상태 조회 (인증 불필요)"""
-    s = ResultNotificationSettings.get_settings()
+    """공개용: 트랙별 지원 활성화 상태 조회 (인증 불필요, 설정 버전 기준 ETag)"""
+    s = ResultNotificationSettings.cached()
     return Response({
         "ok": True,
         "tracks": {
@@ -333,6 +634,7 @@ class AdminApplicationExportView(APIView):
     GET /api/applications/admin/export
     - 기존 AdminApplicationListView와 동일한 필터/정렬 적용
     - 페이지네이션 없이 전체 반환
+    - write-only 워크북을 임시 파일에 기록 후 스트리밍 (지원자 수와 무관하게 메모리 일정)
     """
     permission_classes = [IsInstructorOrStaff]
 
@@ -340,160 +642,18 @@ class AdminApplicationExportView(APIView):
         qs = (
             Application.objects
             .select_related("user")
-            .prefetch_related("scores")
             .order_by("-updated_at")
         )
 
-        st = request.query_params.get("status")
-        tr = request.query_params.get("track")
-        q = request.query_params.get("q")
+        qs = filter_applications(qs, request.query_params)
 
-        if st:
-            qs = qs.filter(status=st)
-        if tr:
-            qs = qs.filter(track=tr)
-        if q:
-            qs = qs.filter(
-                Q(user__email__icontains=q) |
-                Q(user__name__icontains=q) |
-                Q(user__student_id__icontains=q)
-            )
+        qs = with_score_summary(qs)
+        qs = order_by_sort(qs, request.query_params.get("sort"))
 
-        qs = qs.annotate(
-            doc_avg=Coalesce(
-                Avg("scores__score1", filter=Q(scores__kind="DOC"), output_field=FloatField()) +
-                Avg("scores__score2", filter=Q(scores__kind="DOC"), output_field=FloatField()) +
-                Avg("scores__score3", filter=Q(scores__kind="DOC"), output_field=FloatField()),
-                None
-            ),
-            interview_avg=Coalesce(
-                Avg("scores__score1", filter=Q(scores__kind="INTERVIEW"), output_field=FloatField()) +
-                Avg("scores__score2", filter=Q(scores__kind="INTERVIEW"), output_field=FloatField()) +
-                Avg("scores__score3", filter=Q(scores__kind="INTERVIEW"), output_field=FloatField()),
-                None
-            ),
-            doc_count=Count("scores", filter=Q(scores__kind="DOC"), distinct=True),
-            interview_count=Count("scores", filter=Q(scores__kind="INTERVIEW"), distinct=True),
-        ).annotate(
-            total_avg=Case(
-                When(
-                    doc_avg__isnull=False,
-                    interview_avg__isnull=False,
-                    then=(F("doc_avg") + F("interview_avg")) / Value(2.0),
-                ),
-                default=None,
-                output_field=FloatField(),
-            )
-        )
-
-        sort = request.query_params.get("sort")
-        if sort == "TOTAL_DESC":
-            qs = qs.order_by(F("total_avg").desc(nulls_last=True), "-updated_at")
-        elif sort == "TOTAL_ASC":
-            qs = qs.order_by(F("total_avg").asc(nulls_last=True), "-updated_at")
-
-        TRACK_LABEL = {
-            "PLANNING_DESIGN": "기획/디자인",
-            "FRONTEND": "프론트엔드",
-            "BACKEND": "백엔드",
-            "AI_SERVER": "AI",
-        }
-        STATUS_LABEL = {
-            "DRAFT": "작성중",
-            "SUBMITTED": "제출완료",
-            "ACCEPTED": "합격",
-            "REJECTED": "불합격",
-        }
-        DECISION_LABEL = {
-            "PENDING": "미확정",
-            "ACCEPTED": "확정 합격",
-            "REJECTED": "확정 불합격",
-        }
-
-        wb = openpyxl.Workbook()
-        ws = wb.active
-        ws.title = "지원자 목록"
-
-        headers = [
-            "순번", "이름", "학번", "학과", "연락처", "이메일",
-            "지원 트랙", "상태", "제출일시",
-            "서류 결과", "최종 결과",
-            "서류 평균", "면접 평균", "총점 평균",
-            "서류 채점수", "면접 채점수",
-            "포트폴리오 URL",
-            "자기소개 및 지원동기", "열정/성장 경험", "활동 계획 및 각오", "팀 협업 경험",
-            "기획/디자인 경험", "사회 문제 해결 아이디어",
-            "프로그래밍 학습 경험", "AI 서비스 인상",
-            "웹 동작 원리", "코드 품질 기준",
-            "UI/UX 개선 아이디어", "디자인 구현 우선순위",
-        ]
-
-        header_fill = PatternFill(fill_type="solid", fgColor="17538D")
-        header_font = Font(bold=True, color="FFFFFF")
-        header_align = Alignment(horizontal="center", vertical="center")
-
-        for col_idx, h in enumerate(headers, start=1):
-            cell = ws.cell(row=1, column=col_idx, value=h)
-            cell.fill = header_fill
-            cell.font = header_font
-            cell.alignment = header_align
-
-        ws.row_dimensions[1].height = 20
-
-        data_align = Alignment(vertical="top", wrap_text=True)
-
-        def fmt(v):
-            if v is None:
-                return ""
-            return round(float(v), 1)
-
-        for row_idx, app in enumerate(qs, start=2):
-            u = app.user
-            submitted = app.submitted_at.strftime("%Y-%m-%d %H:%M") if app.submitted_at else ""
-
-            row = [
-                row_idx - 1,
-                u.name,
-                u.student_id,
-                u.department,
-                u.phone,
-                u.email,
-                TRACK_LABEL.get(app.track, app.track),
-                STATUS_LABEL.get(app.status, app.status),
-                submitted,
-                DECISION_LABEL.get(getattr(app, "doc_decision", None) or "PENDING", "미확정"),
-                DECISION_LABEL.get(getattr(app, "final_decision", None) or "PENDING", "미확정"),
-                fmt(app.doc_avg),
-                fmt(app.interview_avg),
-                fmt(app.total_avg),
-                app.doc_count or 0,
-                app.interview_count or 0,
-                app.portfolio_url or "",
-                app.motivation or "",
-                app.common_growth_experience or "",
-                app.common_time_management or "",
-                app.common_teamwork or "",
-                app.planning_experience or "",
-                app.planning_idea or "",
-                app.ai_programming_level or "",
-                app.ai_service_impression or "",
-                app.backend_web_process or "",
-                app.backend_code_quality or "",
-                app.frontend_ui_experience or "",
-                app.frontend_design_implementation or "",
-            ]
-
-            for col_idx, val in enumerate(row, start=1):
-                cell = ws.cell(row=row_idx, column=col_idx, value=val)
-                cell.alignment = data_align
-
-        buf = io.BytesIO()
-        wb.save(buf)
-        buf.seek(0)
-
-        response = HttpResponse(
-            buf.read(),
-            content_type="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
-        )
-        response["Content-Disposition"] = 'attachment; filename="applicants.xlsx"'
-        return response
\ No newline at end of file
+        tmp = export_applicants_to_tempfile(qs)
+        return FileResponse(
+            tmp,
+            as_attachment=True,
+            filename="applicants.xlsx",
+            content_type=XLSX_CONTENT_TYPE,
+        )
\ No newline at end of file
@@ -0,0 +1,31 @@
+"""
+벤치마크 공통 준비: 임시 SQLite DB로 Django를 띄우고 마이그레이션 적용
+
+실행 중인 서비스 DB(db.sqlite3)를 건드리지 않도록 항상 임시 디렉터리에 DB를 만든다.
+"""
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+
+
+def setup_django(db_path=None, migrate=True):
+    if str(BACKEND_DIR) not in sys.path:
+        sys.path.insert(0, str(BACKEND_DIR))
+
+    if db_path is None:
+        db_path = Path(tempfile.mkdtemp(prefix="likelion-bench-")) / "bench.sqlite3"
+
+    os.environ["DB_PATH"] = str(db_path)
+    os.environ.setdefault("DEBUG", "true")
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings")
+
+    import django
+    from django.core.management import call_command
+
+    django.setup()
+    if migrate:
+        call_command("migrate", verbosity=0)
+    return db_path
@@ -0,0 +1,135 @@
+"""
+지원자 엑셀 내보내기 메모리 벤치마크
+
+    python benchmarks/bench_export.py                 # 1k / 5k / 10k 지원자
+    python benchmarks/bench_export.py --sizes 2000 20000
+
+지원자 수를 늘려가며 write_applicants_xlsx()의 Python 힙 최대 사용량(tracemalloc peak)을 측정한다.
+가장 큰 규모의 peak가 가장 작은 규모 대비 --max-growth 배를 넘으면 실패(exit code 1).
+"""
+import argparse
+import sys
+import time
+import tracemalloc
+
+from _setup import setup_django
+
+ESSAY = "지원 동기와 경험을 자세히 적은 긴 답변입니다. " * 40  # 약 1.2KB / 필드
+
+
+def seed(target):
+    """지원자 수가 target이 될 때까지 합성 데이터 추가"""
+    from django.contrib.auth import get_user_model
+    from applications.models import Application, ApplicationScoreSummary
+
+    User = get_user_model()
+    start = User.objects.count()
+    if start >= target:
+        return
+
+    users = [
+        User(
+            email=f"bench{i}@sch.ac.kr",
+            name=f"지원자{i}",
+            student_id=f"2026{i:05d}",
+            department="컴퓨터소프트웨어공학과",
+            phone="010-0000-0000",
+        )
+        for i in range(start, target)
+    ]
+    User.objects.bulk_create(users, batch_size=1000)
+    users = User.objects.filter(email__startswith="bench").order_by("id")[start:target]
+
+    tracks = ["PLANNING_DESIGN", "FRONTEND", "BACKEND", "AI_SERVER"]
+    essay_fields = {
+        f: ESSAY for f in [
+            "motivation", "common_growth_experience", "common_time_management", "common_teamwork",
+            "planning_experience", "planning_idea", "ai_programming_level", "ai_service_impression",
+            "backend_web_process", "backend_code_quality", "frontend_ui_experience",
+            "frontend_design_implementation",
+        ]
+    }
+    apps = Application.objects.bulk_create(
+        [
+            Application(user=u, status="SUBMITTED", track=tracks[u.id % 4], **essay_fields)
+            for u in users
+        ],
+        batch_size=500,
+    )
+    ApplicationScoreSummary.objects.bulk_create(
+        [
+            ApplicationScoreSummary(
+                application=a, doc_avg=70.0, interview_avg=60.0, total_avg=65.0,
+                doc_count=2, interview_count=1,
+            )
+            for a in apps
+        ],
+        batch_size=1000,
+    )
+
+
+def measure():
+    from applications.exports import write_applicants_xlsx
+    from applications.models import Application
+    from applications.views_admin import with_score_summary, order_by_sort
+
+    qs = order_by_sort(with_score_summary(Application.objects.select_related("user")), "TOTAL_DESC")
+
+    class _Sink:
+        """zip 출력 크기만 세는 파일 객체 (디스크 I/O 제외)"""
+        def __init__(self):
+            self.size = 0
+            self.pos = 0
+
+        def write(self, b):
+            self.size = max(self.size, self.pos + len(b))
+            self.pos += len(b)
+            return len(b)
+
+        def tell(self):
+            return self.pos
+
+        def seek(self, offset, whence=0):
+            self.pos = offset if whence == 0 else (self.pos + offset if whence == 1 else self.size + offset)
+            return self.pos
+
+        def flush(self):
+            pass
+
+    sink = _Sink()
+    tracemalloc.start()
+    t0 = time.perf_counter()
+    write_applicants_xlsx(qs, sink)
+    elapsed = time.perf_counter() - t0
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak, elapsed, sink.size
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 5000, 10000])
+    parser.add_argument("--max-growth", type=float, default=1.5)
+    args = parser.parse_args()
+
+    setup_django()
+
+    results = []
+    print(f"{'applicants':>10} {'peak MiB':>10} {'seconds':>9} {'xlsx MiB':>9}")
+    for n in sorted(args.sizes):
+        seed(n)
+        peak, elapsed, size = measure()
+        results.append((n, peak))
+        print(f"{n:>10} {peak / 2**20:>10.1f} {elapsed:>9.2f} {size / 2**20:>9.1f}")
+
+    (n_small, peak_small), (n_large, peak_large) = results[0], results[-1]
+    growth = peak_large / peak_small
+    print(f"peak growth {n_small} → {n_large}: x{growth:.2f} (limit x{args.max_growth})")
+    if growth > args.max_growth:
+        print("FAIL: export memory grows with applicant count")
+        sys.exit(1)
+    print("OK: export memory is flat")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,336 @@
+"""
+결과 발표일 부하 벤치마크: GET /api/applications/results/my (MyResultView)
+
+    python benchmarks/bench_result_day.py                        # 지원자 1000명, 워커 1/3/6
+    python benchmarks/bench_result_day.py --workers 3 --applicants 3000 --rounds 2
+    python benchmarks/bench_result_day.py --save-baseline         # 현재 결과를 기준값으로 저장
+
+- 임시 SQLite DB에 지원자 N명 + 로그인 세션을 만들고 doc_result_open을 켠 상태에서 시작
+- 워커 = 프로세스 (gunicorn sync 워커와 같은 모델), 각 워커는 실제 WSGI 앱(config.wsgi)을
+  미들웨어 스택 그대로 직접 호출 (소켓/서버 오버헤드 제외)
+- 워커들이 세션을 나눠 맡아 동시에 시작, 각 세션은 --rounds 번 조회
+- 별도 프로세스가 --admin-writes 회/초로 합격 알림 설정을 저장 (캐시 무효화 + SQLite 쓰기 경합)
+- p50/p95/p99 지연, 처리량, 상태 코드, SQLite 잠금 오류("database is locked")를 출력
+- --baseline 파일과 비교해 p95가 --tolerance 이상 느려지거나 처리량이 그만큼 줄거나
+  잠금 오류/5xx가 생기면 실패(exit code 1)
+  기준값은 측정한 머신에 종속되므로 기준 머신에서 --save-baseline으로 갱신할 것
+"""
+import argparse
+import io
+import json
+import multiprocessing as mp
+import os
+import sys
+import time
+import warnings
+from datetime import timedelta
+from pathlib import Path
+
+from _setup import setup_django
+
+DEFAULT_BASELINE = Path(__file__).resolve().parent / "baselines" / "result_day.json"
+URL = "/api/applications/results/my"
+HOST = "localhost"
+
+
+def _production_env():
+    # 운영과 같은 설정(DEBUG=False: 쿼리 로깅 없음, SSL 리다이렉트는 X-Forwarded-Proto로 통과)
+    # collectstatic 전이라 whitenoise가 내는 경고는 무시
+    warnings.filterwarnings("ignore", message="No directory at")
+    os.environ["DEBUG"] = "false"
+    os.environ.setdefault("SECRET_KEY", "bench-only-secret-key")
+    os.environ["ALLOWED_HOSTS"] = HOST
+
+
+def seed(applicants):
+    """지원자 + 로그인 세션 생성 → 세션 키 목록"""
+    from django.conf import settings
+    from django.contrib.auth import BACKEND_SESSION_KEY, HASH_SESSION_KEY, SESSION_KEY, get_user_model
+    from django.contrib.sessions.backends.db import SessionStore
+    from django.contrib.sessions.models import Session
+    from django.utils import timezone
+    from django.utils.crypto import get_random_string
+
+    from applications.models import Application, ResultNotificationSettings
+
+    User = get_user_model()
+    User.objects.bulk_create(
+        [
+            User(
+                email=f"bench{i}@sch.ac.kr",
+                name=f"지원자{i}",
+                student_id=f"2026{i:05d}",
+                department="컴퓨터소프트웨어공학과",
+                phone="010-0000-0000",
+            )
+            for i in range(applicants)
+        ],
+        batch_size=1000,
+    )
+    users = list(User.objects.filter(email__startswith="bench").order_by("id"))
+
+    tracks = ["PLANNING_DESIGN", "FRONTEND", "BACKEND", "AI_SERVER"]
+    decisions = ["ACCEPTED", "REJECTED"]
+    Application.objects.bulk_create(
+        [
+            Application(
+                user=u, status="SUBMITTED", track=tracks[i % 4],
+                doc_decision=decisions[i % 2], submitted_at=timezone.now(),
+            )
+            for i, u in enumerate(users)
+        ],
+        batch_size=500,
+    )
+
+    # 로그인 세션을 DB 세션 테이블에 직접 생성 (login() 흐름과 같은 키)
+    store = SessionStore()
+    expire = timezone.now() + timedelta(seconds=settings.SESSION_COOKIE_AGE)
+    sessions = []
+    for u in users:
+        data = {
+            SESSION_KEY: str(u.pk),
+            BACKEND_SESSION_KEY: "django.contrib.auth.backends.ModelBackend",
+            HASH_SESSION_KEY: u.get_session_auth_hash(),
+        }
+        sessions.append(Session(session_key=get_random_string(32), session_data=store.encode(data), expire_date=expire))
+    Session.objects.bulk_create(sessions, batch_size=1000)
+
+    s = ResultNotificationSettings.get_settings()
+    s.doc_result_open = True
+    s.save()
+    return [x.session_key for x in sessions]
+
+
+def _environ(session_key):
+    from django.conf import settings
+
+    return {
+        "REQUEST_METHOD": "GET",
+        "PATH_INFO": URL,
+        "QUERY_STRING": "",
+        "SERVER_NAME": HOST,
+        "SERVER_PORT": "443",
+        "SERVER_PROTOCOL": "HTTP/1.1",
+        "HTTP_HOST": HOST,
+        "HTTP_X_FORWARDED_PROTO": "https",
+        "HTTP_COOKIE": f"{settings.SESSION_COOKIE_NAME}={session_key}",
+        "wsgi.version": (1, 0),
+        "wsgi.url_scheme": "https",
+        "wsgi.input": io.BytesIO(),
+        "wsgi.errors": sys.stderr,
+        "wsgi.multithread": False,
+        "wsgi.multiprocess": True,
+        "wsgi.run_once": False,
+    }
+
+
+def _worker(db_path, session_keys, rounds, barrier, out):
+    _production_env()
+    setup_django(db_path, migrate=False)
+
+    import logging
+
+    from django.core.signals import got_request_exception
+    from config.wsgi import application
+
+    # 오류 응답은 직접 집계하므로 django.request 로그 출력은 끔
+    logging.getLogger("django.request").disabled = True
+
+    lock_errors = []
+
+    def _on_exception(sender, request=None, **kwargs):
+        exc = sys.exc_info()[1]
+        if exc is not None and "database is locked" in str(exc):
+            lock_errors.append(1)
+
+    got_request_exception.connect(_on_exception)
+
+    status = []
+
+    def start_response(s, headers, exc_info=None):
+        status.append(int(s.split()[0]))
+
+    # 워밍업 (첫 요청의 import/URL 로딩 비용 제외)
+    b"".join(application(_environ(session_keys[0]), start_response))
+    status.clear()
+
+    latencies = []
+    barrier.wait()
+    for _ in range(rounds):
+        for key in session_keys:
+            t0 = time.perf_counter()
+            body = application(_environ(key), start_response)
+            b"".join(body)
+            if hasattr(body, "close"):
+                body.close()
+            latencies.append(time.perf_counter() - t0)
+
+    codes = {}
+    for code in status:
+        codes[code] = codes.get(code, 0) + 1
+    out.put({"latencies": latencies, "codes": codes, "lock_errors": len(lock_errors)})
+
+
+def _admin_writer(db_path, writes_per_sec, stop, out):
+    _production_env()
+    setup_django(db_path, migrate=False)
+
+    from django.db import OperationalError
+
+    from applications.models import ResultNotificationSettings
+
+    writes = lock_errors = 0
+    interval = 1.0 / writes_per_sec
+    while not stop.is_set():
+        try:
+            s = ResultNotificationSettings.get_settings()
+            s.interview_deadline = f"18:{writes % 60:02d} 까지"
+            s.save()
+            writes += 1
+        except OperationalError as e:
+            if "locked" not in str(e):
+                raise
+            lock_errors += 1
+        stop.wait(interval)
+    out.put({"writes": writes, "lock_errors": lock_errors})
+
+
+def percentile(sorted_values, p):
+    if not sorted_values:
+        return 0.0
+    idx = min(len(sorted_values) - 1, max(0, round(p / 100 * len(sorted_values)) - 1))
+    return sorted_values[idx]
+
+
+def run(db_path, session_keys, workers, rounds, admin_writes):
+    ctx = mp.get_context("spawn")
+    barrier = ctx.Barrier(workers + 1)
+    out = ctx.Queue()
+    stop = ctx.Event()
+
+    chunks = [session_keys[i::workers] for i in range(workers)]
+    procs = [ctx.Process(target=_worker, args=(db_path, chunk, rounds, barrier, out)) for chunk in chunks]
+    for p in procs:
+        p.start()
+
+    writer = None
+    writer_out = ctx.Queue()
+    if admin_writes > 0:
+        writer = ctx.Process(target=_admin_writer, args=(db_path, admin_writes, stop, writer_out))
+        writer.start()
+
+    barrier.wait()
+    t0 = time.perf_counter()
+    results = [out.get() for _ in procs]
+    wall = time.perf_counter() - t0
+    for p in procs:
+        p.join()
+
+    writer_result = {"writes": 0, "lock_errors": 0}
+    if writer is not None:
+        stop.set()
+        writer_result = writer_out.get()
+        writer.join()
+
+    latencies = sorted(x for r in results for x in r["latencies"])
+    codes = {}
+    for r in results:
+        for code, n in r["codes"].items():
+            codes[code] = codes.get(code, 0) + n
+
+    return {
+        "workers": workers,
+        "requests": len(latencies),
+        "throughput": len(latencies) / wall,
+        "p50_ms": percentile(latencies, 50) * 1000,
+        "p95_ms": percentile(latencies, 95) * 1000,
+        "p99_ms": percentile(latencies, 99) * 1000,
+        "codes": codes,
+        "lock_errors": sum(r["lock_errors"] for r in results) + writer_result["lock_errors"],
+        "admin_writes": writer_result["writes"],
+    }
+
+
+def compare(result, baseline, tolerance):
+    """기준 대비 회귀 목록 (빈 목록이면 통과)"""
+    problems = []
+    if result["lock_errors"]:
+        problems.append(f"{result['lock_errors']} SQLite lock errors")
+    errors = sum(n for code, n in result["codes"].items() if int(code) >= 500)
+    if errors:
+        problems.append(f"{errors} 5xx responses")
+    if baseline is None:
+        return problems
+    if result["p95_ms"] > baseline["p95_ms"] * (1 + tolerance):
+        problems.append(f"p95 {result['p95_ms']:.1f}ms > baseline {baseline['p95_ms']:.1f}ms (+{tolerance:.0%})")
+    if result["throughput"] < baseline["throughput"] * (1 - tolerance):
+        problems.append(
+            f"throughput {result['throughput']:.0f}/s < baseline {baseline['throughput']:.0f}/s (-{tolerance:.0%})"
+        )
+    return problems
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--applicants", type=int, default=1000)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 3, 6])
+    parser.add_argument("--rounds", type=int, default=1, help="세션당 조회 횟수")
+    parser.add_argument("--admin-writes", type=float, default=2.0, help="초당 설정 저장 횟수 (0이면 끔)")
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE)
+    parser.add_argument("--tolerance", type=float, default=0.25)
+    parser.add_argument("--save-baseline", action="store_true")
+    args = parser.parse_args()
+
+    _production_env()
+    db_path = setup_django()
+    session_keys = seed(args.applicants)
+
+    from django.db import connections
+    connections.close_all()
+
+    baselines = {}
+    if args.baseline.exists() and not args.save_baseline:
+        stored = json.loads(args.baseline.read_text())
+        # 규모가 다른 실행끼리는 비교하지 않음
+        if (stored.get("applicants"), stored.get("rounds")) == (args.applicants, args.rounds):
+            baselines = stored["workers"]
+        else:
+            print(f"baseline {args.baseline.name} was recorded with different --applicants/--rounds; not comparing")
+
+    print(f"{args.applicants} applicants, {args.rounds} round(s), admin writes {args.admin_writes}/s")
+    print(f"{'workers':>7} {'requests':>8} {'req/s':>8} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'locks':>6}  codes")
+
+    failed = False
+    results = {}
+    for workers in args.workers:
+        r = run(str(db_path), session_keys, workers, args.rounds, args.admin_writes)
+        results[str(workers)] = r
+        codes = " ".join(f"{c}:{n}" for c, n in sorted(r["codes"].items()))
+        print(
+            f"{workers:>7} {r['requests']:>8} {r['throughput']:>8.0f} {r['p50_ms']:>8.2f} "
+            f"{r['p95_ms']:>8.2f} {r['p99_ms']:>8.2f} {r['lock_errors']:>6}  {codes}"
+        )
+        for problem in compare(r, baselines.get(str(workers)), args.tolerance):
+            print(f"  FAIL ({workers} workers): {problem}")
+            failed = True
+
+    if args.save_baseline:
+        args.baseline.parent.mkdir(parents=True, exist_ok=True)
+        stored = {
+            "applicants": args.applicants,
+            "rounds": args.rounds,
+            "workers": {
+                k: {"p95_ms": round(v["p95_ms"], 2), "throughput": round(v["throughput"], 1)}
+                for k, v in results.items()
+            },
+        }
+        args.baseline.write_text(json.dumps(stored, indent=2) + "\n")
+        print(f"baseline saved to {args.baseline}")
+
+    if failed:
+        sys.exit(1)
+    print("OK")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+"""
+공개 조회 API용 HTTP 조건부 응답 (ETag / Last-Modified / Cache-Control)
+
+- validators(request, *args, **kwargs) → (etag, last_modified)
+  updated_at·version 등 가벼운 값(쿼리 1회 이하)으로 계산, last_modified는 datetime 또는 None
+  (None을 반환하면 조건부 처리 없이 원래 뷰 그대로 실행 — 예: 관리자 전용 파라미터)
+- If-None-Match / If-Modified-Since가 일치하면 뷰(쿼리·직렬화)를 실행하지 않고 304 반환
+  → DRF 뷰 바깥에서 처리하므로 304 응답은 anon throttle 횟수에도 포함되지 않음
+- 200/304 응답에 Cache-Control: public, max-age 를 붙여 nginx(프론트) 캐시에서도 재사용
+- GET/HEAD 외의 메서드는 그대로 통과
+"""
+from functools import wraps
+
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.http import http_date, quote_etag
+
+DEFAULT_MAX_AGE = 30
+
+
+def conditional_response(validators, max_age=DEFAULT_MAX_AGE):
+    """함수형 뷰(@api_view 바깥쪽) 또는 method_decorator(..., name="dispatch")로 사용"""
+    def decorator(view):
+        @wraps(view)
+        def wrapper(request, *args, **kwargs):
+            if request.method not in ("GET", "HEAD"):
+                return view(request, *args, **kwargs)
+
+            values = validators(request, *args, **kwargs)
+            if values is None:
+                return view(request, *args, **kwargs)
+            etag, last_modified = values
+            etag = quote_etag(etag)
+            timestamp = int(last_modified.timestamp()) if last_modified else None
+
+            response = get_conditional_response(request, etag=etag, last_modified=timestamp)
+            if response is None:
+                response = view(request, *args, **kwargs)
+
+            if response.status_code in (200, 304):
+                response.headers.setdefault("ETag", etag)
+                if timestamp is not None:
+                    response.headers.setdefault("Last-Modified", http_date(timestamp))
+                patch_cache_control(response, public=True, max_age=max_age)
+            return response
+
+        return wrapper
+
+    return decorator
@@ -0,0 +1,141 @@
+"""
+업로드 파일(MEDIA) 전달 — 권한 확인 후 nginx에 넘김
+
+- projects/  : 공개 프로젝트의 썸네일(변형 포함)/PDF는 누구나, 숨김 프로젝트는 INSTRUCTOR/staff만
+- homework/  : 제출한 학생 본인 또는 INSTRUCTOR/staff만
+- 그 밖의 경로나 DB에 없는 파일은 404
+- 운영(MEDIA_ACCEL_REDIRECT 설정 시): X-Accel-Redirect 헤더만 돌려주고 실제 전송은 nginx가 담당
+  → gunicorn 워커가 파일 바이트를 복사하지 않음, Range/Content-Length도 nginx가 처리
+  (frontend/nginx.conf 의 internal location 과 경로를 맞춰야 함)
+- 개발: Range 요청을 지원하는 FileResponse로 직접 전달
+"""
+import mimetypes
+import os
+import posixpath
+import re
+from urllib.parse import quote
+
+from django.conf import settings
+from django.db.models import Q
+from django.http import FileResponse, Http404, HttpResponse, HttpResponseNotModified, StreamingHttpResponse
+from django.utils.cache import patch_cache_control
+from django.utils.http import http_date
+from django.views.static import was_modified_since
+
+PUBLIC_MAX_AGE = 60 * 60 * 24
+CHUNK_SIZE = 64 * 1024
+_RANGE_RE = re.compile(r"^bytes=(\d*)-(\d*)$")
+
+
+def _is_instructor(user):
+    return user.is_authenticated and (user.role == "INSTRUCTOR" or user.is_staff)
+
+
+def _project_access(request, path):
+    from projects.models import Project
+    from projects.thumbnails import source_of
+
+    # 썸네일 변형(a.png.640w.webp)은 원본 썸네일 기준으로도 확인
+    # (원본 파일명이 변형처럼 생긴 경우(poster.320w.jpg)도 있으므로 경로 자체도 항상 확인)
+    lookup = Q(thumbnail=path) | Q(pdf_file=path)
+    source = source_of(path)
+    if source:
+        lookup |= Q(thumbnail=source)
+    project = Project.objects.filter(lookup).only("is_visible").first()
+    if project is None:
+        return None
+    return "public" if project.is_visible else ("private" if _is_instructor(request.user) else None)
+
+
+def _homework_access(request, path):
+    from sessionsapp.models import HomeworkSubmission
+
+    student_id = HomeworkSubmission.objects.filter(pdf_file=path).values_list("student_id", flat=True).first()
+    if student_id is None or not request.user.is_authenticated:
+        return None
+    return "private" if (request.user.id == student_id or _is_instructor(request.user)) else None
+
+
+# 경로 접두사 → 접근 확인 함수 ("public" | "private" | None(거부))
+MEDIA_ACCESS_RULES = [
+    ("projects/", _project_access),
+    ("homework/", _homework_access),
+]
+
+
+def resolve_access(request, path):
+    for prefix, check in MEDIA_ACCESS_RULES:
+        if path.startswith(prefix):
+            return check(request, path)
+    return None
+
+
+def _range_response(request, full_path, size, content_type):
+    """Range: bytes=a-b (단일 구간)만 지원, 그 외 형식은 전체 응답"""
+    match = _RANGE_RE.match(request.headers.get("Range", ""))
+    if not match or not any(match.groups()):
+        response = FileResponse(open(full_path, "rb"), content_type=content_type)
+        response["Accept-Ranges"] = "bytes"
+        return response
+
+    first, last = match.groups()
+    if first:
+        start, end = int(first), min(int(last), size - 1) if last else size - 1
+    else:
+        # bytes=-N : 마지막 N바이트
+        start, end = max(size - int(last), 0), size - 1
+    if start >= size or start > end:
+        response = HttpResponse(status=416)
+        response["Content-Range"] = f"bytes */{size}"
+        return response
+
+    def chunks():
+        with open(full_path, "rb") as f:
+            f.seek(start)
+            remaining = end - start + 1
+            while remaining > 0:
+                data = f.read(min(CHUNK_SIZE, remaining))
+                if not data:
+                    break
+                remaining -= len(data)
+                yield data
+
+    response = StreamingHttpResponse(chunks(), status=206, content_type=content_type)
+    response["Content-Range"] = f"bytes {start}-{end}/{size}"
+    response["Content-Length"] = str(end - start + 1)
+    response["Accept-Ranges"] = "bytes"
+    return response
+
+
+def serve_media(request, path):
+    path = posixpath.normpath(path).lstrip("/")
+    if path.startswith("..") or path == ".":
+        raise Http404
+
+    access = resolve_access(request, path)
+    if access is None:
+        # 존재 여부를 드러내지 않도록 권한 없음도 404
+        raise Http404
+
+    full_path = os.path.join(settings.MEDIA_ROOT, path)
+    if not os.path.isfile(full_path):
+        raise Http404
+
+    content_type = mimetypes.guess_type(full_path)[0] or "application/octet-stream"
+    accel_prefix = settings.MEDIA_ACCEL_REDIRECT
+    if accel_prefix:
+        response = HttpResponse(content_type=content_type)
+        response["X-Accel-Redirect"] = accel_prefix.rstrip("/") + "/" + quote(path)
+    else:
+        stat = os.stat(full_path)
+        if not was_modified_since(request.headers.get("If-Modified-Since"), stat.st_mtime):
+            response = HttpResponseNotModified()
+        else:
+            response = _range_response(request, full_path, stat.st_size, content_type)
+        response["Last-Modified"] = http_date(stat.st_mtime)
+
+    if access == "public":
+        patch_cache_control(response, public=True, max_age=PUBLIC_MAX_AGE)
+    else:
+        patch_cache_control(response, private=True, no_cache=True)
+    return response
@@ -148,6 +148,9 @@ STATIC_ROOT = BASE_DIR / 'staticfiles'
 
 MEDIA_URL = "/media/"
 MEDIA_ROOT = BASE_DIR / "media"
+# 운영: 권한 확인 후 nginx internal location으로 넘김 (config/media.py, frontend/nginx.conf)
+# 빈 값이면 Django가 직접 전달 (개발용)
+MEDIA_ACCEL_REDIRECT = os.environ.get('MEDIA_ACCEL_REDIRECT', '' if DEBUG else '/protected-media/')
 
 X_FRAME_OPTIONS = "SAMEORIGIN"
 
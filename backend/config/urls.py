@@ -1,9 +1,12 @@
+import re
+
 from django.conf import settings
-from django.conf.urls.static import static
 from django.contrib import admin
-from django.urls import path, include
+from django.urls import path, re_path, include
 from django.http import JsonResponse
 
+from .media import serve_media
+
 def health(request):
     return JsonResponse({"ok": True})
 
@@ -17,4 +20,7 @@ urlpatterns = [
     path("api/roadmap/", include("roadmap.urls")),
 ]
 
-urlpatterns += static(settings.MEDIA_URL, document_root=settings.MEDIA_ROOT)
+# 업로드 파일: DEBUG와 무관하게 권한 확인 뷰를 거침 (config/media.py)
+urlpatterns += [
+    re_path(r"^%s/(?P<path>.+)$" % re.escape(settings.MEDIA_URL.strip("/")), serve_media),
+]
@@ -0,0 +1,12 @@
+"""
+버전 카운터 증가 (캐시 키·ETag용 version 컬럼)
+
+- 읽고 +1 해서 저장하면 동시 저장 시 증가가 누락되므로 DB에서 F("version") + 1 로 갱신
+- auto_now 필드는 update()에 적용되지 않으므로 필요하면 extra로 직접 넘김
+"""
+from django.db.models import F
+
+
+def bump_version(queryset, field="version", **extra):
+    """queryset 행들의 field를 1 증가, 갱신된 행 수 반환 (0이면 호출한 쪽에서 행 생성)"""
+    return queryset.update(**{field: F(field) + 1}, **extra)
@@ -0,0 +1,63 @@
+from django.core.management.base import BaseCommand
+
+from projects.models import Project
+from projects.thumbnails import THUMBNAIL_FORMATS, source_of, variant_name
+
+THUMBNAIL_DIR = "projects/thumbnails"
+
+
+class Command(BaseCommand):
+    help = "프로젝트 썸네일의 반응형 변형(WebP/JPEG, 320/640/1280)을 생성합니다. 기본은 변형이 없는 프로젝트만."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--force",
+            action="store_true",
+            help="이미 변형이 있는 프로젝트도 다시 생성",
+        )
+        parser.add_argument(
+            "--prune",
+            action="store_true",
+            help="어느 프로젝트에도 속하지 않는 변형 파일 삭제 (생성 실패·중단 등으로 남은 파일)",
+        )
+
+    def handle(self, *args, **options):
+        force = options["force"]
+        done = skipped = failed = 0
+
+        for project in Project.objects.exclude(thumbnail="").order_by("id").iterator():
+            if not force and project.thumbnail_variants.get("source") == project.thumbnail.name:
+                skipped += 1
+                continue
+            if project.refresh_thumbnail_variants():
+                done += 1
+            else:
+                failed += 1
+                self.stderr.write(f"project {project.pk}: {project.thumbnail.name} 변형 생성 실패")
+
+        self.stdout.write(self.style.SUCCESS(f"generated {done}, skipped {skipped}, failed {failed}"))
+        if options["prune"]:
+            self.stdout.write(self.style.SUCCESS(f"pruned {self.prune_orphans()} orphan variants"))
+
+    def prune_orphans(self):
+        storage = Project._meta.get_field("thumbnail").storage
+        try:
+            _, files = storage.listdir(THUMBNAIL_DIR)
+        except FileNotFoundError:
+            return 0
+
+        keep = set()
+        for thumbnail, variants in Project.objects.values_list("thumbnail", "thumbnail_variants").iterator():
+            keep.add(thumbnail)
+            for width in variants.get("widths", []):
+                for ext, _, _ in THUMBNAIL_FORMATS:
+                    keep.add(variant_name(variants["source"], width, ext))
+
+        pruned = 0
+        for filename in files:
+            name = f"{THUMBNAIL_DIR}/{filename}"
+            # 변형 이름 형식이 아닌 파일(원본 업로드)은 건드리지 않음
+            if source_of(name) and name not in keep:
+                storage.delete(name)
+                pruned += 1
+        return pruned
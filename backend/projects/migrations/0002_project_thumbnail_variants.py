@@ -0,0 +1,30 @@
+# Generated by Django 4.2.27 on 2026-10-17 18:15
+
+import django.core.validators
+from django.db import migrations, models
+import projects.models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('projects', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='project',
+            name='thumbnail_variants',
+            field=models.JSONField(blank=True, default=dict, editable=False),
+        ),
+        migrations.AlterField(
+            model_name='project',
+            name='pdf_file',
+            field=models.FileField(upload_to='projects/pdfs/', validators=[django.core.validators.FileExtensionValidator(allowed_extensions=['pdf']), projects.models.validate_file_size_20mb, projects.models.validate_pdf_mime]),
+        ),
+        migrations.AlterField(
+            model_name='project',
+            name='thumbnail',
+            field=models.ImageField(upload_to='projects/thumbnails/', validators=[django.core.validators.FileExtensionValidator(allowed_extensions=['jpg', 'jpeg', 'png', 'webp', 'gif']), projects.models.validate_file_size_5mb, projects.models.validate_image_mime]),
+        ),
+    ]
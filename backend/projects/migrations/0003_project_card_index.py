@@ -0,0 +1,17 @@
+# Generated by Django 4.2.27 on 2026-10-17 18:16
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('projects', '0002_project_thumbnail_variants'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='project',
+            index=models.Index(fields=['is_visible', 'order', 'created_at'], name='projects_pr_is_visi_2b3c5d_idx'),
+        ),
+    ]
@@ -1,7 +1,12 @@
+import logging
+
 from django.conf import settings
 from django.core.exceptions import ValidationError
 from django.core.validators import FileExtensionValidator
 from django.db import models
+from django.utils import timezone
+
+logger = logging.getLogger(__name__)
 
 
 def validate_file_size_5mb(value):
@@ -45,6 +50,13 @@ def validate_pdf_mime(value):
         raise ValidationError("유효하지 않은 PDF 파일입니다.")
 
 
+class ProjectQuerySet(models.QuerySet):
+    def update(self, **kwargs):
+        # auto_now는 update()에 적용되지 않음 → 관리자 일괄 변경 등도 공개 목록 ETag(Max(updated_at))에 반영
+        kwargs.setdefault("updated_at", timezone.now())
+        return super().update(**kwargs)
+
+
 class Project(models.Model):
     title = models.CharField(max_length=200)
     generation = models.PositiveSmallIntegerField(help_text="기수 (예: 13)")
@@ -69,6 +81,8 @@ class Project(models.Model):
             validate_pdf_mime,
         ],
     )
+    # 반응형 썸네일 변형 {"source": 원본 이름, "widths": [...]} (projects/thumbnails.py)
+    thumbnail_variants = models.JSONField(default=dict, blank=True, editable=False)
     order = models.PositiveIntegerField(default=0)
     is_visible = models.BooleanField(default=True)
     created_by = models.ForeignKey(
@@ -80,8 +94,45 @@ class Project(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    objects = ProjectQuerySet.as_manager()
+
     class Meta:
         ordering = ["order", "-created_at"]
+        indexes = [models.Index(fields=["is_visible", "order", "created_at"])]
 
     def __str__(self):
         return f"[{self.generation}기] {self.title}"
+
+    @staticmethod
+    def split_list(value):
+        """쉼표 구분 문자열 → 공백 제거한 목록 (빈 항목 제외)"""
+        return [item.strip() for item in (value or "").split(",") if item.strip()]
+
+    def save(self, *args, **kwargs):
+        super().save(*args, **kwargs)
+        # 썸네일이 새로 올라왔으면 변형 생성 (파일은 super().save()에서 저장됨)
+        if self.thumbnail and self.thumbnail_variants.get("source") != self.thumbnail.name:
+            self.refresh_thumbnail_variants()
+
+    def refresh_thumbnail_variants(self):
+        """
+        썸네일 변형을 (다시) 만들고 성공 여부 반환
+        - 썸네일이 바뀌었으면 이전 썸네일의 변형 파일은 성공 여부와 관계없이 삭제
+        - 작업 큐가 없으므로 저장 요청 안에서 동기로 생성 (남은 파일 정리는 generate_project_thumbnails --prune)
+        """
+        from .thumbnails import delete_variants, generate_variants
+
+        old = self.thumbnail_variants
+        stale = bool(old.get("source")) and old["source"] != self.thumbnail.name
+        if stale:
+            delete_variants(self.thumbnail.storage, old)
+        try:
+            variants, ok = generate_variants(self.thumbnail), True
+        except Exception:
+            # 변형 생성 실패 시 원본만 사용 (serializer가 thumbnail_srcset=None 반환)
+            logger.exception("thumbnail variants failed for project %s", self.pk)
+            variants, ok = ({} if stale else old), False
+        if variants != old:
+            self.thumbnail_variants = variants
+            type(self).objects.filter(pk=self.pk).update(thumbnail_variants=variants)
+        return ok
@@ -1,9 +1,11 @@
 from rest_framework import serializers
 from .models import Project
+from .thumbnails import srcsets
 
 
 class ProjectListSerializer(serializers.ModelSerializer):
     thumbnail_url = serializers.SerializerMethodField()
+    thumbnail_srcset = serializers.SerializerMethodField()
     pdf_url = serializers.SerializerMethodField()
 
     class Meta:
@@ -11,7 +13,7 @@ class ProjectListSerializer(serializers.ModelSerializer):
         fields = [
             "id", "title", "generation", "description", "detail",
             "tech_stack", "github_url", "team_members",
-            "thumbnail_url", "pdf_url",
+            "thumbnail_url", "thumbnail_srcset", "pdf_url",
             "order", "is_visible", "created_at", "updated_at",
         ]
 
@@ -20,12 +22,57 @@ class ProjectListSerializer(serializers.ModelSerializer):
             return obj.thumbnail.url
         return None
 
+    def get_thumbnail_srcset(self, obj):
+        """{"webp": "url 320w, url 640w, ...", "jpeg": ...} — 변형이 아직 없으면 None (thumbnail_url 사용)"""
+        return srcsets(obj.thumbnail, obj.thumbnail_variants)
+
     def get_pdf_url(self, obj):
         if obj.pdf_file:
             return obj.pdf_file.url
         return None
 
 
+class ProjectCardSerializer(serializers.ModelSerializer):
+    """
+    공개 카드 목록용 (상세 설명/PDF 주소 제외 → project_detail에서 따로 조회)
+    tech_stack / team_members는 목록으로 분리해서 반환
+    """
+    tech_stack = serializers.SerializerMethodField()
+    team_members = serializers.SerializerMethodField()
+    thumbnail_url = serializers.SerializerMethodField()
+    thumbnail_srcset = serializers.SerializerMethodField()
+    has_pdf = serializers.SerializerMethodField()
+
+    # views에서 .only()로 읽을 컬럼
+    CARD_COLUMNS = [
+        "id", "title", "generation", "description", "tech_stack", "github_url", "team_members",
+        "thumbnail", "thumbnail_variants", "pdf_file", "order", "created_at",
+    ]
+
+    class Meta:
+        model = Project
+        fields = [
+            "id", "title", "generation", "description",
+            "tech_stack", "github_url", "team_members",
+            "thumbnail_url", "thumbnail_srcset", "has_pdf",
+        ]
+
+    def get_tech_stack(self, obj):
+        return Project.split_list(obj.tech_stack)
+
+    def get_team_members(self, obj):
+        return Project.split_list(obj.team_members)
+
+    def get_thumbnail_url(self, obj):
+        return obj.thumbnail.url if obj.thumbnail else None
+
+    def get_thumbnail_srcset(self, obj):
+        return srcsets(obj.thumbnail, obj.thumbnail_variants)
+
+    def get_has_pdf(self, obj):
+        return bool(obj.pdf_file)
+
+
 class ProjectCreateUpdateSerializer(serializers.ModelSerializer):
     class Meta:
         model = Project
@@ -0,0 +1,20 @@
+"""
+프로젝트 삭제 시 썸네일 변형 파일 정리
+
+- post_delete는 관리자 일괄 삭제(queryset.delete())에서도 호출됨
+- 삭제가 롤백되면 파일이 남아 있어야 하므로 커밋 후에 지움
+"""
+from django.db import transaction
+from django.db.models.signals import post_delete
+from django.dispatch import receiver
+
+from .models import Project
+from .thumbnails import delete_variants
+
+
+@receiver(post_delete, sender=Project)
+def delete_thumbnail_variants(sender, instance, **kwargs):
+    variants = instance.thumbnail_variants
+    if variants.get("source"):
+        storage = instance.thumbnail.storage
+        transaction.on_commit(lambda: delete_variants(storage, variants))
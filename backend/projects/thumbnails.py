@@ -0,0 +1,90 @@
+"""
+프로젝트 썸네일 반응형 변형 (Pillow)
+
+- 원본 옆에 고정 너비 WebP/JPEG 변형을 저장: projects/thumbnails/a.png → a.png.640w.webp, a.png.640w.jpg
+- EXIF 회전 적용 후 저장하고 EXIF/ICC 등 메타데이터는 쓰지 않음
+- 원본보다 큰 너비는 만들지 않음 (원본이 더 작으면 원본 너비 하나만)
+- 만든 결과는 Project.thumbnail_variants = {"source": 원본 이름, "widths": [...]} 에 기록
+"""
+import re
+from io import BytesIO
+
+from django.core.files.base import ContentFile
+from PIL import Image, ImageOps
+
+THUMBNAIL_WIDTHS = (320, 640, 1280)
+# (확장자, Pillow 포맷, 저장 옵션)
+THUMBNAIL_FORMATS = (
+    ("webp", "WEBP", {"quality": 80, "method": 4}),
+    ("jpg", "JPEG", {"quality": 82, "optimize": True, "progressive": True}),
+)
+VARIANT_RE = re.compile(r"^(?P<source>.+)\.(?P<width>\d+)w\.(?P<ext>webp|jpg)$")
+
+
+def variant_name(source, width, ext):
+    return f"{source}.{width}w.{ext}"
+
+
+def source_of(name):
+    """변형 파일 이름 → 원본 이름 (변형이 아니면 None)"""
+    match = VARIANT_RE.match(name)
+    return match.group("source") if match else None
+
+
+def _rgb(img):
+    """JPEG용: 투명 영역은 흰 배경으로"""
+    if img.mode in ("RGBA", "LA") or (img.mode == "P" and "transparency" in img.info):
+        img = img.convert("RGBA")
+        background = Image.new("RGB", img.size, (255, 255, 255))
+        background.paste(img, mask=img.getchannel("A"))
+        return background
+    return img.convert("RGB")
+
+
+def generate_variants(field_file):
+    """썸네일 FieldFile → 변형 저장 후 {"source", "widths"} 반환"""
+    storage, source = field_file.storage, field_file.name
+    with storage.open(source, "rb") as f:
+        img = Image.open(f)
+        img.seek(0)  # GIF는 첫 프레임
+        img = ImageOps.exif_transpose(img)
+        img.load()
+
+    if img.mode not in ("RGB", "RGBA"):
+        img = img.convert("RGBA" if "transparency" in img.info or img.mode in ("LA", "P") else "RGB")
+
+    widths = sorted({min(w, img.width) for w in THUMBNAIL_WIDTHS})
+    for width in widths:
+        height = max(1, round(img.height * width / img.width))
+        resized = img if width == img.width else img.resize((width, height), Image.LANCZOS)
+        for ext, fmt, options in THUMBNAIL_FORMATS:
+            buf = BytesIO()
+            (resized if fmt == "WEBP" else _rgb(resized)).save(buf, fmt, **options)
+            name = variant_name(source, width, ext)
+            # 같은 이름을 덮어쓰도록 (storage.save는 이름이 겹치면 접미사를 붙임)
+            if storage.exists(name):
+                storage.delete(name)
+            storage.save(name, ContentFile(buf.getvalue()))
+    return {"source": source, "widths": widths}
+
+
+def delete_variants(storage, variants):
+    source = variants.get("source")
+    for width in variants.get("widths", []):
+        for ext, _, _ in THUMBNAIL_FORMATS:
+            name = variant_name(source, width, ext)
+            if storage.exists(name):
+                storage.delete(name)
+
+
+def srcsets(field_file, variants):
+    """{"webp": "url 320w, ...", "jpeg": "..."} — 현재 썸네일의 변형이 없으면 None"""
+    if not field_file or variants.get("source") != field_file.name or not variants.get("widths"):
+        return None
+    storage = field_file.storage
+    return {
+        ("jpeg" if ext == "jpg" else ext): ", ".join(
+            f"{storage.url(variant_name(field_file.name, w, ext))} {w}w" for w in variants["widths"]
+        )
+        for ext, _, _ in THUMBNAIL_FORMATS
+    }
@@ -3,16 +3,60 @@ from rest_framework.parsers import MultiPartParser, FormParser
 from rest_framework.permissions import AllowAny, IsAuthenticated
 from rest_framework.response import Response
 from rest_framework import status as drf_status
+from django.db.models import Count, Max
 
+from config.http_cache import conditional_response
 from applications.permissions import IsInstructorOrStaff
 from .models import Project
-from .serializers import ProjectListSerializer, ProjectCreateUpdateSerializer
+from .serializers import ProjectListSerializer, ProjectCardSerializer, ProjectCreateUpdateSerializer
 
 
+def _public_projects_validators(request):
+    """공개 목록 ETag: 공개 프로젝트 수 + 최근 수정 시각 (삭제/비공개 전환도 반영)"""
+    if request.GET.get("all") == "true":
+        return None
+    agg = Project.objects.filter(is_visible=True).aggregate(n=Count("id"), last=Max("updated_at"))
+    last = agg["last"]
+    # 카드 목록은 기수별로 응답이 다르므로 ETag에 구분값 포함
+    variant = f"cards{request.GET.get('generation', '')}-" if request.GET.get("view") == "cards" else ""
+    return f"projects-{variant}{agg['n']}-{last.timestamp() if last else 0}", last
+
+
+def _project_cards(request):
+    """
+    GET /api/projects/?view=cards[&generation=14] — 공개 카드 목록, 기수 단위 페이지
+    - generation 생략 시 가장 최근 기수
+    - generations: 공개 프로젝트가 있는 기수 (최신순), next_generation: 다음(이전 기수) 페이지
+    """
+    visible = Project.objects.filter(is_visible=True)
+    generations = list(visible.order_by("-generation").values_list("generation", flat=True).distinct())
+
+    generation = request.query_params.get("generation")
+    if generation is None:
+        generation = generations[0] if generations else None
+    else:
+        try:
+            generation = int(generation)
+        except ValueError:
+            return Response({"detail": "generation은 숫자여야 합니다."}, status=drf_status.HTTP_400_BAD_REQUEST)
+
+    older = [g for g in generations if generation is not None and g < generation]
+    qs = visible.filter(generation=generation).only(*ProjectCardSerializer.CARD_COLUMNS)
+    return Response({
+        "generation": generation,
+        "generations": generations,
+        "next_generation": older[0] if older else None,
+        "results": ProjectCardSerializer(qs, many=True).data,
+    })
+
+
+@conditional_response(_public_projects_validators)
 @api_view(["GET", "POST"])
 @parser_classes([MultiPartParser, FormParser])
 def project_list_create(request):
     if request.method == "GET":
+        if request.query_params.get("view") == "cards":
+            return _project_cards(request)
         # ?all=true → 관리자 전체 조회 (비공개 포함)
         if request.query_params.get("all") == "true":
             if not IsInstructorOrStaff().has_permission(request, None):
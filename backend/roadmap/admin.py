@@ -1,5 +1,5 @@
 from django.contrib import admin
-from .models import RoadmapItem
+from .models import RoadmapItem, RoadmapVersion
 
 
 @admin.register(RoadmapItem)
@@ -7,3 +7,8 @@ class RoadmapItemAdmin(admin.ModelAdmin):
     list_display = ("label", "half", "row", "col_start", "col_span", "order")
     list_filter = ("half",)
     ordering = ("half", "row", "order")
+
+    def delete_queryset(self, request, queryset):
+        # 일괄 삭제는 model.delete()를 거치지 않으므로 버전 직접 증가
+        super().delete_queryset(request, queryset)
+        RoadmapVersion.bump()
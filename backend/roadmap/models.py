@@ -1,4 +1,7 @@
 from django.db import models
+from django.utils import timezone
+
+from config.versioning import bump_version
 
 
 class RoadmapItem(models.Model):
@@ -19,5 +22,37 @@ class RoadmapItem(models.Model):
     class Meta:
         ordering = ["half", "row", "order"]
 
+    def save(self, *args, **kwargs):
+        super().save(*args, **kwargs)
+        RoadmapVersion.bump()
+
+    def delete(self, *args, **kwargs):
+        result = super().delete(*args, **kwargs)
+        RoadmapVersion.bump()
+        return result
+
     def __str__(self):
         return f"[{self.half} r{self.row}] {self.label}"
+
+
+class RoadmapVersion(models.Model):
+    """
+    로드맵 전체 버전 (싱글톤, ID=1)
+    - RoadmapItem 저장/삭제 시 증가 → 공개 로드맵 응답의 ETag·캐시 키로 사용
+    - queryset.update()/delete()/bulk_* 로 항목을 바꾸면 bump()를 직접 호출해야 함
+    """
+    version = models.PositiveIntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    @classmethod
+    def current(cls):
+        obj, created = cls.objects.get_or_create(pk=1)
+        return obj
+
+    @classmethod
+    def bump(cls):
+        if not bump_version(cls.objects.filter(pk=1), updated_at=timezone.now()):
+            cls.objects.get_or_create(pk=1, defaults={"version": 1})
+
+    def __str__(self):
+        return f"로드맵 v{self.version}"
@@ -1,8 +1,84 @@
+from collections import defaultdict
+
 from rest_framework import serializers
 from .models import RoadmapItem
 
+GRID_COLUMNS = 6
+LAYOUT_FIELDS = ("half", "row", "col_start", "col_span", "order")
+
 
 class RoadmapItemSerializer(serializers.ModelSerializer):
     class Meta:
         model = RoadmapItem
         fields = "__all__"
+
+
+class RoadmapLayoutItemSerializer(serializers.Serializer):
+    id = serializers.IntegerField()
+    half = serializers.ChoiceField(choices=RoadmapItem.HALF_CHOICES)
+    row = serializers.IntegerField(min_value=0)
+    col_start = serializers.IntegerField(min_value=1, max_value=GRID_COLUMNS)
+    col_span = serializers.IntegerField(min_value=1, max_value=GRID_COLUMNS)
+    order = serializers.IntegerField(required=False)
+
+    def validate(self, attrs):
+        if attrs["col_start"] + attrs["col_span"] - 1 > GRID_COLUMNS:
+            raise serializers.ValidationError(f"{GRID_COLUMNS}열을 넘을 수 없습니다.")
+        return attrs
+
+
+class RoadmapLayoutSerializer(serializers.Serializer):
+    """
+    로드맵 배치 일괄 변경
+    - items: 옮길 항목들의 위치 (빠진 항목은 현재 위치 유지, order를 생략하면 기존 order 유지)
+    - 바뀐 뒤의 전체 그리드 기준으로 같은 half+row 안에서 열이 겹치면 거부
+    """
+    items = RoadmapLayoutItemSerializer(many=True, allow_empty=False)
+
+    def validate_items(self, items):
+        ids = [item["id"] for item in items]
+        if len(ids) != len(set(ids)):
+            raise serializers.ValidationError("같은 항목이 두 번 포함되어 있습니다.")
+
+        existing = {obj.id: obj for obj in RoadmapItem.objects.select_for_update()}
+        missing = sorted(set(ids) - set(existing))
+        if missing:
+            raise serializers.ValidationError(f"존재하지 않는 항목: {missing}")
+
+        # 변경 후 위치: 보낸 항목은 새 위치, 나머지는 현재 위치
+        layout = {
+            obj.id: (obj.half, obj.row, obj.col_start, obj.col_span, obj.label)
+            for obj in existing.values()
+        }
+        for item in items:
+            layout[item["id"]] = (
+                item["half"], item["row"], item["col_start"], item["col_span"], existing[item["id"]].label,
+            )
+
+        cells = defaultdict(dict)  # (half, row) → {열: 차지한 항목 label}
+        for half, row, col_start, col_span, label in layout.values():
+            taken = cells[(half, row)]
+            for col in range(col_start, col_start + col_span):
+                if col in taken:
+                    raise serializers.ValidationError(
+                        f"{half} {row}행 {col}열에서 '{taken[col]}'와(과) '{label}'이(가) 겹칩니다."
+                    )
+                taken[col] = label
+
+        self.context["objects"] = existing
+        return items
+
+    def save(self):
+        objects = self.context["objects"]
+        changed, fields = [], {"half", "row", "col_start", "col_span"}
+        for item in self.validated_data["items"]:
+            obj = objects[item["id"]]
+            for field in LAYOUT_FIELDS:
+                if field in item:
+                    setattr(obj, field, item[field])
+            if "order" in item:
+                fields.add("order")
+            changed.append(obj)
+        # 보낸 필드만 갱신 (order를 아무도 보내지 않았으면 order 컬럼은 쓰지 않음)
+        RoadmapItem.objects.bulk_update(changed, [f for f in LAYOUT_FIELDS if f in fields])
+        return sorted(objects.values(), key=lambda obj: (obj.half, obj.row, obj.order))
@@ -7,6 +7,9 @@ urlpatterns = [
     path("admin", views.RoadmapAdminList.as_view()),
     path("admin/", views.RoadmapAdminList.as_view()),
     
+    path("admin/layout", views.RoadmapAdminLayout.as_view()),
+    path("admin/layout/", views.RoadmapAdminLayout.as_view()),
+
     path("admin/<int:pk>", views.RoadmapAdminDetail.as_view()),
     path("admin/<int:pk>/", views.RoadmapAdminDetail.as_view()),
 ]
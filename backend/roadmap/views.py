@@ -1,16 +1,48 @@
+from django.core.cache import cache
+from django.db import transaction
+from django.http import HttpResponse
+from django.utils.decorators import method_decorator
 from rest_framework import generics
 from rest_framework.permissions import AllowAny
+from rest_framework.renderers import JSONRenderer
+from rest_framework.response import Response
+from rest_framework.views import APIView
 from applications.permissions import IsInstructorOrStaff
-from .models import RoadmapItem
-from .serializers import RoadmapItemSerializer
+from config.http_cache import conditional_response
+from .models import RoadmapItem, RoadmapVersion
+from .serializers import RoadmapItemSerializer, RoadmapLayoutSerializer
 
+ROADMAP_CACHE_SECONDS = 60 * 60
 
+
+def _roadmap_validators(request, *args, **kwargs):
+    v = RoadmapVersion.current()
+    # list()에서 캐시 키로 다시 쓰도록 요청에 보관 (싱글톤 조회는 요청당 한 번)
+    request.roadmap_version = v.version
+    return f"roadmap-{v.version}", v.updated_at
+
+
+@method_decorator(conditional_response(_roadmap_validators), name="dispatch")
 class RoadmapPublicList(generics.ListAPIView):
-    """공개 GET - Home 페이지용"""
+    """
+    공개 GET - Home 페이지용 (로드맵 버전 기준 ETag, 변경 없으면 304)
+    렌더링된 JSON을 로드맵 버전을 키로 캐시 → 버전이 같으면 항목 조회·직렬화 없이 그대로 반환
+    """
     queryset = RoadmapItem.objects.all()
     serializer_class = RoadmapItemSerializer
     permission_classes = [AllowAny]
 
+    def list(self, request, *args, **kwargs):
+        version = getattr(request, "roadmap_version", None)
+        if version is None:
+            version = RoadmapVersion.current().version
+        key = f"roadmap:{version}"
+        body = cache.get(key)
+        if body is None:
+            body = JSONRenderer().render(self.get_serializer(self.get_queryset(), many=True).data)
+            cache.set(key, body, ROADMAP_CACHE_SECONDS)
+        return HttpResponse(body, content_type="application/json")
+
 
 class RoadmapAdminList(generics.ListCreateAPIView):
     """관리자 목록/생성"""
@@ -24,3 +56,20 @@ class RoadmapAdminDetail(generics.RetrieveUpdateDestroyAPIView):
     queryset = RoadmapItem.objects.all()
     serializer_class = RoadmapItemSerializer
     permission_classes = [IsInstructorOrStaff]
+
+
+class RoadmapAdminLayout(APIView):
+    """
+    관리자 배치 일괄 변경 (PUT {"items": [{id, half, row, col_start, col_span, order}, ...]})
+    전체 그리드를 검증한 뒤 한 트랜잭션에서 bulk_update, 버전은 한 번만 증가
+    """
+    permission_classes = [IsInstructorOrStaff]
+
+    def put(self, request):
+        with transaction.atomic():
+            serializer = RoadmapLayoutSerializer(data=request.data)
+            serializer.is_valid(raise_exception=True)
+            items = serializer.save()
+            # bulk_update는 model.save()를 거치지 않으므로 버전 직접 증가
+            RoadmapVersion.bump()
+        return Response(RoadmapItemSerializer(items, many=True).data)
@@ -2,6 +2,7 @@ from django.contrib import admin
 from .models import (
     Quiz, QuizAnswer, QnAPost, QnAComment,
     Assignment, AssignmentSubmission, Announcement,
+    QuizStatsVersion,
 )
 
 
@@ -10,12 +11,22 @@ class QuizAdmin(admin.ModelAdmin):
     list_display = ("title", "track", "created_by", "created_at")
     list_filter = ("track",)
 
+    def delete_queryset(self, request, queryset):
+        tracks = set(queryset.values_list("track", flat=True))
+        super().delete_queryset(request, queryset)
+        QuizStatsVersion.bump(*tracks)
+
 
 @admin.register(QuizAnswer)
 class QuizAnswerAdmin(admin.ModelAdmin):
     list_display = ("quiz", "student", "selected_option", "is_correct", "created_at")
     list_filter = ("is_correct",)
 
+    def delete_queryset(self, request, queryset):
+        tracks = set(queryset.values_list("quiz__track", flat=True))
+        super().delete_queryset(request, queryset)
+        QuizStatsVersion.bump(*tracks)
+
 
 @admin.register(QnAPost)
 class QnAPostAdmin(admin.ModelAdmin):
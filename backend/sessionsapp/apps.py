@@ -4,3 +4,6 @@ from django.apps import AppConfig
 class SessionsappConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'sessionsapp'
+
+    def ready(self):
+        from . import signals  # noqa: F401
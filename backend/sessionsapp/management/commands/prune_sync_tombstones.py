@@ -0,0 +1,11 @@
+from django.core.management.base import BaseCommand
+
+from sessionsapp.models import SyncTombstone
+
+
+class Command(BaseCommand):
+    help = "보존 기간(SyncTombstone.RETENTION)이 지난 피드 삭제 기록을 정리합니다."
+
+    def handle(self, *args, **options):
+        deleted = SyncTombstone.prune()
+        self.stdout.write(self.style.SUCCESS(f"pruned {deleted} tombstones"))
@@ -0,0 +1,17 @@
+# Generated by Django 4.2.27 on 2026-10-17 18:02
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('sessionsapp', '0006_add_homework_gallery'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='assignment',
+            index=models.Index(fields=['track', 'created_at'], name='sessionsapp_track_3264c6_idx'),
+        ),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 4.2.27 on 2026-10-17 18:03
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('sessionsapp', '0007_assignment_track_created_at_index'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='qnacomment',
+            index=models.Index(fields=['post', 'created_at'], name='sessionsapp_post_id_d3b79f_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='qnapost',
+            index=models.Index(fields=['track', 'created_at'], name='sessionsapp_track_db5eeb_idx'),
+        ),
+    ]
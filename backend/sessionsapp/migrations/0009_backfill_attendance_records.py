@@ -0,0 +1,37 @@
+"""
+기존 출석 세션 명단 보완 (1회성)
+- 이전에는 출석 상세 GET 시점에 신규 수강생을 명단에 추가했음
+- 이제 STUDENT 승격 시점에 추가하므로, 그 사이 빠진 (세션, 학생) 기록을 한 번 채워 둠
+"""
+from django.db import migrations
+
+
+def backfill_attendance_records(apps, schema_editor):
+    User = apps.get_model('users', 'User')
+    AttendanceSession = apps.get_model('sessionsapp', 'AttendanceSession')
+    AttendanceRecord = apps.get_model('sessionsapp', 'AttendanceRecord')
+
+    students_by_track = {}
+    for student_id, track in User.objects.filter(
+        role='STUDENT', education_track__isnull=False
+    ).values_list('id', 'education_track'):
+        students_by_track.setdefault(track, []).append(student_id)
+
+    records = [
+        AttendanceRecord(session_id=session_id, student_id=student_id, status='ABSENT')
+        for session_id, track in AttendanceSession.objects.values_list('id', 'track')
+        for student_id in students_by_track.get(track, ())
+    ]
+    AttendanceRecord.objects.bulk_create(records, ignore_conflicts=True, batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('sessionsapp', '0008_qna_indexes'),
+        ('users', '0008_migrate_to_fullstack'),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill_attendance_records, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 4.2.27 on 2026-10-17 18:08
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('sessionsapp', '0009_backfill_attendance_records'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='AttendanceVersion',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('track', models.CharField(choices=[('FULLSTACK', '풀스택'), ('AI_SERVER', 'AI'), ('PLANNING_DESIGN', '기획/디자인')], max_length=30, unique=True)),
+                ('version', models.PositiveIntegerField(default=0)),
+            ],
+        ),
+    ]
@@ -0,0 +1,61 @@
+# Generated by Django 4.2.27 on 2026-10-17 18:10
+
+from django.db import migrations, models
+
+
+def fill_updated_at(apps, schema_editor):
+    # 기존 행은 마이그레이션 시각 대신 작성 시각으로
+    for name in ('Announcement', 'QnAPost'):
+        model = apps.get_model('sessionsapp', name)
+        model.objects.update(updated_at=models.F('created_at'))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('sessionsapp', '0010_attendanceversion'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SyncTombstone',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('kind', models.CharField(choices=[('quiz', '퀴즈'), ('qna', 'Q&A'), ('assignment', '과제'), ('announcement', '공지')], max_length=20)),
+                ('object_id', models.PositiveIntegerField()),
+                ('track', models.CharField(choices=[('FULLSTACK', '풀스택'), ('AI_SERVER', 'AI'), ('PLANNING_DESIGN', '기획/디자인')], max_length=30)),
+                ('deleted_at', models.DateTimeField(auto_now_add=True)),
+            ],
+        ),
+        migrations.AddField(
+            model_name='announcement',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True),
+        ),
+        migrations.AddField(
+            model_name='qnapost',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True),
+        ),
+        migrations.RunPython(fill_updated_at, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name='announcement',
+            index=models.Index(fields=['track', 'updated_at'], name='sessionsapp_track_560643_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='assignment',
+            index=models.Index(fields=['track', 'updated_at'], name='sessionsapp_track_473a5f_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='qnapost',
+            index=models.Index(fields=['track', 'updated_at'], name='sessionsapp_track_7a3d48_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='quiz',
+            index=models.Index(fields=['track', 'updated_at'], name='sessionsapp_track_eb8a6c_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='synctombstone',
+            index=models.Index(fields=['kind', 'track', 'deleted_at'], name='sessionsapp_kind_371b1a_idx'),
+        ),
+    ]
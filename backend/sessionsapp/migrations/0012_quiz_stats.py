@@ -0,0 +1,28 @@
+# Generated by Django 4.2.27 on 2026-10-17 18:11
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('sessionsapp', '0011_feed_sync'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='QuizStatsVersion',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('track', models.CharField(choices=[('FULLSTACK', '풀스택'), ('AI_SERVER', 'AI'), ('PLANNING_DESIGN', '기획/디자인')], max_length=30, unique=True)),
+                ('version', models.PositiveIntegerField(default=0)),
+            ],
+            options={
+                'abstract': False,
+            },
+        ),
+        migrations.AddIndex(
+            model_name='quizanswer',
+            index=models.Index(fields=['quiz', 'selected_option'], name='sessionsapp_quiz_id_dcb033_idx'),
+        ),
+    ]
@@ -1,13 +1,41 @@
+from datetime import timedelta
+
 from django.conf import settings
 from django.db import models
+from django.utils import timezone
 from django.core.validators import MinValueValidator, MaxValueValidator
 
+from config.versioning import bump_version
+
 
 TRACK_FS = [("FULLSTACK", "풀스택")]
 TRACK_AP = [("AI_SERVER", "AI"), ("PLANNING_DESIGN", "기획/디자인")]
 TRACK_ALL = TRACK_FS + TRACK_AP
 
 
+class TrackVersion(models.Model):
+    """
+    트랙별 데이터 버전 (집계 결과 캐시 키로 사용)
+    - 관련 모델 저장·삭제 시 bump()로 증가
+    - queryset.update()/delete()/bulk_* 로 바꾸면 bump()를 직접 호출해야 함
+    """
+    track = models.CharField(max_length=30, choices=TRACK_ALL, unique=True)
+    version = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        abstract = True
+
+    @classmethod
+    def current(cls, track):
+        return cls.objects.filter(track=track).values_list("version", flat=True).first() or 0
+
+    @classmethod
+    def bump(cls, *tracks):
+        for track in tracks:
+            if not bump_version(cls.objects.filter(track=track)):
+                cls.objects.get_or_create(track=track, defaults={"version": 1})
+
+
 # ──────────────────────────────────────────
 # 그룹 A: 풀스택 트랙
 # ──────────────────────────────────────────
@@ -32,10 +60,20 @@ class Quiz(models.Model):
 
     class Meta:
         ordering = ["-created_at"]
+        indexes = [models.Index(fields=["track", "updated_at"])]
 
     def __str__(self):
         return f"[{self.track}] {self.title}"
 
+    def save(self, *args, **kwargs):
+        super().save(*args, **kwargs)
+        QuizStatsVersion.bump(self.track)
+
+    def delete(self, *args, **kwargs):
+        result = super().delete(*args, **kwargs)
+        QuizStatsVersion.bump(self.track)
+        return result
+
 
 class QuizAnswer(models.Model):
     quiz = models.ForeignKey(Quiz, on_delete=models.CASCADE, related_name="answers")
@@ -50,10 +88,28 @@ class QuizAnswer(models.Model):
 
     class Meta:
         unique_together = ("quiz", "student")
+        indexes = [models.Index(fields=["quiz", "selected_option"])]
 
     def __str__(self):
         return f"{self.student} → Quiz#{self.quiz_id} ({'O' if self.is_correct else 'X'})"
 
+    def save(self, *args, **kwargs):
+        super().save(*args, **kwargs)
+        QuizStatsVersion.bump(self.quiz.track)
+
+    def delete(self, *args, **kwargs):
+        track = self.quiz.track
+        result = super().delete(*args, **kwargs)
+        QuizStatsVersion.bump(track)
+        return result
+
+
+class QuizStatsVersion(TrackVersion):
+    """트랙별 퀴즈 답변 버전 — 퀴즈/답변 저장·삭제 시 증가 (퀴즈 통계 캐시 키)"""
+
+    def __str__(self):
+        return f"{self.track} 퀴즈 통계 v{self.version}"
+
 
 class QnAPost(models.Model):
     track = models.CharField(max_length=30, choices=TRACK_FS)
@@ -63,9 +119,15 @@ class QnAPost(models.Model):
         settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name="qna_posts"
     )
     created_at = models.DateTimeField(auto_now_add=True)
+    # 댓글 작성/삭제 시에도 갱신 (목록의 comment_count가 바뀌므로, sessionsapp/signals.py)
+    updated_at = models.DateTimeField(auto_now=True)
 
     class Meta:
         ordering = ["-created_at"]
+        indexes = [
+            models.Index(fields=["track", "created_at"]),
+            models.Index(fields=["track", "updated_at"]),
+        ]
 
     def __str__(self):
         return f"[{self.track}] {self.title}"
@@ -81,6 +143,7 @@ class QnAComment(models.Model):
 
     class Meta:
         ordering = ["created_at"]
+        indexes = [models.Index(fields=["post", "created_at"])]
 
     def __str__(self):
         return f"Comment by {self.author} on Post#{self.post_id}"
@@ -103,6 +166,10 @@ class Assignment(models.Model):
 
     class Meta:
         ordering = ["-created_at"]
+        indexes = [
+            models.Index(fields=["track", "created_at"]),
+            models.Index(fields=["track", "updated_at"]),
+        ]
 
     def __str__(self):
         return f"[{self.track}] {self.title}"
@@ -142,14 +209,60 @@ class Announcement(models.Model):
         settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name="announcements"
     )
     created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
 
     class Meta:
         ordering = ["-created_at"]
+        indexes = [models.Index(fields=["track", "updated_at"])]
 
     def __str__(self):
         return f"[{self.track}] {self.title}"
 
 
+class SyncTombstone(models.Model):
+    """
+    삭제된 피드 항목 기록 (?since= 증분 동기화에서 deleted 목록으로 전달)
+    - Quiz/QnAPost/Assignment/Announcement의 post_delete 시그널에서 기록 (CASCADE 포함, sessionsapp/signals.py)
+    - RETENTION보다 오래된 기록은 prune()으로 삭제 (manage.py prune_sync_tombstones)
+      → 그보다 오래된 since로 요청하면 삭제 목록 대신 전체 목록을 reset으로 응답 (sessionsapp/sync.py)
+    """
+    RETENTION = timedelta(days=30)
+    KIND_CHOICES = [
+        ("quiz", "퀴즈"),
+        ("qna", "Q&A"),
+        ("assignment", "과제"),
+        ("announcement", "공지"),
+    ]
+
+    kind = models.CharField(max_length=20, choices=KIND_CHOICES)
+    object_id = models.PositiveIntegerField()
+    track = models.CharField(max_length=30, choices=TRACK_ALL)
+    deleted_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        indexes = [models.Index(fields=["kind", "track", "deleted_at"])]
+
+    def __str__(self):
+        return f"{self.kind}#{self.object_id} 삭제 ({self.deleted_at})"
+
+    @classmethod
+    def kind_of(cls, model):
+        return {Quiz: "quiz", QnAPost: "qna", Assignment: "assignment", Announcement: "announcement"}[model]
+
+    @classmethod
+    def record(cls, obj):
+        cls.objects.create(kind=cls.kind_of(type(obj)), object_id=obj.pk, track=obj.track)
+        # 삭제는 드물게 일어나므로 기록할 때 오래된 것도 함께 정리 (별도 스케줄러 없이 테이블 크기 유지)
+        cls.prune()
+
+    @classmethod
+    def prune(cls, now=None):
+        """보존 기간이 지난 기록 삭제, 삭제한 개수 반환"""
+        cutoff = (now or timezone.now()) - cls.RETENTION
+        deleted, _ = cls.objects.filter(deleted_at__lt=cutoff).delete()
+        return deleted
+
+
 # ──────────────────────────────────────────
 # 출석부
 # ──────────────────────────────────────────
@@ -170,6 +283,16 @@ class AttendanceSession(models.Model):
     def __str__(self):
         return f"[{self.track}] {self.title} ({self.date})"
 
+    def save(self, *args, **kwargs):
+        super().save(*args, **kwargs)
+        AttendanceVersion.bump(self.track)
+
+    def delete(self, *args, **kwargs):
+        track = self.track
+        result = super().delete(*args, **kwargs)
+        AttendanceVersion.bump(track)
+        return result
+
 
 class AttendanceRecord(models.Model):
     """개별 출석 기록"""
@@ -202,6 +325,54 @@ class AttendanceRecord(models.Model):
     def __str__(self):
         return f"{self.student.name} - {self.session.title} ({self.status})"
 
+    def save(self, *args, **kwargs):
+        super().save(*args, **kwargs)
+        AttendanceVersion.bump(self.session.track)
+
+    def delete(self, *args, **kwargs):
+        track = self.session.track
+        result = super().delete(*args, **kwargs)
+        AttendanceVersion.bump(track)
+        return result
+
+    @classmethod
+    def enroll_students(cls, student_ids):
+        """
+        학생들을 각자 education_track의 모든 출석 세션 명단에 추가 (ABSENT)
+        - STUDENT 승격 / 교육 트랙 변경 시 호출
+        - 이미 있는 기록은 그대로 두고, 세션 × 학생 조합을 한 번의 bulk INSERT로 추가
+        """
+        from django.contrib.auth import get_user_model
+
+        students = list(
+            get_user_model().objects.filter(id__in=student_ids, role="STUDENT")
+            .exclude(education_track__isnull=True)
+            .values_list("id", "education_track")
+        )
+        if not students:
+            return 0
+
+        tracks = {track for _, track in students}
+        sessions_by_track = {}
+        for session_id, track in AttendanceSession.objects.filter(track__in=tracks).values_list("id", "track"):
+            sessions_by_track.setdefault(track, []).append(session_id)
+
+        records = [
+            cls(session_id=session_id, student_id=student_id, status="ABSENT")
+            for student_id, track in students
+            for session_id in sessions_by_track.get(track, ())
+        ]
+        cls.objects.bulk_create(records, ignore_conflicts=True, batch_size=500)
+        AttendanceVersion.bump(*sessions_by_track)
+        return len(records)
+
+
+class AttendanceVersion(TrackVersion):
+    """트랙별 출석 데이터 버전 — 출석 세션/기록 저장·삭제 시 증가 (출석 현황 매트릭스 캐시 키)"""
+
+    def __str__(self):
+        return f"{self.track} 출석 v{self.version}"
+
 
 # ──────────────────────────────────────────
 # 학생 그룹
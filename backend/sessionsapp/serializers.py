@@ -5,6 +5,7 @@ from .models import (
     AttendanceSession, AttendanceRecord,
     StudentGroup, ClassReview,
     HomeworkCategory, HomeworkSubmission,
+    TRACK_ALL,
 )
 
 
@@ -26,7 +27,11 @@ class QuizListSerializer(serializers.ModelSerializer):
         user = self.context.get("request") and self.context["request"].user
         if not user or not user.is_authenticated:
             return None
-        ans = obj.answers.filter(student=user).first()
+        # views.with_my_answer()로 prefetch된 경우 추가 쿼리 없음
+        if hasattr(obj, "my_answers"):
+            ans = obj.my_answers[0] if obj.my_answers else None
+        else:
+            ans = obj.answers.filter(student=user).first()
         if not ans:
             return None
         return {"selected_option": ans.selected_option, "is_correct": ans.is_correct}
@@ -64,8 +69,9 @@ class QnACommentSerializer(serializers.ModelSerializer):
 
 
 class QnAPostListSerializer(serializers.ModelSerializer):
+    """comment_count는 views에서 annotate(Count)로 채움"""
     author_name = serializers.CharField(source="author.name", read_only=True)
-    comment_count = serializers.IntegerField(source="comments.count", read_only=True)
+    comment_count = serializers.IntegerField(read_only=True)
 
     class Meta:
         model = QnAPost
@@ -73,12 +79,13 @@ class QnAPostListSerializer(serializers.ModelSerializer):
 
 
 class QnAPostDetailSerializer(serializers.ModelSerializer):
+    """댓글(comments)은 views.qna_detail에서 페이지 단위로 붙임"""
     author_name = serializers.CharField(source="author.name", read_only=True)
-    comments = QnACommentSerializer(many=True, read_only=True)
+    comment_count = serializers.IntegerField(read_only=True)
 
     class Meta:
         model = QnAPost
-        fields = ["id", "track", "title", "content", "author_name", "comments", "created_at"]
+        fields = ["id", "track", "title", "content", "author_name", "comment_count", "created_at"]
 
 
 class QnAPostCreateSerializer(serializers.ModelSerializer):
@@ -122,7 +129,11 @@ class AssignmentListSerializer(serializers.ModelSerializer):
         user = self.context.get("request") and self.context["request"].user
         if not user or not user.is_authenticated:
             return None
-        sub = obj.submissions.filter(student=user).first()
+        # views.with_submissions()로 prefetch된 경우 추가 쿼리 없음
+        if hasattr(obj, "my_submissions"):
+            sub = obj.my_submissions[0] if obj.my_submissions else None
+        else:
+            sub = obj.submissions.filter(student=user).first()
         if not sub:
             return None
         return SubmissionSerializer(sub).data
@@ -137,11 +148,11 @@ class AssignmentDetailSerializer(AssignmentListSerializer):
     def get_submissions(self, obj):
         user = self.context["request"].user
         if user.role == "INSTRUCTOR" or user.is_staff:
-            return SubmissionSerializer(obj.submissions.all(), many=True).data
+            subs = obj.all_submissions if hasattr(obj, "all_submissions") else obj.submissions.all()
+            return SubmissionSerializer(subs, many=True).data
         # STUDENT: 본인 제출만
-        return SubmissionSerializer(
-            obj.submissions.filter(student=user), many=True
-        ).data
+        subs = obj.my_submissions if hasattr(obj, "my_submissions") else obj.submissions.filter(student=user)
+        return SubmissionSerializer(subs, many=True).data
 
 
 class AssignmentCreateSerializer(serializers.ModelSerializer):
@@ -209,6 +220,23 @@ class AttendanceMarkSerializer(serializers.Serializer):
     status = serializers.ChoiceField(choices=["PRESENT", "ABSENT", "LATE"])
 
 
+class AttendanceBulkMarkSerializer(serializers.Serializer):
+    """
+    records: [{student_id, status}, ...]
+    default_status: 지정하면 records에 없는 명단 전원에게 적용 (예: "PRESENT" → 전원 출석, records만 예외)
+    """
+    records = AttendanceMarkSerializer(many=True, required=False, default=list)
+    default_status = serializers.ChoiceField(choices=["PRESENT", "ABSENT", "LATE"], required=False)
+
+    def validate(self, attrs):
+        if not attrs["records"] and not attrs.get("default_status"):
+            raise serializers.ValidationError("records 또는 default_status 중 하나는 필요합니다.")
+        ids = [r["student_id"] for r in attrs["records"]]
+        if len(ids) != len(set(ids)):
+            raise serializers.ValidationError({"records": "같은 학생이 두 번 이상 포함되어 있습니다."})
+        return attrs
+
+
 # ── StudentGroup ────────────────────────────
 
 class GroupMemberSerializer(serializers.Serializer):
@@ -227,7 +255,9 @@ class StudentGroupSerializer(serializers.ModelSerializer):
         fields = ["id", "track", "name", "members", "member_count", "created_by_name", "created_at"]
 
     def get_member_count(self, obj):
-        return obj.members.count()
+        # views에서 annotate한 값이 있으면 사용, 없으면 prefetch된 members로 계산
+        count = getattr(obj, "member_count", None)
+        return count if count is not None else len(obj.members.all())
 
 
 class StudentGroupCreateSerializer(serializers.ModelSerializer):
@@ -240,6 +270,21 @@ class StudentGroupMembersSerializer(serializers.Serializer):
     member_ids = serializers.ListField(child=serializers.IntegerField(), allow_empty=True)
 
 
+class StudentGroupRegroupSerializer(serializers.Serializer):
+    """트랙 전체 그룹 배정: { track, groups: { "<group_id>": [member_id, ...] } }"""
+    track = serializers.ChoiceField(choices=TRACK_ALL)
+    groups = serializers.DictField(
+        child=serializers.ListField(child=serializers.IntegerField(), allow_empty=True),
+        allow_empty=False,
+    )
+
+    def validate_groups(self, value):
+        try:
+            return {int(group_id): set(member_ids) for group_id, member_ids in value.items()}
+        except (TypeError, ValueError):
+            raise serializers.ValidationError("group ids must be integers")
+
+
 # ── ClassReview ────────────────────────────
 
 class ClassReviewSerializer(serializers.ModelSerializer):
@@ -268,39 +313,44 @@ class HomeworkSubmissionSerializer(serializers.ModelSerializer):
         fields = ["id", "student_id", "student_name", "pdf_url", "submitted_at"]
 
     def get_pdf_url(self, obj):
+        if not obj.pdf_file:
+            return None
+        url = obj.pdf_file.url
         request = self.context.get("request")
-        if request and obj.pdf_file:
-            return request.build_absolute_uri(obj.pdf_file.url)
-        return obj.pdf_file.url if obj.pdf_file else None
+        if not request or not url.startswith("/"):
+            return url
+        # 응답 안의 모든 제출물이 같은 호스트를 쓰므로 절대 URL 접두어는 한 번만 계산
+        base = self.context.get("absolute_base")
+        if base is None:
+            base = self.context["absolute_base"] = request.build_absolute_uri("/").rstrip("/")
+        return base + url
 
 
 class HomeworkCategorySerializer(serializers.ModelSerializer):
+    """
+    제출물 목록은 포함하지 않음 (강사는 카테고리별로 homework-categories/<id>/submissions/ 조회)
+    - submission_count: views에서 annotate, my_submissions: views에서 prefetch
+    """
     created_by_name = serializers.CharField(source="created_by.name", read_only=True)
-    submissions = serializers.SerializerMethodField()
     my_submission = serializers.SerializerMethodField()
-    submission_count = serializers.IntegerField(source="submissions.count", read_only=True)
+    submission_count = serializers.IntegerField(read_only=True, default=0)
 
     class Meta:
         model = HomeworkCategory
         fields = [
             "id", "track", "title", "week",
             "created_by_name", "created_at",
-            "submission_count", "submissions", "my_submission",
+            "submission_count", "my_submission",
         ]
 
-    def get_submissions(self, obj):
-        user = self.context.get("request") and self.context["request"].user
-        if user and (user.role == "INSTRUCTOR" or user.is_staff):
-            return HomeworkSubmissionSerializer(
-                obj.submissions.all(), many=True, context=self.context
-            ).data
-        return []
-
     def get_my_submission(self, obj):
         user = self.context.get("request") and self.context["request"].user
         if not user or not user.is_authenticated:
             return None
-        sub = obj.submissions.filter(student=user).first()
+        if hasattr(obj, "my_submissions"):
+            sub = obj.my_submissions[0] if obj.my_submissions else None
+        else:
+            sub = obj.submissions.filter(student=user).first()
         if not sub:
             return None
         return HomeworkSubmissionSerializer(sub, context=self.context).data
@@ -0,0 +1,30 @@
+"""
+피드 동기화(?since=) 기록 — 모델 delete()/save() 대신 시그널로 처리
+
+- post_delete는 queryset.delete(), 관리자 일괄 삭제, 작성자 삭제에 따른 CASCADE 에서도 호출됨
+  → 삭제된 퀴즈/Q&A/과제/공지는 항상 SyncTombstone에 기록
+- Q&A 댓글이 바뀌면 글의 updated_at을 갱신 → 모두에게 보이는 comment_count 변경이 증분 동기화에 포함
+  (퀴즈 답변·과제 제출은 본인에게만 보이는 값이므로 상위 항목을 갱신하지 않음
+   → 요청자 본인의 변경분은 views에서 changes_response(mine=...)로 따로 포함)
+- queryset.update()/bulk_* 는 시그널이 없으므로 필요하면 직접 처리
+"""
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from django.utils import timezone
+
+from .models import Announcement, Assignment, QnAComment, QnAPost, Quiz, SyncTombstone
+
+
+@receiver(post_delete, sender=Quiz)
+@receiver(post_delete, sender=QnAPost)
+@receiver(post_delete, sender=Assignment)
+@receiver(post_delete, sender=Announcement)
+def record_tombstone(sender, instance, **kwargs):
+    SyncTombstone.record(instance)
+
+
+@receiver(post_save, sender=QnAComment)
+@receiver(post_delete, sender=QnAComment)
+def touch_qna_post(sender, instance, **kwargs):
+    # 글이 함께 CASCADE 삭제되는 중이면 갱신할 행이 없어 아무 일도 없음
+    QnAPost.objects.filter(pk=instance.post_id).update(updated_at=timezone.now())
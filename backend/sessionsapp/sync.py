@@ -0,0 +1,78 @@
+"""
+세션 피드 증분 동기화 (?since=)
+
+- 목록 API(퀴즈/Q&A/과제/공지)에 ?since=<cursor> 를 붙이면 cursor 이후 생성·수정된 항목과
+  삭제된 항목 id만 반환: {"results": [...], "deleted": [id, ...], "cursor": "..."}
+- 처음에는 ?since=0 으로 전체를 받고, 이후에는 응답의 cursor를 다음 요청의 since로 사용
+- cursor는 UTC ISO 시각 (유닉스 타임스탬프 숫자도 허용)
+- 아직 커밋되지 않은 저장을 놓치지 않도록 cursor를 SYNC_OVERLAP 만큼 앞당겨 반환
+  → 같은 항목이 다음 응답에 한 번 더 올 수 있으므로 클라이언트는 id 기준으로 덮어씀
+- since가 삭제 기록 보존 기간(SyncTombstone.RETENTION)보다 오래되면 삭제 목록을 보장할 수 없으므로
+  전체 목록과 "reset": true 를 반환 → 클라이언트는 목록을 통째로 교체
+"""
+from datetime import datetime, timedelta, timezone as dt_timezone
+
+from django.db.models import Q
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+from rest_framework.exceptions import ValidationError
+from rest_framework.response import Response
+
+from .models import SyncTombstone
+
+SINCE_PARAM = "since"
+SYNC_OVERLAP = timedelta(seconds=5)
+
+
+def parse_since(request):
+    """?since= 값 → aware datetime (없으면 None, 형식이 틀리면 400)"""
+    raw = request.query_params.get(SINCE_PARAM)
+    if raw is None:
+        return None
+    try:
+        return datetime.fromtimestamp(float(raw), tz=dt_timezone.utc)
+    except (ValueError, OverflowError, OSError):
+        pass
+    # 쿼리스트링에서 인코딩되지 않은 '+'는 공백으로 들어옴
+    try:
+        value = parse_datetime(raw.strip().replace(" ", "+"))
+    except ValueError:
+        # 형식은 맞지만 범위를 벗어난 값 (2024-13-45T00:00:00 등)
+        value = None
+    if value is None:
+        raise ValidationError({SINCE_PARAM: "시각(ISO 8601) 또는 이전 응답의 cursor를 입력하세요."})
+    if timezone.is_naive(value):
+        value = timezone.make_aware(value, dt_timezone.utc)
+    return value
+
+
+def encode_cursor(at):
+    return at.astimezone(dt_timezone.utc).isoformat().replace("+00:00", "Z")
+
+
+def changes_response(qs, kind, track, since, serialize, mine=None):
+    """
+    since 이후 변경분 응답
+    - qs: 목록과 같은 조건(트랙 필터, select_related 등)이 적용된 queryset (updated_at 필드 필요)
+    - serialize: 항목 목록 → 직렬화된 list
+    - mine: 요청자에게만 보이는 값(my_answer 등)이 since 이후 바뀐 항목 id queryset
+      → 다른 사용자의 답변으로 항목 자체가 갱신되지 않으므로 본인 변경분만 따로 포함
+    """
+    now = timezone.now()
+    cursor = now - SYNC_OVERLAP
+    if since < now - SyncTombstone.RETENTION:
+        return Response({"results": serialize(qs), "deleted": [], "cursor": encode_cursor(cursor), "reset": True})
+
+    changed = Q(updated_at__gte=since)
+    if mine is not None:
+        changed |= Q(id__in=mine)
+    rows = qs.filter(changed)
+    deleted = SyncTombstone.objects.filter(kind=kind, deleted_at__gte=since)
+    if track:
+        deleted = deleted.filter(track=track)
+    return Response({
+        "results": serialize(rows),
+        "deleted": sorted(set(deleted.values_list("object_id", flat=True))),
+        "cursor": encode_cursor(cursor),
+        "reset": False,
+    })
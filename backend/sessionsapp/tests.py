@@ -1,3 +1,79 @@
+from django.contrib.auth import get_user_model
 from django.test import TestCase
+from rest_framework.test import APIClient
 
-# Create your tests here.
+from .models import Quiz, QuizAnswer
+
+User = get_user_model()
+
+
+def make_user(email, role="STUDENT"):
+    return User.objects.create_user(
+        email=email, password="pw", name=email.split("@")[0],
+        student_id="20240000", department="컴퓨터공학과",
+        role=role, education_track="FULLSTACK",
+    )
+
+
+class QuizListQueryCountTest(TestCase):
+    """퀴즈 목록/상세는 퀴즈·답변 수와 무관하게 쿼리 수가 일정해야 함 (작성자 + 내 답변 prefetch)"""
+
+    LIST_QUERIES = 2
+    DETAIL_QUERIES = 2
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.instructor = make_user("inst@test.com", role="INSTRUCTOR")
+        cls.student = make_user("me@test.com")
+        cls.others = [make_user(f"other{i}@test.com") for i in range(3)]
+
+    def setUp(self):
+        self.client = APIClient()
+        self.client.force_authenticate(self.student)
+
+    def add_quizzes(self, count):
+        start = Quiz.objects.count()
+        quizzes = Quiz.objects.bulk_create([
+            Quiz(
+                track="FULLSTACK", title=f"퀴즈 {start + i}", question="?",
+                option_1="1", option_2="2", option_3="3", option_4="4", option_5="5",
+                correct_option=1, created_by=self.instructor,
+            )
+            for i in range(count)
+        ])
+        answers = []
+        for quiz in quizzes:
+            # 내 답변은 2번, 다른 학생들은 1번 → my_answer가 남의 답변이면 is_correct가 True가 됨
+            answers.append(QuizAnswer(quiz=quiz, student=self.student, selected_option=2, is_correct=False))
+            answers += [
+                QuizAnswer(quiz=quiz, student=other, selected_option=1, is_correct=True)
+                for other in self.others
+            ]
+        QuizAnswer.objects.bulk_create(answers)
+        return quizzes
+
+    def assert_my_answer(self, item):
+        self.assertEqual(item["my_answer"], {"selected_option": 2, "is_correct": False})
+
+    def test_list_query_count_is_constant(self):
+        for total in (5, 40):
+            self.add_quizzes(total - Quiz.objects.count())
+            with self.assertNumQueries(self.LIST_QUERIES):
+                res = self.client.get("/api/sessions/quizzes/", {"track": "FULLSTACK"})
+            self.assertEqual(res.status_code, 200)
+            self.assertEqual(len(res.data), total)
+            for item in res.data:
+                self.assert_my_answer(item)
+
+    def test_detail_query_count(self):
+        quiz = self.add_quizzes(5)[0]
+        with self.assertNumQueries(self.DETAIL_QUERIES):
+            res = self.client.get(f"/api/sessions/quizzes/{quiz.pk}/")
+        self.assertEqual(res.status_code, 200)
+        self.assert_my_answer(res.data)
+
+    def test_unanswered_quiz_has_no_answer(self):
+        quiz = self.add_quizzes(1)[0]
+        QuizAnswer.objects.filter(quiz=quiz, student=self.student).delete()
+        res = self.client.get(f"/api/sessions/quizzes/{quiz.pk}/")
+        self.assertIsNone(res.data["my_answer"])
@@ -4,6 +4,7 @@ from . import views
 urlpatterns = [
     # Quiz
     path("quizzes/", views.quiz_list_create),
+    path("quizzes/stats/", views.quiz_stats),
     path("quizzes/<int:pk>/", views.quiz_detail),
     path("quizzes/<int:pk>/answer/", views.quiz_answer),
     # Q&A
@@ -19,10 +20,13 @@ urlpatterns = [
     path("announcements/", views.announcement_list_create),
     # Attendance (출석부)
     path("attendance/", views.attendance_session_list_create),
+    path("attendance/matrix/", views.attendance_matrix),
     path("attendance/<int:pk>/", views.attendance_session_detail),
     path("attendance/<int:pk>/mark/", views.attendance_mark),
+    path("attendance/<int:pk>/mark-bulk/", views.attendance_mark_bulk),
     # Groups (학생 그룹)
     path("groups/", views.group_list_create),
+    path("groups/regroup/", views.group_regroup),
     path("groups/<int:pk>/", views.group_delete),
     path("groups/<int:pk>/members/", views.group_update_members),
     path("students/", views.track_students),
@@ -33,6 +37,8 @@ urlpatterns = [
     # Homework Gallery (과제 갤러리 - 풀스택 PDF 제출)
     path("homework-categories/", views.homework_category_list_create),
     path("homework-categories/<int:pk>/", views.homework_category_delete),
+    path("homework-categories/<int:pk>/submissions/", views.homework_category_submissions),
+    path("homework-categories/<int:pk>/download.zip", views.homework_category_download),
     path("homework-categories/<int:pk>/submit/", views.homework_submit),
     path("homework-submissions/<int:pk>/", views.homework_submission_delete),
 ]
@@ -1,28 +1,42 @@
+from collections import Counter
+from functools import partial
+
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Count, Prefetch, Q
+from django.http import StreamingHttpResponse
 from django.utils import timezone
+from django.utils.http import content_disposition_header
 from rest_framework import status
 from rest_framework.decorators import api_view, permission_classes
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 
 from django.contrib.auth import get_user_model
+from applications.pagination import KeysetPagination
 from applications.permissions import IsInstructorOrStaff
 from .models import (
     Quiz, QuizAnswer, QnAPost, QnAComment,
     Assignment, AssignmentSubmission, Announcement,
-    AttendanceSession, AttendanceRecord,
+    AttendanceSession, AttendanceRecord, AttendanceVersion,
     StudentGroup, ClassReview,
     HomeworkCategory, HomeworkSubmission,
+    QuizStatsVersion,
+    TRACK_ALL, TRACK_FS,
 )
+from .archives import stream_zip
+from .sync import changes_response, parse_since
 from .serializers import (
     QuizListSerializer, QuizDetailSerializer, QuizCreateSerializer, QuizAnswerSerializer,
     QnAPostListSerializer, QnAPostDetailSerializer, QnAPostCreateSerializer,
-    QnACommentCreateSerializer,
+    QnACommentSerializer, QnACommentCreateSerializer,
     AssignmentListSerializer, AssignmentDetailSerializer, AssignmentCreateSerializer,
     SubmissionCreateSerializer, SubmissionSerializer,
     AnnouncementSerializer, AnnouncementCreateSerializer,
     AttendanceSessionListSerializer, AttendanceSessionDetailSerializer,
-    AttendanceSessionCreateSerializer, AttendanceMarkSerializer,
+    AttendanceSessionCreateSerializer, AttendanceMarkSerializer, AttendanceBulkMarkSerializer,
     StudentGroupSerializer, StudentGroupCreateSerializer, StudentGroupMembersSerializer,
+    StudentGroupRegroupSerializer,
     ClassReviewSerializer, ClassReviewWriteSerializer,
     HomeworkCategorySerializer, HomeworkCategoryCreateSerializer,
     HomeworkSubmissionSerializer,
@@ -33,20 +47,38 @@ User = get_user_model()
 
 # ── Quiz ──────────────────────────────────
 
+def with_my_answer(qs, user):
+    """작성자 + 요청자의 답변(my_answers)을 함께 로드 → 퀴즈 수와 무관하게 쿼리 2회"""
+    return qs.select_related("created_by").prefetch_related(
+        Prefetch("answers", queryset=QuizAnswer.objects.filter(student=user), to_attr="my_answers")
+    )
+
+
 @api_view(["GET", "POST"])
 @permission_classes([IsAuthenticated])
 def quiz_list_create(request):
+    """
+    GET: 퀴즈 목록 (?since= 이면 변경분만 — sessionsapp/sync.py)
+    """
     if request.method == "GET":
         track = request.query_params.get("track")
-        qs = Quiz.objects.all()
+        since = parse_since(request)
+        qs = with_my_answer(Quiz.objects.all(), request.user)
         if track:
             qs = qs.filter(track=track)
         # INSTRUCTOR는 correct_option 포함
         if request.user.role == "INSTRUCTOR" or request.user.is_staff:
-            ser = QuizDetailSerializer(qs, many=True, context={"request": request})
+            serializer_class = QuizDetailSerializer
         else:
-            ser = QuizListSerializer(qs, many=True, context={"request": request})
-        return Response(ser.data)
+            serializer_class = QuizListSerializer
+
+        def serialize(rows):
+            return serializer_class(rows, many=True, context={"request": request}).data
+
+        if since is not None:
+            mine = QuizAnswer.objects.filter(student=request.user, created_at__gte=since).values("quiz_id")
+            return changes_response(qs, "quiz", track, since, serialize, mine=mine)
+        return Response(serialize(qs))
 
     # POST — INSTRUCTOR only
     if request.user.role != "INSTRUCTOR" and not request.user.is_staff:
@@ -61,7 +93,7 @@ def quiz_list_create(request):
 @permission_classes([IsAuthenticated])
 def quiz_detail(request, pk):
     try:
-        quiz = Quiz.objects.get(pk=pk)
+        quiz = with_my_answer(Quiz.objects.all(), request.user).get(pk=pk)
     except Quiz.DoesNotExist:
         return Response(status=status.HTTP_404_NOT_FOUND)
     if request.user.role == "INSTRUCTOR" or request.user.is_staff:
@@ -100,18 +132,126 @@ def quiz_answer(request, pk):
     })
 
 
+QUIZ_OPTIONS = range(1, 6)
+QUIZ_STATS_CACHE_SECONDS = 60 * 60
+
+
+def _rate(correct, total):
+    return round(correct * 100 / total, 1) if total else None
+
+
+def build_quiz_stats(track):
+    """
+    트랙 퀴즈 통계 — QuizAnswer GROUP BY 3회 (퀴즈×보기 / 퀴즈 / 학생)
+    - quizzes: 최신순, distribution[i] = 보기 i+1 선택 수
+    - students: 트랙 수강생 전원 (답변 0개 포함) + 답변한 그 밖의 사용자
+    """
+    answers = QuizAnswer.objects.filter(quiz__track=track)
+
+    distribution = {}
+    for row in answers.values("quiz_id", "selected_option").annotate(n=Count("id")).order_by():
+        distribution.setdefault(row["quiz_id"], [0] * len(QUIZ_OPTIONS))[row["selected_option"] - 1] = row["n"]
+
+    per_quiz = {
+        row["quiz_id"]: row
+        for row in answers.values("quiz_id").annotate(
+            respondents=Count("id"), correct=Count("id", filter=Q(is_correct=True))
+        ).order_by()
+    }
+
+    quizzes = []
+    for quiz_id, title, correct_option in Quiz.objects.filter(track=track).values_list("id", "title", "correct_option"):
+        row = per_quiz.get(quiz_id, {"respondents": 0, "correct": 0})
+        quizzes.append({
+            "id": quiz_id,
+            "title": title,
+            "correct_option": correct_option,
+            "respondents": row["respondents"],
+            "correct": row["correct"],
+            "correct_rate": _rate(row["correct"], row["respondents"]),
+            "distribution": distribution.get(quiz_id, [0] * len(QUIZ_OPTIONS)),
+        })
+
+    per_student = {
+        row["student_id"]: row
+        for row in answers.values("student_id", "student__name").annotate(
+            answered=Count("id"), correct=Count("id", filter=Q(is_correct=True))
+        ).order_by()
+    }
+    names = dict(User.objects.filter(role="STUDENT", education_track=track).values_list("id", "name"))
+    names.update({student_id: row["student__name"] for student_id, row in per_student.items()})
+
+    students = []
+    for student_id, name in sorted(names.items(), key=lambda item: (item[1], item[0])):
+        row = per_student.get(student_id, {"answered": 0, "correct": 0})
+        students.append({
+            "id": student_id,
+            "name": name,
+            "answered": row["answered"],
+            "correct": row["correct"],
+            "correct_rate": _rate(row["correct"], row["answered"]),
+        })
+
+    return {"track": track, "quiz_count": len(quizzes), "quizzes": quizzes, "students": students}
+
+
+@api_view(["GET"])
+@permission_classes([IsInstructorOrStaff])
+def quiz_stats(request):
+    """
+    GET /api/sessions/quizzes/stats/?track=FULLSTACK — 퀴즈별 보기 분포·정답률, 학생별 답변/정답 수
+    트랙별 QuizStatsVersion을 키로 캐시 (새 답변이 저장되면 자동으로 새로 계산)
+    """
+    track = request.query_params.get("track")
+    if track not in dict(TRACK_FS):
+        return Response({"detail": "track이 올바르지 않습니다."}, status=status.HTTP_400_BAD_REQUEST)
+
+    key = f"quiz-stats:{track}:{QuizStatsVersion.current(track)}"
+    data = cache.get(key)
+    if data is None:
+        data = build_quiz_stats(track)
+        cache.set(key, data, QUIZ_STATS_CACHE_SECONDS)
+    return Response(data)
+
+
 # ── Q&A ───────────────────────────────────
 
+# 게시글: 최신순 / 댓글: 작성순 (마지막 키 id로 같은 시각 정렬 고정)
+QNA_POST_KEYS = [("created_at", True, False), ("id", True, False)]
+QNA_COMMENT_KEYS = [("created_at", False, False), ("id", False, False)]
+
+
+class QnACommentPagination(KeysetPagination):
+    page_size = 50
+    max_page_size = 200
+
+
+def qna_posts():
+    """작성자 + 댓글 수를 한 쿼리로"""
+    return QnAPost.objects.select_related("author").annotate(comment_count=Count("comments"))
+
+
 @api_view(["GET", "POST"])
 @permission_classes([IsAuthenticated])
 def qna_list_create(request):
+    """
+    GET: 커서 페이지네이션 {next, previous, results} (?cursor=, ?page_size= 기본 20)
+         ?since= 이면 페이지네이션 없이 변경분만 — sessionsapp/sync.py
+    """
     if request.method == "GET":
         track = request.query_params.get("track")
-        qs = QnAPost.objects.all()
+        since = parse_since(request)
+        qs = qna_posts()
         if track:
             qs = qs.filter(track=track)
-        ser = QnAPostListSerializer(qs, many=True)
-        return Response(ser.data)
+        if since is not None:
+            return changes_response(
+                qs, "qna", track, since, lambda rows: QnAPostListSerializer(rows, many=True).data
+            )
+        paginator = KeysetPagination(QNA_POST_KEYS)
+        page = paginator.paginate_queryset(qs, request)
+        ser = QnAPostListSerializer(page, many=True)
+        return paginator.get_paginated_response(ser.data)
 
     ser = QnAPostCreateSerializer(data=request.data)
     ser.is_valid(raise_exception=True)
@@ -122,12 +262,22 @@ def qna_list_create(request):
 @api_view(["GET"])
 @permission_classes([IsAuthenticated])
 def qna_detail(request, pk):
+    """
+    게시글 + 댓글 한 페이지 (작성순 50개)
+    - 다음 댓글: ?cursor=<comments_next>
+    """
     try:
-        post = QnAPost.objects.prefetch_related("comments__author").get(pk=pk)
+        post = qna_posts().get(pk=pk)
     except QnAPost.DoesNotExist:
         return Response(status=status.HTTP_404_NOT_FOUND)
-    ser = QnAPostDetailSerializer(post)
-    return Response(ser.data)
+
+    paginator = QnACommentPagination(QNA_COMMENT_KEYS)
+    comments = paginator.paginate_queryset(post.comments.select_related("author"), request)
+
+    data = QnAPostDetailSerializer(post).data
+    data["comments"] = QnACommentSerializer(comments, many=True).data
+    data["comments_next"] = paginator.next_cursor
+    return Response(data)
 
 
 @api_view(["POST"])
@@ -146,16 +296,42 @@ def qna_comment_create(request, pk):
 
 # ── Assignment ────────────────────────────
 
+def with_submissions(qs, user, include_all=False):
+    """
+    작성자 + 요청자의 제출(my_submissions)을 함께 로드
+    - include_all=True: 전체 제출(all_submissions)도 로드 (강사용 상세)
+    - 제출자/확인자(read_by)까지 select_related → 과제·제출 수와 무관하게 쿼리 수 고정
+    """
+    subs = AssignmentSubmission.objects.select_related("student", "read_by")
+    prefetches = [Prefetch("submissions", queryset=subs.filter(student=user), to_attr="my_submissions")]
+    if include_all:
+        prefetches.append(Prefetch("submissions", queryset=subs.order_by("submitted_at"), to_attr="all_submissions"))
+    return qs.select_related("created_by").prefetch_related(*prefetches)
+
+
 @api_view(["GET", "POST"])
 @permission_classes([IsAuthenticated])
 def assignment_list_create(request):
+    """
+    GET: 과제 목록 (?since= 이면 변경분만 — sessionsapp/sync.py)
+    """
     if request.method == "GET":
         track = request.query_params.get("track")
-        qs = Assignment.objects.all()
+        since = parse_since(request)
+        qs = with_submissions(Assignment.objects.all(), request.user)
         if track:
             qs = qs.filter(track=track)
-        ser = AssignmentListSerializer(qs, many=True, context={"request": request})
-        return Response(ser.data)
+
+        def serialize(rows):
+            return AssignmentListSerializer(rows, many=True, context={"request": request}).data
+
+        if since is not None:
+            # 본인 제출/재제출(submitted_at) 또는 강사 확인(read_at)
+            mine = AssignmentSubmission.objects.filter(
+                Q(submitted_at__gte=since) | Q(read_at__gte=since), student=request.user
+            ).values("assignment_id")
+            return changes_response(qs, "assignment", track, since, serialize, mine=mine)
+        return Response(serialize(qs))
 
     if request.user.role != "INSTRUCTOR" and not request.user.is_staff:
         return Response({"detail": "권한이 없습니다."}, status=status.HTTP_403_FORBIDDEN)
@@ -168,8 +344,9 @@ def assignment_list_create(request):
 @api_view(["GET"])
 @permission_classes([IsAuthenticated])
 def assignment_detail(request, pk):
+    is_instructor = request.user.role == "INSTRUCTOR" or request.user.is_staff
     try:
-        assignment = Assignment.objects.prefetch_related("submissions__student").get(pk=pk)
+        assignment = with_submissions(Assignment.objects.all(), request.user, include_all=is_instructor).get(pk=pk)
     except Assignment.DoesNotExist:
         return Response(status=status.HTTP_404_NOT_FOUND)
     ser = AssignmentDetailSerializer(assignment, context={"request": request})
@@ -214,11 +391,19 @@ def submission_mark_read(request, pk):
 @api_view(["GET", "POST"])
 @permission_classes([IsAuthenticated])
 def announcement_list_create(request):
+    """
+    GET: 공지 목록 (?since= 이면 변경분만 — sessionsapp/sync.py)
+    """
     if request.method == "GET":
         track = request.query_params.get("track")
-        qs = Announcement.objects.all()
+        since = parse_since(request)
+        qs = Announcement.objects.select_related("author")
         if track:
             qs = qs.filter(track=track)
+        if since is not None:
+            return changes_response(
+                qs, "announcement", track, since, lambda rows: AnnouncementSerializer(rows, many=True).data
+            )
         ser = AnnouncementSerializer(qs, many=True)
         return Response(ser.data)
 
@@ -232,6 +417,13 @@ def announcement_list_create(request):
 
 # ── Attendance ──────────────────────────────
 
+def attendance_session_with_records():
+    """작성자 join + 명단(학생 join) prefetch → 쿼리 2회"""
+    return AttendanceSession.objects.select_related("created_by").prefetch_related(
+        Prefetch("records", queryset=AttendanceRecord.objects.select_related("student"))
+    )
+
+
 @api_view(["GET", "POST"])
 @permission_classes([IsAuthenticated])
 def attendance_session_list_create(request):
@@ -259,35 +451,102 @@ def attendance_session_list_create(request):
         AttendanceRecord(session=att_session, student=s, status="ABSENT")
         for s in students
     ], ignore_conflicts=True)
+    AttendanceVersion.bump(att_session.track)
 
     detail_ser = AttendanceSessionDetailSerializer(att_session)
     return Response(detail_ser.data, status=status.HTTP_201_CREATED)
 
 
+# 출석 매트릭스 셀 값 (기록 없음 = null)
+ATTENDANCE_CODES = {"ABSENT": 0, "PRESENT": 1, "LATE": 2}
+ATTENDANCE_MATRIX_CACHE_SECONDS = 60 * 60
+
+
+def build_attendance_matrix(track):
+    """
+    트랙 전체 출석 현황 (학생 × 세션)
+    - sessions: 날짜 오름차순 [[id, title, date], ...]
+    - students: [[id, name, student_id], ...]
+    - matrix[i][j]: students[i]의 sessions[j] 상태 코드 (ATTENDANCE_CODES, 기록 없으면 null)
+    - stats[i]: [PRESENT, LATE, ABSENT, 출석률(%, 지각 포함)] — 학생·상태별 GROUP BY 한 번으로 계산
+    """
+    sessions = list(
+        AttendanceSession.objects.filter(track=track)
+        .order_by("date", "created_at")
+        .values_list("id", "title", "date")
+    )
+    students = list(
+        User.objects.filter(attendance_records__session__track=track)
+        .distinct()
+        .order_by("name", "id")
+        .values_list("id", "name", "student_id")
+    )
+    col = {session_id: j for j, (session_id, _, _) in enumerate(sessions)}
+    row = {student_id: i for i, (student_id, _, _) in enumerate(students)}
+
+    # 조회 사이에 추가된 세션/학생(출석부 생성·승급)의 기록은 이번 응답에서 제외
+    records = AttendanceRecord.objects.filter(session_id__in=list(col))
+    matrix = [[None] * len(sessions) for _ in students]
+    for student_id, session_id, st in records.values_list("student_id", "session_id", "status"):
+        i = row.get(student_id)
+        if i is not None:
+            matrix[i][col[session_id]] = ATTENDANCE_CODES[st]
+
+    counts = [{"PRESENT": 0, "LATE": 0, "ABSENT": 0} for _ in students]
+    grouped = records.values("student_id", "status").annotate(n=Count("id")).order_by()
+    for g in grouped:
+        i = row.get(g["student_id"])
+        if i is not None:
+            counts[i][g["status"]] = g["n"]
+
+    stats = []
+    for c in counts:
+        total = c["PRESENT"] + c["LATE"] + c["ABSENT"]
+        rate = round((c["PRESENT"] + c["LATE"]) * 100 / total, 1) if total else None
+        stats.append([c["PRESENT"], c["LATE"], c["ABSENT"], rate])
+
+    return {
+        "track": track,
+        "codes": {str(code): st for st, code in ATTENDANCE_CODES.items()},
+        "stat_fields": ["present", "late", "absent", "attendance_rate"],
+        "sessions": [[session_id, title, d.isoformat()] for session_id, title, d in sessions],
+        "students": [list(s) for s in students],
+        "matrix": matrix,
+        "stats": stats,
+    }
+
+
+@api_view(["GET"])
+@permission_classes([IsInstructorOrStaff])
+def attendance_matrix(request):
+    """
+    GET /api/sessions/attendance/matrix/?track=FULLSTACK — 트랙 전체 출석 현황 + 학생별 통계
+    트랙별 AttendanceVersion을 키로 캐시 (출석 기록/세션이 바뀌면 자동으로 새로 계산)
+    """
+    track = request.query_params.get("track")
+    if track not in dict(TRACK_ALL):
+        return Response({"detail": "track이 올바르지 않습니다."}, status=status.HTTP_400_BAD_REQUEST)
+
+    key = f"attendance-matrix:{track}:{AttendanceVersion.current(track)}"
+    data = cache.get(key)
+    if data is None:
+        data = build_attendance_matrix(track)
+        cache.set(key, data, ATTENDANCE_MATRIX_CACHE_SECONDS)
+    return Response(data)
+
+
 @api_view(["GET"])
 @permission_classes([IsAuthenticated])
 def attendance_session_detail(request, pk):
     """
     GET /api/sessions/attendance/<id>/  — 출석 세션 상세 (출석 명단 포함)
-    세션 생성 이후 신규 등록 학생도 자동 추가
+    세션 생성 이후 등록된 학생은 STUDENT 승격 시점에 명단에 추가됨 (AttendanceRecord.enroll_students)
     """
     try:
-        att_session = AttendanceSession.objects.prefetch_related("records__student").get(pk=pk)
+        att_session = attendance_session_with_records().get(pk=pk)
     except AttendanceSession.DoesNotExist:
         return Response(status=status.HTTP_404_NOT_FOUND)
 
-    # 해당 트랙 신규 수강생 자동 보완
-    existing_ids = set(att_session.records.values_list("student_id", flat=True))
-    new_students = User.objects.filter(
-        role="STUDENT", education_track=att_session.track
-    ).exclude(id__in=existing_ids)
-    if new_students.exists():
-        AttendanceRecord.objects.bulk_create([
-            AttendanceRecord(session=att_session, student=s, status="ABSENT")
-            for s in new_students
-        ], ignore_conflicts=True)
-        att_session = AttendanceSession.objects.prefetch_related("records__student").get(pk=pk)
-
     ser = AttendanceSessionDetailSerializer(att_session)
     return Response(ser.data)
 
@@ -320,8 +579,70 @@ def attendance_mark(request, pk):
     return Response(AttendanceRecordSerializer(record).data)
 
 
+@api_view(["POST"])
+@permission_classes([IsInstructorOrStaff])
+def attendance_mark_bulk(request, pk):
+    """
+    POST /api/sessions/attendance/<id>/mark-bulk/
+    body: { records: [{ student_id, status }, ...], default_status?: "PRESENT"|"ABSENT"|"LATE" }
+    - default_status: records에 없는 명단 전원에게 적용 ("전원 출석, 일부만 예외")
+    - (session, student) 기준 upsert 한 번으로 status/marked_by/marked_at 갱신 → 갱신된 출석부 반환
+    """
+    try:
+        att_session = AttendanceSession.objects.get(pk=pk)
+    except AttendanceSession.DoesNotExist:
+        return Response(status=status.HTTP_404_NOT_FOUND)
+
+    ser = AttendanceBulkMarkSerializer(data=request.data)
+    ser.is_valid(raise_exception=True)
+    statuses = {r["student_id"]: r["status"] for r in ser.validated_data["records"]}
+    default_status = ser.validated_data.get("default_status")
+
+    # 명단에 없는 학생은 해당 트랙 수강생일 때만 허용
+    roster_ids = set(AttendanceRecord.objects.filter(session=att_session).values_list("student_id", flat=True))
+    outside = set(statuses) - roster_ids
+    if outside:
+        allowed = set(User.objects.filter(
+            id__in=outside, role="STUDENT", education_track=att_session.track,
+        ).values_list("id", flat=True))
+        invalid = sorted(outside - allowed)
+        if invalid:
+            return Response(
+                {"detail": "이 출석 세션의 수강생이 아닙니다.", "student_ids": invalid},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+    if default_status:
+        for student_id in roster_ids:
+            statuses.setdefault(student_id, default_status)
+
+    AttendanceRecord.objects.bulk_create(
+        [
+            AttendanceRecord(session=att_session, student_id=student_id, status=st, marked_by=request.user)
+            for student_id, st in statuses.items()
+        ],
+        update_conflicts=True,
+        unique_fields=["session", "student"],
+        update_fields=["status", "marked_by", "marked_at"],
+        batch_size=500,
+    )
+    AttendanceVersion.bump(att_session.track)
+
+    att_session = attendance_session_with_records().get(pk=pk)
+    return Response(AttendanceSessionDetailSerializer(att_session).data)
+
+
 # ── StudentGroup ──────────────────────────────
 
+def student_groups():
+    """작성자 join + 멤버 수 annotate + 멤버 prefetch → 그룹 수와 무관하게 쿼리 2회"""
+    return (
+        StudentGroup.objects.select_related("created_by")
+        .annotate(member_count=Count("members", distinct=True))
+        .prefetch_related("members")
+    )
+
+
 @api_view(["GET", "POST"])
 @permission_classes([IsAuthenticated])
 def group_list_create(request):
@@ -331,7 +652,7 @@ def group_list_create(request):
     """
     if request.method == "GET":
         track = request.query_params.get("track")
-        qs = StudentGroup.objects.prefetch_related("members")
+        qs = student_groups()
         if track:
             qs = qs.filter(track=track)
         return Response(StudentGroupSerializer(qs, many=True).data)
@@ -372,6 +693,75 @@ def group_update_members(request, pk):
     return Response(StudentGroupSerializer(group).data)
 
 
+@api_view(["POST"])
+@permission_classes([IsInstructorOrStaff])
+def group_regroup(request):
+    """
+    POST /api/sessions/groups/regroup/
+    body: { track: "FULLSTACK", groups: { "<group_id>": [member_id, ...], ... } }
+
+    - 트랙의 전체 그룹 배정을 한 번에 적용 (한 트랜잭션)
+    - body에 없는 해당 트랙 그룹은 멤버를 비움
+    - 모든 그룹은 track 소속, 모든 멤버는 education_track이 같은 STUDENT여야 함
+    - 한 멤버는 한 그룹에만 배정 가능
+    - 변경분만 through 테이블에 일괄 DELETE / bulk INSERT
+    """
+    ser = StudentGroupRegroupSerializer(data=request.data)
+    ser.is_valid(raise_exception=True)
+    track = ser.validated_data["track"]
+    assignment = ser.validated_data["groups"]
+
+    track_group_ids = set(StudentGroup.objects.filter(track=track).values_list("id", flat=True))
+    unknown_groups = sorted(set(assignment) - track_group_ids)
+    if unknown_groups:
+        return Response(
+            {"detail": "해당 트랙의 그룹이 아닙니다.", "group_ids": unknown_groups},
+            status=status.HTTP_400_BAD_REQUEST,
+        )
+
+    # 한 학생을 여러 그룹에 넣은 요청은 클라이언트 오류로 보고 거부
+    seen = Counter(m for members in assignment.values() for m in set(members))
+    duplicated = sorted(m for m, n in seen.items() if n > 1)
+    if duplicated:
+        return Response(
+            {"detail": "한 학생이 여러 그룹에 배정되어 있습니다.", "member_ids": duplicated},
+            status=status.HTTP_400_BAD_REQUEST,
+        )
+
+    member_ids = set(seen)
+    valid_ids = set(
+        User.objects.filter(id__in=member_ids, role="STUDENT", education_track=track).values_list("id", flat=True)
+    )
+    invalid_members = sorted(member_ids - valid_ids)
+    if invalid_members:
+        return Response(
+            {"detail": "해당 트랙의 학생이 아닙니다.", "member_ids": invalid_members},
+            status=status.HTTP_400_BAD_REQUEST,
+        )
+
+    Membership = StudentGroup.members.through
+    desired = {(g, m) for g in track_group_ids for m in assignment.get(g, ())}
+
+    with transaction.atomic():
+        current = {
+            (g, m): pk
+            for pk, g, m in Membership.objects.filter(studentgroup_id__in=track_group_ids)
+            .values_list("id", "studentgroup_id", "user_id")
+        }
+        removed = [pk for pair, pk in current.items() if pair not in desired]
+        added = [Membership(studentgroup_id=g, user_id=m) for g, m in desired - current.keys()]
+        if removed:
+            Membership.objects.filter(id__in=removed).delete()
+        Membership.objects.bulk_create(added, batch_size=500)
+
+    groups = student_groups().filter(track=track)
+    return Response({
+        "added": len(added),
+        "removed": len(removed),
+        "groups": StudentGroupSerializer(groups, many=True).data,
+    })
+
+
 @api_view(["GET"])
 @permission_classes([IsAuthenticated])
 def track_students(request):
@@ -450,7 +840,17 @@ def homework_category_list_create(request):
     """
     if request.method == "GET":
         track = request.query_params.get("track", "FULLSTACK")
-        qs = HomeworkCategory.objects.filter(track=track).prefetch_related("submissions__student")
+        # 제출 수는 annotate, 본인 제출은 prefetch → 카테고리 수와 무관하게 쿼리 2회
+        qs = (
+            HomeworkCategory.objects.filter(track=track)
+            .select_related("created_by")
+            .annotate(submission_count=Count("submissions"))
+            .prefetch_related(Prefetch(
+                "submissions",
+                queryset=HomeworkSubmission.objects.filter(student=request.user).select_related("student"),
+                to_attr="my_submissions",
+            ))
+        )
         ser = HomeworkCategorySerializer(qs, many=True, context={"request": request})
         return Response(ser.data)
 
@@ -476,6 +876,57 @@ def homework_category_delete(request, pk):
     return Response(status=status.HTTP_204_NO_CONTENT)
 
 
+@api_view(["GET"])
+@permission_classes([IsInstructorOrStaff])
+def homework_category_submissions(request, pk):
+    """GET /api/sessions/homework-categories/<id>/submissions/  — 카테고리 하나의 전체 제출물 (INSTRUCTOR)"""
+    if not HomeworkCategory.objects.filter(pk=pk).exists():
+        return Response(status=status.HTTP_404_NOT_FOUND)
+    subs = HomeworkSubmission.objects.filter(category_id=pk).select_related("student")
+    return Response(HomeworkSubmissionSerializer(subs, many=True, context={"request": request}).data)
+
+
+def _homework_archive_entries(subs):
+    """제출물 → (압축 안 파일명 `<이름>_<학번>.pdf`, 파일 열기 함수, 제출 시각)"""
+    used = set()
+    for sub in subs:
+        base = f"{sub.student.name}_{sub.student.student_id}".replace("/", "_").replace("\\", "_")
+        name, n = f"{base}.pdf", 1
+        while name in used:
+            n += 1
+            name = f"{base} ({n}).pdf"
+        used.add(name)
+        yield name, partial(sub.pdf_file.storage.open, sub.pdf_file.name, "rb"), timezone.localtime(sub.submitted_at)
+
+
+@api_view(["GET"])
+@permission_classes([IsInstructorOrStaff])
+def homework_category_download(request, pk):
+    """
+    GET /api/sessions/homework-categories/<id>/download.zip  — 카테고리 전체 제출 PDF를 ZIP으로 (INSTRUCTOR)
+    파일을 청크 단위로 읽어 바로 내보내므로 제출물 크기와 무관하게 메모리 사용량 일정 (sessionsapp/archives.py)
+    """
+    try:
+        category = HomeworkCategory.objects.get(pk=pk)
+    except HomeworkCategory.DoesNotExist:
+        return Response(status=status.HTTP_404_NOT_FOUND)
+
+    subs = (
+        HomeworkSubmission.objects.filter(category=category)
+        .select_related("student")
+        .order_by("student__name", "student_id")
+    )
+    response = StreamingHttpResponse(
+        stream_zip(_homework_archive_entries(subs.iterator())), content_type="application/zip"
+    )
+    response["Content-Disposition"] = content_disposition_header(
+        as_attachment=True, filename=f"{category.week}주차_{category.title}.zip"
+    )
+    # nginx가 응답 전체를 임시 파일로 버퍼링하지 않고 바로 전달하도록
+    response["X-Accel-Buffering"] = "no"
+    return response
+
+
 @api_view(["POST"])
 @permission_classes([IsAuthenticated])
 def homework_submit(request, pk):
@@ -10,6 +10,8 @@ export interface Project {
   github_url: string;
   team_members: string;
   thumbnail_url: string | null;
+  // 반응형 변형 ("url 320w, url 640w, ..."), 아직 없으면 null
+  thumbnail_srcset: { webp: string; jpeg: string } | null;
   pdf_url: string | null;
   order: number;
   is_visible: boolean;
@@ -17,10 +19,55 @@ export interface Project {
   updated_at: string;
 }
 
+// 표시 너비(px)에 맞는 썸네일 변형 URL — 그 이상인 가장 작은 WebP, 없으면 가장 큰 것, 변형이 없으면 원본
+export function thumbnailFor(
+  p: Pick<Project, "thumbnail_url" | "thumbnail_srcset">,
+  width: number,
+): string | null {
+  if (!p.thumbnail_srcset) return p.thumbnail_url;
+  const target = width * (window.devicePixelRatio || 1);
+  const candidates = p.thumbnail_srcset.webp.split(",").map((entry) => {
+    const [url, w] = entry.trim().split(" ");
+    return { url, w: parseInt(w, 10) };
+  }).sort((a, b) => a.w - b.w);
+  return (candidates.find((c) => c.w >= target) ?? candidates[candidates.length - 1])?.url ?? p.thumbnail_url;
+}
+
 export function fetchProjects(): Promise<Project[]> {
   return apiFetch<Project[]>("/api/projects/");
 }
 
+// 공개 카드 목록 (상세 설명/PDF는 fetchProject로 따로 조회)
+export interface ProjectCard {
+  id: number;
+  title: string;
+  generation: number;
+  description: string;
+  tech_stack: string[];
+  github_url: string;
+  team_members: string[];
+  thumbnail_url: string | null;
+  thumbnail_srcset: { webp: string; jpeg: string } | null;
+  has_pdf: boolean;
+}
+
+// 기수 단위 페이지: generation 생략 시 가장 최근 기수
+export interface ProjectCardPage {
+  generation: number | null;
+  generations: number[];
+  next_generation: number | null;
+  results: ProjectCard[];
+}
+
+export function fetchProjectCards(generation?: number): Promise<ProjectCardPage> {
+  const g = generation === undefined ? "" : `&generation=${generation}`;
+  return apiFetch<ProjectCardPage>(`/api/projects/?view=cards${g}`);
+}
+
+export function fetchProject(id: number): Promise<Project> {
+  return apiFetch<Project>(`/api/projects/${id}/`);
+}
+
 export function fetchAllProjects(): Promise<Project[]> {
   return apiFetch<Project[]>("/api/projects/?all=true");
 }
@@ -42,3 +42,18 @@ export function updateRoadmapItem(
 export function deleteRoadmapItem(id: number): Promise<void> {
   return apiFetch<void>(`/api/roadmap/admin/${id}/`, { method: "DELETE" });
 }
+
+export type RoadmapLayoutItem = Pick<
+  RoadmapItem,
+  "id" | "half" | "row" | "col_start" | "col_span"
+> & { order?: number };
+
+// 배치 일괄 변경 (빠진 항목은 현재 위치 유지, order 생략 시 기존 값 유지, 겹치면 400)
+export function updateRoadmapLayout(
+  items: RoadmapLayoutItem[]
+): Promise<RoadmapItem[]> {
+  return apiFetch<RoadmapItem[]>("/api/roadmap/admin/layout/", {
+    method: "PUT",
+    body: JSON.stringify({ items }),
+  });
+}
@@ -55,10 +55,24 @@ export interface QnAPostDetail {
   title: string;
   content: string;
   author_name: string;
-  comments: QnAComment[];
+  comment_count: number;
+  comments: QnAComment[]; // 작성순 한 페이지 (50개)
+  comments_next: string | null; // 다음 댓글 페이지 커서
   created_at: string;
 }
 
+// 커서 페이지네이션 응답 (next/previous는 전체 URL)
+export interface CursorPage<T> {
+  next: string | null;
+  previous: string | null;
+  results: T[];
+}
+
+export function cursorOf(link: string | null): string | null {
+  if (!link) return null;
+  return new URL(link, window.location.origin).searchParams.get("cursor");
+}
+
 export interface SubmissionItem {
   id: number;
   student_name: string;
@@ -90,6 +104,40 @@ export interface AnnouncementItem {
   created_at: string;
 }
 
+// ── 증분 동기화 (?since=) ─────────────────
+// 첫 요청은 since="0", 이후에는 응답의 cursor를 그대로 전달
+
+export interface FeedChanges<T> {
+  results: T[];
+  deleted: number[];
+  cursor: string;
+  // since가 서버의 삭제 기록 보존 기간보다 오래됨 → results가 전체 목록
+  reset: boolean;
+}
+
+export type FeedPath = "quizzes" | "qna" | "assignments" | "announcements";
+
+export function fetchFeedChanges<T>(path: FeedPath, track: string, since: string) {
+  return apiFetch<FeedChanges<T>>(
+    `/api/sessions/${path}/?track=${track}&since=${encodeURIComponent(since)}`,
+  );
+}
+
+// 변경분을 기존 목록에 반영 (id 기준 덮어쓰기, 최신순 정렬 유지)
+export function mergeFeedChanges<T extends { id: number; created_at: string }>(
+  items: T[],
+  changes: FeedChanges<T>,
+): T[] {
+  if (changes.reset) {
+    return [...changes.results]
+      .sort((a, b) => b.created_at.localeCompare(a.created_at) || b.id - a.id);
+  }
+  if (changes.results.length === 0 && changes.deleted.length === 0) return items;
+  const removed = new Set([...changes.deleted, ...changes.results.map((r) => r.id)]);
+  return [...changes.results, ...items.filter((item) => !removed.has(item.id))]
+    .sort((a, b) => b.created_at.localeCompare(a.created_at) || b.id - a.id);
+}
+
 // ── Quiz API ─────────────────────────────
 
 export function fetchQuizzes(track: string) {
@@ -124,14 +172,46 @@ export function createQuiz(data: {
   });
 }
 
+// 퀴즈 통계 (INSTRUCTOR) — distribution[i]는 보기 i+1 선택 수
+export interface QuizStatsItem {
+  id: number;
+  title: string;
+  correct_option: number;
+  respondents: number;
+  correct: number;
+  correct_rate: number | null;
+  distribution: number[];
+}
+
+export interface QuizStudentStats {
+  id: number;
+  name: string;
+  answered: number;
+  correct: number;
+  correct_rate: number | null;
+}
+
+export interface QuizStats {
+  track: string;
+  quiz_count: number;
+  quizzes: QuizStatsItem[];
+  students: QuizStudentStats[];
+}
+
+export function fetchQuizStats(track: string) {
+  return apiFetch<QuizStats>(`/api/sessions/quizzes/stats/?track=${track}`);
+}
+
 // ── Q&A API ──────────────────────────────
 
-export function fetchQnAPosts(track: string) {
-  return apiFetch<QnAPostItem[]>(`/api/sessions/qna/?track=${track}`);
+export function fetchQnAPosts(track: string, cursor?: string | null) {
+  const c = cursor ? `&cursor=${encodeURIComponent(cursor)}` : "";
+  return apiFetch<CursorPage<QnAPostItem>>(`/api/sessions/qna/?track=${track}${c}`);
 }
 
-export function fetchQnADetail(id: number) {
-  return apiFetch<QnAPostDetail>(`/api/sessions/qna/${id}/`);
+export function fetchQnADetail(id: number, commentsCursor?: string | null) {
+  const c = commentsCursor ? `?cursor=${encodeURIComponent(commentsCursor)}` : "";
+  return apiFetch<QnAPostDetail>(`/api/sessions/qna/${id}/${c}`);
 }
 
 export function createQnAPost(data: { track: string; title: string; content: string }) {
@@ -243,6 +323,31 @@ export function markAttendance(sessionId: number, studentId: number, status: Att
   });
 }
 
+// 학생 × 세션 출석 현황 (셀 값은 codes 기준 숫자, 기록 없으면 null)
+export interface AttendanceMatrix {
+  track: string;
+  codes: Record<string, AttendanceStatus>;
+  stat_fields: string[];
+  sessions: [number, string, string][];
+  students: [number, string, string][];
+  matrix: (number | null)[][];
+  stats: [number, number, number, number | null][];
+}
+
+export function fetchAttendanceMatrix(track: string) {
+  return apiFetch<AttendanceMatrix>(`/api/sessions/attendance/matrix/?track=${track}`);
+}
+
+export function markAttendanceBulk(
+  sessionId: number,
+  data: { records?: { student_id: number; status: AttendanceStatus }[]; default_status?: AttendanceStatus },
+) {
+  return apiFetch<AttendanceSessionDetail>(`/api/sessions/attendance/${sessionId}/mark-bulk/`, {
+    method: "POST",
+    body: JSON.stringify(data),
+  });
+}
+
 // ── Groups API ────────────────────────────
 
 export interface StudentItem {
@@ -337,7 +442,6 @@ export interface HomeworkCategoryItem {
   created_by_name: string;
   created_at: string;
   submission_count: number;
-  submissions: HomeworkSubmissionItem[];
   my_submission: HomeworkSubmissionItem | null;
 }
 
@@ -345,6 +449,16 @@ export function fetchHomeworkCategories(track: string) {
   return apiFetch<HomeworkCategoryItem[]>(`/api/sessions/homework-categories/?track=${track}`);
 }
 
+// INSTRUCTOR: 카테고리 하나의 전체 제출물 (펼칠 때 불러옴)
+export function fetchHomeworkSubmissions(categoryId: number) {
+  return apiFetch<HomeworkSubmissionItem[]>(`/api/sessions/homework-categories/${categoryId}/submissions/`);
+}
+
+// 카테고리 전체 제출 PDF ZIP (INSTRUCTOR) — 링크로 직접 내려받음
+export function homeworkZipUrl(categoryId: number) {
+  return `/api/sessions/homework-categories/${categoryId}/download.zip`;
+}
+
 export function createHomeworkCategory(data: { track: string; title: string; week: number }) {
   return apiFetch<HomeworkCategoryItem>("/api/sessions/homework-categories/", {
     method: "POST",
@@ -4,6 +4,7 @@ import {
   createRoadmapItem,
   updateRoadmapItem,
   deleteRoadmapItem,
+  updateRoadmapLayout,
 } from "../api/roadmap";
 import type { RoadmapItem } from "../api/roadmap";
 import "./AdminRoadmap.css";
@@ -75,6 +76,32 @@ export default function AdminRoadmap() {
     }
   };
 
+  // 같은 half+row 안에서 시작 열 순서대로 order를 다시 매겨 한 번에 저장
+  const handleNormalizeOrder = async () => {
+    const sorted = [...items].sort(
+      (a, b) =>
+        a.half.localeCompare(b.half) || a.row - b.row || a.col_start - b.col_start
+    );
+    const counters: Record<string, number> = {};
+    const layout = sorted.map((item) => {
+      const key = `${item.half}-${item.row}`;
+      counters[key] = (counters[key] ?? -1) + 1;
+      return {
+        id: item.id,
+        half: item.half,
+        row: item.row,
+        col_start: item.col_start,
+        col_span: item.col_span,
+        order: counters[key],
+      };
+    });
+    try {
+      setItems(await updateRoadmapLayout(layout));
+    } catch {
+      alert("배치 저장에 실패했습니다. 겹치는 항목이 있는지 확인하세요.");
+    }
+  };
+
   const handleCancel = () => {
     setForm(EMPTY_FORM);
     setEditId(null);
@@ -275,6 +302,9 @@ export default function AdminRoadmap() {
         {/* 테이블 */}
         <div className="roadmap-table-section">
           <h3>항목 목록</h3>
+          <button className="rt-edit-btn" type="button" onClick={handleNormalizeOrder}>
+            열 순서대로 정렬 저장
+          </button>
           <table className="roadmap-table">
             <thead>
               <tr>
@@ -1,17 +1,17 @@
 import { useState, useEffect, useCallback } from "react";
 import {
   TRACK_TO_DB,
-  fetchQuizzes, createQuiz,
-  fetchQnAPosts, fetchQnADetail, createQnAComment,
+  fetchQuizzes, createQuiz, fetchQuizStats,
+  fetchQnAPosts, fetchQnADetail, cursorOf, createQnAComment,
   fetchAssignments, fetchAssignmentDetail, createAssignment,
   markSubmissionRead,
   fetchAnnouncements, createAnnouncement,
-  fetchAttendanceSessions, createAttendanceSession, fetchAttendanceSessionDetail, markAttendance,
+  fetchAttendanceSessions, createAttendanceSession, fetchAttendanceSessionDetail, markAttendance, markAttendanceBulk, fetchAttendanceMatrix,
   fetchGroups, createGroup, deleteGroup, updateGroupMembers, fetchTrackStudents, fetchClassReviews,
   fetchHomeworkCategories, createHomeworkCategory, deleteHomeworkCategory,
-  type QuizItem, type QnAPostItem, type QnAPostDetail,
+  type QuizItem, type QuizStats, type QnAPostItem, type QnAPostDetail,
   type AssignmentItem, type SubmissionItem, type AnnouncementItem,
-  type AttendanceSessionItem, type AttendanceSessionDetail, type AttendanceStatus,
+  type AttendanceSessionItem, type AttendanceSessionDetail, type AttendanceStatus, type AttendanceMatrix,
   type GroupItem, type StudentItem, type ClassReviewItem,
   type HomeworkCategoryItem,
 } from "../api/sessions";
@@ -70,7 +70,9 @@ function QuizQnAAdmin({ trackLabel }: { trackLabel: string }) {
   const dbTrack = TRACK_TO_DB[trackLabel];
 
   const [quizzes, setQuizzes] = useState<QuizItem[]>([]);
+  const [quizStats, setQuizStats] = useState<QuizStats | null>(null);
   const [qnaPosts, setQnaPosts] = useState<QnAPostItem[]>([]);
+  const [qnaNext, setQnaNext] = useState<string | null>(null);
   const [selectedPost, setSelectedPost] = useState<QnAPostDetail | null>(null);
   const [commentText, setCommentText] = useState("");
 
@@ -83,7 +85,11 @@ function QuizQnAAdmin({ trackLabel }: { trackLabel: string }) {
 
   const loadData = useCallback(() => {
     fetchQuizzes(dbTrack).then(setQuizzes).catch(() => {});
-    fetchQnAPosts(dbTrack).then(setQnaPosts).catch(() => {});
+    fetchQuizStats(dbTrack).then(setQuizStats).catch(() => {});
+    fetchQnAPosts(dbTrack).then((page) => {
+      setQnaPosts(page.results);
+      setQnaNext(cursorOf(page.next));
+    }).catch(() => {});
   }, [dbTrack]);
 
   useEffect(() => { loadData(); }, [loadData]);
@@ -111,6 +117,19 @@ function QuizQnAAdmin({ trackLabel }: { trackLabel: string }) {
     setCommentText("");
   };
 
+  const handleMorePosts = async () => {
+    if (!qnaNext) return;
+    const page = await fetchQnAPosts(dbTrack, qnaNext);
+    setQnaPosts((prev) => [...prev, ...page.results]);
+    setQnaNext(cursorOf(page.next));
+  };
+
+  const handleMoreComments = async () => {
+    if (!selectedPost?.comments_next) return;
+    const more = await fetchQnADetail(selectedPost.id, selectedPost.comments_next);
+    setSelectedPost({ ...more, comments: [...selectedPost.comments, ...more.comments] });
+  };
+
   return (
     <div className="admin-section">
       {/* 퀴즈 출제 */}
@@ -141,23 +160,49 @@ function QuizQnAAdmin({ trackLabel }: { trackLabel: string }) {
       <div className="admin-card">
         <h3>퀴즈 목록 ({quizzes.length})</h3>
         <table className="admin-table">
-          <thead><tr><th>제목</th><th>정답</th><th>출제일</th></tr></thead>
+          <thead><tr><th>제목</th><th>정답</th><th>응답</th><th>정답률</th><th>보기별 선택 (1~5)</th><th>출제일</th></tr></thead>
           <tbody>
-            {quizzes.map((q) => (
-              <tr key={q.id}>
-                <td>{q.title}</td>
-                <td>{q.correct_option}번</td>
-                <td>{new Date(q.created_at).toLocaleDateString()}</td>
-              </tr>
-            ))}
-            {quizzes.length === 0 && <tr><td colSpan={3} className="empty-text">퀴즈가 없습니다.</td></tr>}
+            {quizzes.map((q) => {
+              const st = quizStats?.quizzes.find((x) => x.id === q.id);
+              return (
+                <tr key={q.id}>
+                  <td>{q.title}</td>
+                  <td>{q.correct_option}번</td>
+                  <td>{st?.respondents ?? "-"}</td>
+                  <td>{st?.correct_rate == null ? "-" : `${st.correct_rate}%`}</td>
+                  <td>{st ? st.distribution.join(" / ") : "-"}</td>
+                  <td>{new Date(q.created_at).toLocaleDateString()}</td>
+                </tr>
+              );
+            })}
+            {quizzes.length === 0 && <tr><td colSpan={6} className="empty-text">퀴즈가 없습니다.</td></tr>}
           </tbody>
         </table>
       </div>
 
+      {/* 학생별 퀴즈 현황 */}
+      {quizStats && quizStats.students.length > 0 && (
+        <div className="admin-card">
+          <h3>학생별 퀴즈 현황 (전체 {quizStats.quiz_count}문항)</h3>
+          <table className="admin-table">
+            <thead><tr><th>이름</th><th>응답</th><th>정답</th><th>정답률</th></tr></thead>
+            <tbody>
+              {quizStats.students.map((s) => (
+                <tr key={s.id}>
+                  <td>{s.name}</td>
+                  <td>{s.answered}</td>
+                  <td>{s.correct}</td>
+                  <td>{s.correct_rate === null ? "-" : `${s.correct_rate}%`}</td>
+                </tr>
+              ))}
+            </tbody>
+          </table>
+        </div>
+      )}
+
       {/* Q&A 목록 */}
       <div className="admin-card">
-        <h3>Q&A 게시판 ({qnaPosts.length})</h3>
+        <h3>Q&A 게시판</h3>
         <table className="admin-table">
           <thead><tr><th>작성자</th><th>제목</th><th>답변</th><th>날짜</th></tr></thead>
           <tbody>
@@ -172,6 +217,7 @@ function QuizQnAAdmin({ trackLabel }: { trackLabel: string }) {
             {qnaPosts.length === 0 && <tr><td colSpan={4} className="empty-text">게시글이 없습니다.</td></tr>}
           </tbody>
         </table>
+        {qnaNext && <button className="admin-btn" onClick={handleMorePosts}>더 보기</button>}
       </div>
 
       {/* Q&A 상세 + 답변 */}
@@ -184,13 +230,16 @@ function QuizQnAAdmin({ trackLabel }: { trackLabel: string }) {
           <p className="post-meta">{selectedPost.author_name} | {new Date(selectedPost.created_at).toLocaleDateString()}</p>
           <div className="post-content">{selectedPost.content}</div>
           <div className="comments-list">
-            <h4>답변 ({selectedPost.comments.length})</h4>
+            <h4>답변 ({selectedPost.comment_count})</h4>
             {selectedPost.comments.map((c) => (
               <div key={c.id} className={`admin-comment ${c.author_role === "INSTRUCTOR" ? "instructor" : ""}`}>
                 <span className="comment-name">{c.author_name} {c.author_role === "INSTRUCTOR" && "(교육자)"}</span>
                 <p>{c.content}</p>
               </div>
             ))}
+            {selectedPost.comments_next && (
+              <button className="admin-btn" onClick={handleMoreComments}>답변 더 보기</button>
+            )}
           </div>
           <div className="admin-reply">
             <textarea value={commentText} onChange={(e) => setCommentText(e.target.value)} placeholder="답변을 입력하세요..." />
@@ -363,11 +412,17 @@ function AttendanceAdmin({ trackLabel }: { trackLabel: string }) {
   const [sessions, setSessions] = useState<AttendanceSessionItem[]>([]);
   const [selectedSession, setSelectedSession] = useState<AttendanceSessionDetail | null>(null);
   const [createForm, setCreateForm] = useState({ title: "", date: "" });
+  const [matrix, setMatrix] = useState<AttendanceMatrix | null>(null);
 
   const loadSessions = useCallback(() => {
     fetchAttendanceSessions(dbTrack).then(setSessions).catch(() => {});
   }, [dbTrack]);
 
+  const handleToggleMatrix = async () => {
+    if (matrix) { setMatrix(null); return; }
+    setMatrix(await fetchAttendanceMatrix(dbTrack));
+  };
+
   useEffect(() => { loadSessions(); }, [loadSessions]);
 
   const handleCreateSession = async () => {
@@ -391,6 +446,16 @@ function AttendanceAdmin({ trackLabel }: { trackLabel: string }) {
     setSelectedSession(detail);
   };
 
+  // 지각으로 표시된 학생은 그대로 두고 나머지 전원 출석 처리
+  const handleMarkAllPresent = async () => {
+    if (!selectedSession) return;
+    const records = selectedSession.records
+      .filter((r) => r.status === "LATE")
+      .map((r) => ({ student_id: r.student_id, status: r.status }));
+    const detail = await markAttendanceBulk(selectedSession.id, { records, default_status: "PRESENT" });
+    setSelectedSession(detail);
+  };
+
   const statusLabel: Record<AttendanceStatus, string> = {
     PRESENT: "출석",
     ABSENT: "결석",
@@ -454,8 +519,54 @@ function AttendanceAdmin({ trackLabel }: { trackLabel: string }) {
             )}
           </tbody>
         </table>
+        <button className="admin-btn small" style={{ marginTop: 12 }} onClick={handleToggleMatrix}>
+          {matrix ? "전체 현황 닫기" : "전체 출석 현황"}
+        </button>
       </div>
 
+      {/* 트랙 전체 출석 현황 */}
+      {matrix && (
+        <div className="admin-card">
+          <h3>전체 출석 현황</h3>
+          <div style={{ overflowX: "auto" }}>
+            <table className="admin-table">
+              <thead>
+                <tr>
+                  <th>이름</th>
+                  {matrix.sessions.map(([id, title, date]) => (
+                    <th key={id} title={title}>{date.slice(5)}</th>
+                  ))}
+                  <th>출석</th><th>지각</th><th>결석</th><th>출석률</th>
+                </tr>
+              </thead>
+              <tbody>
+                {matrix.students.map(([id, name], i) => {
+                  const [present, late, absent, rate] = matrix.stats[i];
+                  return (
+                    <tr key={id}>
+                      <td>{name}</td>
+                      {matrix.matrix[i].map((code, j) => {
+                        const st = code === null ? null : matrix.codes[String(code)];
+                        return (
+                          <td key={matrix.sessions[j][0]}>
+                            {st ? <span className={`att-badge ${statusClass[st]}`}>{statusLabel[st]}</span> : "-"}
+                          </td>
+                        );
+                      })}
+                      <td>{present}</td><td>{late}</td><td>{absent}</td>
+                      <td>{rate === null ? "-" : `${rate}%`}</td>
+                    </tr>
+                  );
+                })}
+                {matrix.students.length === 0 && (
+                  <tr><td colSpan={matrix.sessions.length + 5} className="empty-text">출석 기록이 없습니다.</td></tr>
+                )}
+              </tbody>
+            </table>
+          </div>
+        </div>
+      )}
+
       {/* 출석부 상세 */}
       {selectedSession && (
         <div className="admin-card highlight">
@@ -466,6 +577,9 @@ function AttendanceAdmin({ trackLabel }: { trackLabel: string }) {
           <p className="post-meta">
             출석 {presentCount} / 지각 {lateCount} / 전체 {totalCount}
           </p>
+          <button className="admin-btn small" onClick={handleMarkAllPresent} disabled={totalCount === 0}>
+            지각 제외 전원 출석
+          </button>
           <table className="admin-table">
             <thead>
               <tr><th>이름</th><th>상태</th><th>변경</th></tr>
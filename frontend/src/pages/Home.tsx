@@ -1,9 +1,9 @@
-import { useEffect, useMemo, useState } from "react";
+import { useCallback, useEffect, useMemo, useState } from "react";
 import { useNavigate } from "react-router-dom";
 import { useAuth } from "../auth/useAuth";
 import { apiFetch } from "../api/client";
-import { fetchProjects } from "../api/projects";
-import type { Project } from "../api/projects";
+import { fetchProjectCards, fetchProject, thumbnailFor } from "../api/projects";
+import type { Project, ProjectCard } from "../api/projects";
 import { fetchRoadmapItems } from "../api/roadmap";
 import type { RoadmapItem } from "../api/roadmap";
 import { sanitizeUrl } from "../utils/sanitizeUrl";
@@ -235,17 +235,49 @@ export default function Home() {
   }, []);
 
   // ✅ Projects 섹션 상태
-  const [projects, setProjects] = useState<Project[]>([]);
+  const [projects, setProjects] = useState<ProjectCard[]>([]);
+  const [projGenerations, setProjGenerations] = useState<number[]>([]);
+  const [projGeneration, setProjGeneration] = useState<number | null>(null);
   const [projIdx, setProjIdx] = useState(0);
   const [pdfModal, setPdfModal] = useState<string | null>(null);
   const [activeDetail, setActiveDetail] = useState<string | null>(null);
-
-  useEffect(() => {
-    fetchProjects().then((data) => {
-      setProjects(data);
+  // 상세 설명/PDF 주소는 필요할 때만 조회 (프로젝트 id → 상세)
+  const [projDetails, setProjDetails] = useState<Record<number, Project>>({});
+
+  const loadProjectCards = useCallback((generation?: number) => {
+    fetchProjectCards(generation).then((page) => {
+      setProjects(page.results);
+      setProjGenerations(page.generations);
+      setProjGeneration(page.generation);
+      setProjIdx(0);
+      setActiveDetail(null);
     }).catch(() => {});
   }, []);
 
+  useEffect(() => { loadProjectCards(); }, [loadProjectCards]);
+
+  const loadProjectDetail = async (id: number): Promise<Project | null> => {
+    if (projDetails[id]) return projDetails[id];
+    try {
+      const detail = await fetchProject(id);
+      setProjDetails((prev) => ({ ...prev, [id]: detail }));
+      return detail;
+    } catch {
+      return null;
+    }
+  };
+
+  const handleShowDetail = () => {
+    if (activeDetail === "detail") { setActiveDetail(null); return; }
+    setActiveDetail("detail");
+    if (centerProj) loadProjectDetail(centerProj.id);
+  };
+
+  const handleOpenPdf = async (id: number) => {
+    const detail = await loadProjectDetail(id);
+    if (detail?.pdf_url) setPdfModal(detail.pdf_url);
+  };
+
   const projPrev = () => {
     if (projects.length === 0) return;
     setProjIdx((i) => (i - 1 + projects.length) % projects.length);
@@ -256,7 +288,7 @@ export default function Home() {
     setProjIdx((i) => (i + 1) % projects.length);
     setActiveDetail(null);
   };
-  const getProj = (offset: number): Project | null => {
+  const getProj = (offset: number): ProjectCard | null => {
     if (projects.length === 0) return null;
     return projects[(projIdx + offset + projects.length) % projects.length];
   };
@@ -524,6 +556,21 @@ export default function Home() {
             비전공자 아기사자들도 멋사와 함께 만든 결과물입니다.
           </div>
 
+          {projGenerations.length > 1 && (
+            <div className="projects-pill-col" style={{ flexDirection: "row", justifyContent: "center", marginBottom: 16 }}>
+              {projGenerations.map((g) => (
+                <button
+                  key={g}
+                  className={`pill-btn ${g === projGeneration ? "active" : ""}`}
+                  type="button"
+                  onClick={() => loadProjectCards(g)}
+                >
+                  {g}기
+                </button>
+              ))}
+            </div>
+          )}
+
           {projects.length > 0 ? (
             <>
               <div className="projects-stage">
@@ -540,21 +587,23 @@ export default function Home() {
                       offset === 1 ? "proj-card right2" :
                       offset === -2 ? "proj-card side left" :
                       "proj-card side right";
+                    // 카드 너비(.proj-card 520px / main 560px)에 맞는 변형 사용
+                    const thumb = thumbnailFor(p, offset === 0 ? 560 : 520);
                     return (
                       <div
                         key={`${p.id}-${offset}`}
                         className={cls}
-                        style={p.thumbnail_url ? {
-                          backgroundImage: `url(${p.thumbnail_url})`,
+                        style={thumb ? {
+                          backgroundImage: `url(${thumb})`,
                           backgroundSize: "cover",
                           backgroundPosition: "center",
                         } : undefined}
                       >
-                        {offset === 0 && p.pdf_url && (
+                        {offset === 0 && p.has_pdf && (
                           <button
                             className="proj-pdf-btn"
                             type="button"
-                            onClick={() => setPdfModal(p.pdf_url)}
+                            onClick={() => handleOpenPdf(p.id)}
                           >
                             PDF 보기
                           </button>
@@ -585,7 +634,7 @@ export default function Home() {
                   <button
                     className={`pill-btn ${activeDetail === "detail" ? "active" : ""}`}
                     type="button"
-                    onClick={() => setActiveDetail(activeDetail === "detail" ? null : "detail")}
+                    onClick={handleShowDetail}
                   >
                     서비스 상세 설명
                   </button>
@@ -608,22 +657,22 @@ export default function Home() {
                 </div>
 
                 <div className="projects-right">
-                  {activeDetail === "tech" && centerProj?.tech_stack && (
+                  {activeDetail === "tech" && centerProj && centerProj.tech_stack.length > 0 && (
                     <div className="hash-row">
-                      {centerProj.tech_stack.split(",").map((t) => `#${t.trim()}`).join(" ")}
+                      {centerProj.tech_stack.map((t) => `#${t}`).join(" ")}
                     </div>
                   )}
-                  {activeDetail === "detail" && centerProj?.detail && (
-                    <div className="detail-text">{centerProj.detail}</div>
+                  {activeDetail === "detail" && centerProj && projDetails[centerProj.id]?.detail && (
+                    <div className="detail-text">{projDetails[centerProj.id].detail}</div>
                   )}
-                  {activeDetail === "team" && centerProj?.team_members && (
+                  {activeDetail === "team" && centerProj && centerProj.team_members.length > 0 && (
                     <div className="hash-row">
-                      {centerProj.team_members.split(",").map((m) => m.trim()).join(" · ")}
+                      {centerProj.team_members.join(" · ")}
                     </div>
                   )}
-                  {!activeDetail && centerProj?.tech_stack && (
+                  {!activeDetail && centerProj && centerProj.tech_stack.length > 0 && (
                     <div className="hash-row">
-                      {centerProj.tech_stack.split(",").map((t) => `#${t.trim()}`).join(" ")}
+                      {centerProj.tech_stack.map((t) => `#${t}`).join(" ")}
                     </div>
                   )}
                 </div>
@@ -4,23 +4,25 @@ import { sanitizeUrl } from "../utils/sanitizeUrl";
 import {
   TRACK_TO_DB,
   fetchQuizzes, submitQuizAnswer, createQuiz,
-  fetchQnAPosts, fetchQnADetail, createQnAPost, createQnAComment,
+  fetchQnAPosts, fetchQnADetail, cursorOf, createQnAPost, createQnAComment,
   fetchAssignments, fetchAssignmentDetail, submitAssignment, createAssignment, markSubmissionRead,
-  fetchAnnouncements, createAnnouncement,
+  createAnnouncement, fetchFeedChanges, mergeFeedChanges,
   fetchGroups, fetchClassReviews, createClassReview, deleteClassReview,
-  fetchHomeworkCategories, deleteHomeworkCategory,
+  fetchHomeworkCategories, fetchHomeworkSubmissions, homeworkZipUrl, deleteHomeworkCategory,
   submitHomeworkPdf, deleteHomeworkSubmission,
   type QuizItem, type QuizAnswerResult,
   type QnAPostItem, type QnAPostDetail,
   type AssignmentItem, type SubmissionItem,
   type AnnouncementItem,
   type GroupItem, type ClassReviewItem,
-  type HomeworkCategoryItem,
+  type HomeworkCategoryItem, type HomeworkSubmissionItem,
 } from "../api/sessions";
 import "./Session.css";
 
 type MainTab = "fullstack" | "ai" | "planning";
 
+const FEED_POLL_INTERVAL_MS = 30_000;
+
 export default function Session() {
   const { me } = useAuth();
   const [mainTab, setMainTab] = useState<MainTab>("fullstack");
@@ -97,6 +99,7 @@ function QuizQnATab({ trackLabel, desc, role }: { trackLabel: string; desc: stri
 
   const [quizzes, setQuizzes] = useState<QuizItem[]>([]);
   const [qnaPosts, setQnaPosts] = useState<QnAPostItem[]>([]);
+  const [qnaNext, setQnaNext] = useState<string | null>(null);
   const [selectedQuiz, setSelectedQuiz] = useState<QuizItem | null>(null);
   const [selectedOption, setSelectedOption] = useState<number>(0);
   const [answerResult, setAnswerResult] = useState<QuizAnswerResult | null>(null);
@@ -113,15 +116,26 @@ function QuizQnATab({ trackLabel, desc, role }: { trackLabel: string; desc: stri
   // 과제 갤러리
   const [hwCategories, setHwCategories] = useState<HomeworkCategoryItem[]>([]);
   const [hwUploadCategoryId, setHwUploadCategoryId] = useState<number | null>(null);
+  // INSTRUCTOR: 펼친 카테고리의 제출물 (카테고리 id → 목록)
+  const [hwSubmissions, setHwSubmissions] = useState<Record<number, HomeworkSubmissionItem[]>>({});
 
   const loadData = useCallback(() => {
     fetchQuizzes(dbTrack).then(setQuizzes).catch(() => {});
-    fetchQnAPosts(dbTrack).then(setQnaPosts).catch(() => {});
+    fetchQnAPosts(dbTrack).then((page) => {
+      setQnaPosts(page.results);
+      setQnaNext(cursorOf(page.next));
+    }).catch(() => {});
     fetchGroups(dbTrack).then(setGroups).catch(() => {});
     fetchClassReviews(dbTrack).then(setClassReviews).catch(() => {});
     fetchHomeworkCategories(dbTrack).then(setHwCategories).catch(() => {});
+    setHwSubmissions({});
   }, [dbTrack]);
 
+  const handleLoadHwSubmissions = async (categoryId: number) => {
+    const subs = await fetchHomeworkSubmissions(categoryId);
+    setHwSubmissions((prev) => ({ ...prev, [categoryId]: subs }));
+  };
+
   useEffect(() => { loadData(); }, [loadData]);
 
   const handleQuizSubmit = async () => {
@@ -148,6 +162,19 @@ function QuizQnATab({ trackLabel, desc, role }: { trackLabel: string; desc: stri
     setCommentText("");
   };
 
+  const handleMorePosts = async () => {
+    if (!qnaNext) return;
+    const page = await fetchQnAPosts(dbTrack, qnaNext);
+    setQnaPosts((prev) => [...prev, ...page.results]);
+    setQnaNext(cursorOf(page.next));
+  };
+
+  const handleMoreComments = async () => {
+    if (!selectedPost?.comments_next) return;
+    const more = await fetchQnADetail(selectedPost.id, selectedPost.comments_next);
+    setSelectedPost({ ...more, comments: [...selectedPost.comments, ...more.comments] });
+  };
+
   return (
     <div className="fullstack-tab">
       <p className="session-desc">{desc}</p>
@@ -210,6 +237,7 @@ function QuizQnATab({ trackLabel, desc, role }: { trackLabel: string; desc: stri
               ))}
             </tbody>
           </table>
+          {qnaNext && <button className="small-btn" onClick={handleMorePosts}>더 보기</button>}
         </div>
       </div>
 
@@ -252,7 +280,7 @@ function QuizQnATab({ trackLabel, desc, role }: { trackLabel: string; desc: stri
           <p className="modal-author">{selectedPost.author_name} | {new Date(selectedPost.created_at).toLocaleDateString()}</p>
           <div className="modal-content-body">{selectedPost.content}</div>
           <div className="comments-section">
-            <h3>답변 ({selectedPost.comments.length})</h3>
+            <h3>답변 ({selectedPost.comment_count})</h3>
             {selectedPost.comments.map((c) => (
               <div key={c.id} className={`comment-item ${c.author_role === "INSTRUCTOR" ? "instructor" : ""}`}>
                 <div className="comment-header">
@@ -263,6 +291,9 @@ function QuizQnATab({ trackLabel, desc, role }: { trackLabel: string; desc: stri
                 <p>{c.content}</p>
               </div>
             ))}
+            {selectedPost.comments_next && (
+              <button className="small-btn" onClick={handleMoreComments}>답변 더 보기</button>
+            )}
             <div className="comment-form">
               <textarea
                 value={commentText}
@@ -344,7 +375,7 @@ function QuizQnATab({ trackLabel, desc, role }: { trackLabel: string; desc: stri
 
               <div className="gallery-grid" style={{ marginTop: 12 }}>
                 {/* 학생 제출물 카드 */}
-                {(isInstructor ? cat.submissions : cat.my_submission ? [cat.my_submission] : []).map((sub) => (
+                {(isInstructor ? hwSubmissions[cat.id] ?? [] : cat.my_submission ? [cat.my_submission] : []).map((sub) => (
                   <div key={sub.id} className="gallery-card">
                     <a href={sub.pdf_url} target="_blank" rel="noreferrer" className="gallery-thumbnail pdf-thumbnail">
                       <span className="pdf-icon">PDF</span>
@@ -380,9 +411,19 @@ function QuizQnATab({ trackLabel, desc, role }: { trackLabel: string; desc: stri
                   </div>
                 )}
 
-                {isInstructor && cat.submissions.length === 0 && (
+                {isInstructor && cat.submission_count === 0 && (
                   <p className="empty-text" style={{ gridColumn: "1/-1" }}>아직 제출한 학생이 없습니다.</p>
                 )}
+                {isInstructor && cat.submission_count > 0 && !hwSubmissions[cat.id] && (
+                  <button className="small-btn" onClick={() => handleLoadHwSubmissions(cat.id)}>
+                    제출물 보기
+                  </button>
+                )}
+                {isInstructor && cat.submission_count > 0 && (
+                  <a className="small-btn" href={homeworkZipUrl(cat.id)} download>
+                    전체 PDF 다운로드 (ZIP)
+                  </a>
+                )}
               </div>
             </div>
           ))
@@ -483,13 +524,45 @@ function AssignmentTab({
   const [showAssignCreate, setShowAssignCreate] = useState(false);
   const [showAnnounceCreate, setShowAnnounceCreate] = useState(false);
 
+  // 마지막 동기화 cursor (null이면 아직 전체 목록을 받지 않음)
+  const syncCursor = useRef<{ assignments: string | null; announcements: string | null }>({
+    assignments: null, announcements: null,
+  });
+
   const loadData = useCallback(() => {
-    fetchAssignments(dbTrack).then(setAssignments).catch(() => {});
-    fetchAnnouncements(dbTrack).then(setAnnouncements).catch(() => {});
+    syncCursor.current = { assignments: null, announcements: null };
+    fetchFeedChanges<AssignmentItem>("assignments", dbTrack, "0").then((c) => {
+      setAssignments(c.results);
+      syncCursor.current.assignments = c.cursor;
+    }).catch(() => {});
+    fetchFeedChanges<AnnouncementItem>("announcements", dbTrack, "0").then((c) => {
+      setAnnouncements(c.results);
+      syncCursor.current.announcements = c.cursor;
+    }).catch(() => {});
   }, [dbTrack]);
 
   useEffect(() => { loadData(); }, [loadData]);
 
+  // 수업 중 변경분만 주기적으로 반영 (변경 없으면 빈 응답)
+  useEffect(() => {
+    const timer = setInterval(() => {
+      const { assignments: aCursor, announcements: nCursor } = syncCursor.current;
+      if (aCursor) {
+        fetchFeedChanges<AssignmentItem>("assignments", dbTrack, aCursor).then((c) => {
+          setAssignments((prev) => mergeFeedChanges(prev, c));
+          syncCursor.current.assignments = c.cursor;
+        }).catch(() => {});
+      }
+      if (nCursor) {
+        fetchFeedChanges<AnnouncementItem>("announcements", dbTrack, nCursor).then((c) => {
+          setAnnouncements((prev) => mergeFeedChanges(prev, c));
+          syncCursor.current.announcements = c.cursor;
+        }).catch(() => {});
+      }
+    }, FEED_POLL_INTERVAL_MS);
+    return () => clearInterval(timer);
+  }, [dbTrack]);
+
   const latestAssignment = assignments[0] || null;
 
   const handleSubmitLink = async () => {